@@ -0,0 +1,423 @@
+"""
+Module to time each of the phases of scanning Markdown documents, so that the
+results for one version of the project can be compared against the results
+for another version.
+
+The phases that are timed separately are:
+
+- the block pass of the parser
+- the coalescing of text blocks
+- the inline pass of the parser
+- the next_token and next_line (or next_lines) functions of each enabled plugin
+- the rendering of the tokens as HTML
+
+Each phase is timed over a set of generated stress documents and over the
+Markdown documents bundled with the project.  The results are written as JSON
+and, if a baseline file from a previous run is supplied, any timing that is
+slower than the baseline by more than the threshold is reported.
+
+Usage:
+    python perf/benchmark_suite.py [--repeat N] [--scale N] [--output FILE]
+                                   [--baseline FILE] [--threshold RATIO]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+from perf_helper import (
+    PROJECT_DIRECTORY,
+    collect_markdown_documents,
+    create_plugin_manager,
+    create_tokenizer,
+)
+
+BENCHMARK_FORMAT_VERSION = 1
+
+BUNDLED_CORPUS_PATHS = ["readme.md", "docs", "test/resources/rules"]
+
+
+def generate_nested_lists(scale):
+    """
+    Generate a document with lists nested as deeply as the scale.
+    """
+    document_lines = []
+    for item_index in range(scale):
+        for depth_index in range(scale):
+            document_lines.append(
+                f"{'  ' * depth_index}- item {item_index} at depth {depth_index}"
+            )
+        document_lines.append("")
+    return "\n".join(document_lines)
+
+
+def generate_nested_block_quotes(scale):
+    """
+    Generate a document with block quotes nested as deeply as the scale, each
+    followed by a block quote containing nested lists.
+    """
+    document_lines = []
+    for item_index in range(scale):
+        for depth_index in range(1, scale + 1):
+            document_lines.append(f"{'> ' * depth_index}quote {item_index} text")
+        document_lines.extend(
+            ["", f"> - list item {item_index}", ">   - nested list item", ""]
+        )
+    return "\n".join(document_lines)
+
+
+def generate_link_table(scale):
+    """
+    Generate a document with a large table of inline, full and collapsed
+    links, followed by the link reference definitions that they refer to.
+    """
+    document_lines = ["| Inline | Full | Collapsed |", "| -- | -- | -- |"]
+    for row_index in range(scale * scale):
+        document_lines.append(
+            f"| [inline {row_index}](/inline/{row_index} 'title') "
+            + f"| [full {row_index}][ref{row_index}] "
+            + f"| [ref{row_index}][] |"
+        )
+    document_lines.append("")
+    for row_index in range(scale * scale):
+        document_lines.append(f"[ref{row_index}]: /reference/{row_index}")
+    return "\n".join(document_lines)
+
+
+def generate_emphasis_runs(scale):
+    """
+    Generate a document with long runs of matched and unmatched emphasis.
+    """
+    document_lines = []
+    for _ in range(scale):
+        document_lines.append(
+            " ".join(f"*a **b {x}** c* _d_" for x in range(scale * 2))
+        )
+        document_lines.append("*" * (scale * 4) + " text " + "_" * (scale * 4))
+        document_lines.append("")
+    return "\n".join(document_lines)
+
+
+def collect_corpora(scale):
+    """
+    Collect the named sets of documents to time.
+    """
+    return {
+        "stress-nested-lists": [generate_nested_lists(scale)],
+        "stress-nested-block-quotes": [generate_nested_block_quotes(scale)],
+        "stress-link-table": [generate_link_table(scale)],
+        "stress-emphasis-runs": [generate_emphasis_runs(scale)],
+        "bundled": collect_markdown_documents(
+            [os.path.join(PROJECT_DIRECTORY, x) for x in BUNDLED_CORPUS_PATHS]
+        ),
+    }
+
+
+class BenchmarkRunner:
+    """
+    Class to time each of the phases of scanning for a set of documents.
+    """
+
+    def __init__(self):
+
+        # pylint: disable=import-outside-toplevel
+        from pymarkdown.coalesce_processor import CoalesceProcessor
+        from pymarkdown.inline_processor import InlineProcessor
+        from pymarkdown.link_helper import LinkHelper
+        from pymarkdown.source_providers import InMemorySourceProvider
+        from pymarkdown.transform_to_gfm import TransformToGfm
+
+        # pylint: enable=import-outside-toplevel
+
+        (
+            self.__coalesce_processor,
+            self.__inline_processor,
+            self.__link_helper,
+            self.__source_provider_class,
+        ) = (CoalesceProcessor, InlineProcessor, LinkHelper, InMemorySourceProvider)
+
+        self.__tokenizer, self.__transformer, self.__plugins = (
+            create_tokenizer(),
+            TransformToGfm(),
+            create_plugin_manager(),
+        )
+
+    def parse_blocks(self, document_text):
+        """
+        Run only the block pass of the parser over the document.
+        """
+
+        # pylint: disable=protected-access
+        self.__tokenizer.source_provider = self.__source_provider_class(document_text)
+        self.__tokenizer.tokenized_document, self.__tokenizer.stack = None, []
+        self.__inline_processor.initialize()
+        self.__link_helper.initialize()
+        (block_tokens,) = self.__tokenizer._TokenizedMarkdown__parse_blocks_pass(
+            is_streaming=False
+        )
+        # pylint: enable=protected-access
+        return block_tokens
+
+    def filter_parsable_documents(self, document_texts):
+        """
+        Parse each document once, leaving out any that the parser cannot handle.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from pymarkdown.bad_tokenization_error import BadTokenizationError
+
+        # pylint: enable=import-outside-toplevel
+
+        parsable_documents = []
+        for next_document in document_texts:
+            try:
+                self.__tokenizer.transform_from_provider(
+                    self.__source_provider_class(next_document)
+                )
+                parsable_documents.append(next_document)
+            except BadTokenizationError:
+                pass
+        return parsable_documents
+
+    def time_single_pass(self, document_texts, timings):
+        """
+        Time each phase once over every document, adding the time taken for
+        each phase to the timings.
+        """
+        for next_document in document_texts:
+            start_time = time.perf_counter()
+            block_tokens = self.parse_blocks(next_document)
+            blocks_time = time.perf_counter()
+            coalesced_tokens = self.__coalesce_processor.coalesce_text_blocks(
+                block_tokens
+            )
+            coalesce_time = time.perf_counter()
+            final_tokens = self.__inline_processor.parse_inline(coalesced_tokens)
+            inline_time = time.perf_counter()
+            self.__transformer.transform(final_tokens)
+            render_time = time.perf_counter()
+
+            BenchmarkRunner.__add_time(
+                timings, "parse_blocks_pass", blocks_time - start_time
+            )
+            BenchmarkRunner.__add_time(
+                timings, "coalesce_text_blocks", coalesce_time - blocks_time
+            )
+            BenchmarkRunner.__add_time(
+                timings, "parse_inline", inline_time - coalesce_time
+            )
+            BenchmarkRunner.__add_time(
+                timings, "transform_to_gfm", render_time - inline_time
+            )
+
+            if final_tokens and final_tokens[-1].is_pragma:
+                final_tokens = final_tokens[:-1]
+            self.__time_plugins(next_document, final_tokens, timings)
+
+    def __time_plugins(self, document_text, final_tokens, timings):
+        document_lines = document_text.split("\n")
+        context = self.__plugins.starting_new_file("benchmark.md")
+        for next_plugin in self.__plugins.enabled_plugins:
+            plugin_instance = next_plugin.plugin_instance
+
+            start_time = time.perf_counter()
+            for next_token in final_tokens:
+                plugin_instance.next_token(context, next_token)
+            token_time = time.perf_counter()
+            if plugin_instance.is_next_lines_implemented_in_plugin:
+                context.line_number = 1
+                plugin_instance.next_lines(context, document_lines)
+            else:
+                for line_number, next_line in enumerate(document_lines, start=1):
+                    context.line_number = line_number
+                    plugin_instance.next_line(context, next_line)
+            line_time = time.perf_counter()
+            context.line_number = len(document_lines) + 1
+            plugin_instance.completed_file(context)
+
+            BenchmarkRunner.__add_time(
+                timings,
+                f"plugin.{next_plugin.plugin_id}.next_token",
+                token_time - start_time,
+            )
+            BenchmarkRunner.__add_time(
+                timings,
+                f"plugin.{next_plugin.plugin_id}.next_line",
+                line_time - token_time,
+            )
+
+    @staticmethod
+    def __add_time(timings, timing_name, elapsed_time):
+        timings[timing_name] = timings.get(timing_name, 0.0) + elapsed_time
+
+
+def run_benchmarks(scale, repeat_count):
+    """
+    Time each phase for each corpus, keeping the fastest of the passes over
+    that corpus for each phase.
+    """
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    # pylint: disable=import-outside-toplevel
+    from pymarkdown.parser_logger import ParserLogger
+
+    # pylint: enable=import-outside-toplevel
+
+    ParserLogger.sync_on_next_call()
+
+    benchmark_runner = BenchmarkRunner()
+    corpus_results = {}
+    for corpus_name, document_texts in collect_corpora(scale).items():
+        parsable_documents = benchmark_runner.filter_parsable_documents(document_texts)
+        fastest_timings = {}
+        for _ in range(repeat_count):
+            pass_timings = {}
+            benchmark_runner.time_single_pass(parsable_documents, pass_timings)
+            for timing_name, elapsed_time in pass_timings.items():
+                if (
+                    timing_name not in fastest_timings
+                    or elapsed_time < fastest_timings[timing_name]
+                ):
+                    fastest_timings[timing_name] = elapsed_time
+        corpus_results[corpus_name] = {
+            "documents": len(parsable_documents),
+            "skipped_documents": len(document_texts) - len(parsable_documents),
+            "lines": sum(len(x.split("\n")) for x in parsable_documents),
+            "seconds": dict(sorted(fastest_timings.items())),
+        }
+
+    return {
+        "format_version": BENCHMARK_FORMAT_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "scale": scale,
+        "repeat": repeat_count,
+        "corpora": corpus_results,
+    }
+
+
+def compare_against_baseline(
+    benchmark_results, baseline_results, threshold, minimum_seconds
+):
+    """
+    Compare each timing against the same timing in the baseline, returning a
+    list of the timings that are slower than the baseline by more than the
+    threshold ratio.  Any timing that took less than the minimum number of
+    seconds in the baseline is not compared.
+    """
+    regressions = []
+    baseline_corpora = baseline_results.get("corpora", {})
+    for corpus_name, corpus_result in benchmark_results["corpora"].items():
+        baseline_seconds = baseline_corpora.get(corpus_name, {}).get("seconds", {})
+        for timing_name, elapsed_time in corpus_result["seconds"].items():
+            if timing_name not in baseline_seconds:
+                continue
+            baseline_time = baseline_seconds[timing_name]
+            if (
+                baseline_time >= minimum_seconds
+                and elapsed_time / baseline_time > threshold
+            ):
+                regressions.append(
+                    {
+                        "corpus": corpus_name,
+                        "timing": timing_name,
+                        "baseline_seconds": baseline_time,
+                        "seconds": elapsed_time,
+                        "ratio": elapsed_time / baseline_time,
+                    }
+                )
+    return regressions
+
+
+def main():
+    """
+    Main entrance point.
+    """
+    parser = argparse.ArgumentParser(
+        description="Time each phase of scanning Markdown documents."
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=5,
+        help="number of passes over each corpus, keeping the fastest",
+    )
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=int,
+        default=10,
+        help="size of the generated stress documents",
+    )
+    parser.add_argument(
+        "--output",
+        dest="output_file",
+        default=None,
+        help="file to write the JSON results to instead of standard output",
+    )
+    parser.add_argument(
+        "--baseline",
+        dest="baseline_file",
+        default=None,
+        help="JSON results from a previous run to compare against",
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=1.25,
+        help="ratio against the baseline above which a timing is a regression",
+    )
+    parser.add_argument(
+        "--minimum",
+        dest="minimum_seconds",
+        type=float,
+        default=0.005,
+        help="baseline timings below this number of seconds are too noisy to compare",
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT_DIRECTORY)
+    benchmark_results = run_benchmarks(args.scale, args.repeat_count)
+
+    return_code = 0
+    if args.baseline_file:
+        with open(args.baseline_file, encoding="utf-8") as baseline_file:
+            baseline_results = json.load(baseline_file)
+        regressions = compare_against_baseline(
+            benchmark_results,
+            baseline_results,
+            args.threshold,
+            args.minimum_seconds,
+        )
+        benchmark_results["regressions"] = regressions
+        for next_regression in regressions:
+            print(
+                f"{next_regression['corpus']}: {next_regression['timing']} took "
+                + f"{next_regression['seconds']:.4f}s against "
+                + f"{next_regression['baseline_seconds']:.4f}s "
+                + f"({next_regression['ratio']:.2f}x)",
+                file=sys.stderr,
+            )
+        if regressions:
+            return_code = 1
+
+    results_json = json.dumps(benchmark_results, indent=2)
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as output_file:
+            output_file.write(results_json)
+            output_file.write("\n")
+    else:
+        print(results_json)
+    return return_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
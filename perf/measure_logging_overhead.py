@@ -0,0 +1,237 @@
+"""
+Module to measure how much of the time spent parsing Markdown documents is
+spent in the ParserLogger calls when logging is disabled.
+
+The same corpus is parsed in two separate processes:
+
+- "normal", using the modules as they are shipped
+- "stripped", using a variant of the modules where every POGGER statement has
+  been removed when the module is imported
+
+The difference between the two is the remaining cost of the logging calls
+when logging is disabled.
+
+Usage:
+    python perf/measure_logging_overhead.py [--repeat N] [path ...]
+"""
+import argparse
+import ast
+import importlib.abc
+import importlib.machinery
+import json
+import logging
+import os
+import subprocess
+import sys
+
+from perf_helper import (
+    PROJECT_DIRECTORY,
+    collect_markdown_documents,
+    create_tokenizer,
+    time_fastest,
+)
+
+
+class LoggingStatementStripper(ast.NodeTransformer):
+    """
+    Class to remove any statements that only call one of the ParserLogger
+    logging functions.
+    """
+
+    __logger_names = {"POGGER"}
+    __logging_functions = {"debug", "info", "debug_with_visible_whitespace"}
+
+    def visit_Expr(self, node):  # pylint: disable=invalid-name
+        """
+        Remove the statement if it is a call to one of the logging functions.
+        """
+        called_function = node.value.func if isinstance(node.value, ast.Call) else None
+        if (
+            isinstance(called_function, ast.Attribute)
+            and isinstance(called_function.value, ast.Name)
+            and called_function.value.id in self.__logger_names
+            and called_function.attr in self.__logging_functions
+        ):
+            return None
+        return node
+
+    def generic_visit(self, node):
+        """
+        Make sure that removing statements never leaves a body that is empty.
+        """
+        super().generic_visit(node)
+        for field_name in ("body", "orelse", "finalbody"):
+            field_value = getattr(node, field_name, None)
+            if isinstance(field_value, list) and not field_value:
+                if field_name == "body":
+                    field_value.append(ast.Pass())
+        return node
+
+
+class StrippedSourceLoader(importlib.machinery.SourceFileLoader):
+    """
+    Class to load a module from source, removing any logging statements.
+    """
+
+    def get_code(self, fullname):
+        """
+        Always compile from the source, as the bytecode cache contains the
+        normal variant of the module.
+        """
+        source_path = self.get_filename(fullname)
+        return self.source_to_code(self.get_data(source_path), source_path)
+
+    def source_to_code(self, data, path, *, _optimize=-1):
+        """
+        Compile the source after removing any logging statements.
+        """
+        module_tree = LoggingStatementStripper().visit(ast.parse(data))
+        ast.fix_missing_locations(module_tree)
+        return compile(module_tree, path, "exec", dont_inherit=True)
+
+
+class StrippedModuleFinder(importlib.abc.MetaPathFinder):
+    """
+    Class to find any of the project's modules and load them with the
+    stripped loader.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        """
+        Find the module, replacing its loader if it is part of the project.
+        """
+        if fullname != "pymarkdown" and not fullname.startswith("pymarkdown."):
+            return None
+        module_spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if module_spec and isinstance(
+            module_spec.loader, importlib.machinery.SourceFileLoader
+        ):
+            module_spec.loader = StrippedSourceLoader(
+                module_spec.loader.name, module_spec.loader.path
+            )
+        return module_spec
+
+
+def parse_every_document(tokenizer, source_provider_class, document_contents):
+    """
+    Parse each of the documents in turn.
+    """
+    for next_document in document_contents:
+        tokenizer.transform_from_provider(source_provider_class(next_document))
+
+
+def measure_parsing(paths_to_scan, repeat_count):
+    """
+    Parse the documents with logging disabled, returning the number of lines
+    in the corpus and the time taken by the fastest pass over the corpus.  Any documents that the parser
+    cannot handle are left out of the measurement.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from pymarkdown.bad_tokenization_error import BadTokenizationError
+    from pymarkdown.parser_logger import ParserLogger
+    from pymarkdown.source_providers import InMemorySourceProvider
+
+    # pylint: enable=import-outside-toplevel
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    ParserLogger.sync_on_next_call()
+    tokenizer = create_tokenizer()
+
+    document_contents = []
+    for next_document in collect_markdown_documents(paths_to_scan):
+        try:
+            tokenizer.transform_from_provider(InMemorySourceProvider(next_document))
+            document_contents.append(next_document)
+        except BadTokenizationError:
+            pass
+    line_count = sum(len(x.split("\n")) for x in document_contents)
+
+    return line_count, time_fastest(
+        repeat_count,
+        parse_every_document,
+        tokenizer,
+        InMemorySourceProvider,
+        document_contents,
+    )
+
+
+def run_measurement_process(mode, paths_to_scan, repeat_count):
+    """
+    Run the measurement in a new process, so that the modules are loaded
+    cleanly for each mode.
+    """
+    command_line = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--mode",
+        mode,
+        "--repeat",
+        str(repeat_count),
+    ]
+    command_line.extend(paths_to_scan)
+    completed_process = subprocess.run(
+        command_line,
+        check=True,
+        stdout=subprocess.PIPE,
+        cwd=PROJECT_DIRECTORY,
+        universal_newlines=True,
+    )
+    return json.loads(completed_process.stdout)
+
+
+def main():
+    """
+    Main entrance point.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the cost of disabled logging calls while parsing."
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=5,
+        help="number of passes over the corpus, keeping the fastest",
+    )
+    parser.add_argument("--mode", dest="mode", default=None, help=argparse.SUPPRESS)
+    parser.add_argument(
+        "paths",
+        metavar="path",
+        nargs="*",
+        default=["docs", "test/resources/rules"],
+        help="paths to the Markdown documents to parse",
+    )
+    args = parser.parse_args()
+
+    if args.mode:
+        sys.path.insert(0, PROJECT_DIRECTORY)
+        if args.mode == "stripped":
+            sys.meta_path.insert(0, StrippedModuleFinder())
+        line_count, elapsed_time = measure_parsing(args.paths, args.repeat_count)
+        print(json.dumps({"lines": line_count, "seconds": elapsed_time}))
+        return
+
+    results = {}
+    for next_mode in ("normal", "stripped"):
+        results[next_mode] = run_measurement_process(
+            next_mode, args.paths, args.repeat_count
+        )
+        next_result = results[next_mode]
+        print(
+            f"{next_mode:>8}: {next_result['lines']} lines in "
+            + f"{next_result['seconds']:.3f}s, "
+            + f"{1000000.0 * next_result['seconds'] / next_result['lines']:.2f}us per line"
+        )
+    saved_per_line = (
+        results["normal"]["seconds"] / results["normal"]["lines"]
+        - results["stripped"]["seconds"] / results["stripped"]["lines"]
+    )
+    print(
+        f"remaining logging overhead: {1000000.0 * saved_per_line:.2f}us per line "
+        + f"({100.0 * saved_per_line * results['normal']['lines'] / results['normal']['seconds']:.1f}%)"
+    )
+
+
+if __name__ == "__main__":
+    main()
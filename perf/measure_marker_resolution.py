@@ -0,0 +1,265 @@
+"""
+Module to compare the time taken to resolve and to remove the in-band marker
+characters from text, between the single scan used by ParserHelper and the
+multiple passes that were used before it.
+
+The text for each comparison is generated with a given number of markers of
+one kind:
+
+- "escapes", backslash escapes as produced for text like `\\*`
+- "references", replacement markers as produced for entities like `&amp;`
+- "mixed", both of the above along with noop and blech characters
+
+The results from both variants are checked to be the same before any timings
+are reported.
+
+Usage:
+    python perf/measure_marker_resolution.py [--repeat N] [--count N ...]
+"""
+import argparse
+import sys
+
+from perf_helper import PROJECT_DIRECTORY, time_fastest
+
+sys.path.insert(0, PROJECT_DIRECTORY)
+
+# pylint: disable=wrong-import-position
+from pymarkdown.parser_helper import ParserHelper  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+BACKSPACE_CHARACTER, ALERT_CHARACTER = "\b", "\a"
+
+
+class MultiPassMarkerResolver:
+    """
+    Class to provide the multiple pass resolving of the marker characters, as
+    it was before ParserHelper used a single scan, so that it can be measured.
+    """
+
+    @staticmethod
+    def __find_with_escape(adjusted_text_token, find_char, start_index):
+        repeat_me, found_index = True, -1
+        while repeat_me and start_index < len(adjusted_text_token):
+            repeat_me, start_replacement_index = False, adjusted_text_token.find(
+                find_char, start_index
+            )
+            if (
+                start_replacement_index != -1
+                and start_replacement_index > 0
+                and adjusted_text_token[start_replacement_index - 1]
+                == ParserHelper.escape_character
+            ):
+                repeat_me, start_index = True, start_replacement_index + 1
+            else:
+                found_index = start_replacement_index
+        return found_index
+
+    @staticmethod
+    def __remove_characters(token_text, character_to_remove, characters_before):
+        start_index, adjusted_text_token = 0, token_text
+        next_index = MultiPassMarkerResolver.__find_with_escape(
+            adjusted_text_token, character_to_remove, start_index
+        )
+        while next_index != -1:
+            adjusted_text_token = (
+                adjusted_text_token[0 : next_index - characters_before]
+                + adjusted_text_token[next_index + 1 :]
+            )
+            start_index = next_index
+            next_index = MultiPassMarkerResolver.__find_with_escape(
+                adjusted_text_token, character_to_remove, start_index
+            )
+        return adjusted_text_token
+
+    @staticmethod
+    def __remove_escapes(token_text):
+        start_index, adjusted_text_token = 0, token_text
+        next_index = MultiPassMarkerResolver.__find_with_escape(
+            adjusted_text_token, ParserHelper.escape_character, start_index
+        )
+        while next_index != -1:
+            adjusted_text_token = (
+                adjusted_text_token[0:next_index]
+                + adjusted_text_token[next_index + 1 :]
+            )
+            start_index = next_index + 1
+            next_index = MultiPassMarkerResolver.__find_with_escape(
+                adjusted_text_token, ParserHelper.escape_character, start_index
+            )
+        return adjusted_text_token
+
+    @staticmethod
+    def __replace_markers(main_text, is_resolving):
+        start_index = 0
+        start_replacement_index = MultiPassMarkerResolver.__find_with_escape(
+            main_text, ALERT_CHARACTER, start_index
+        )
+        while start_replacement_index != -1:
+            middle_replacement_index = main_text.index(
+                ALERT_CHARACTER, start_replacement_index + 1
+            )
+            end_replacement_index = main_text.index(
+                ALERT_CHARACTER, middle_replacement_index + 1
+            )
+            if is_resolving:
+                replace_text = main_text[
+                    middle_replacement_index + 1 : end_replacement_index
+                ]
+            else:
+                replace_text = main_text[
+                    start_replacement_index + 1 : middle_replacement_index
+                ]
+            if middle_replacement_index + 1 == end_replacement_index:
+                inner_start_replacement_index = main_text.index(
+                    ALERT_CHARACTER, end_replacement_index + 1
+                )
+                inner_middle_replacement_index = main_text.index(
+                    ALERT_CHARACTER, inner_start_replacement_index + 1
+                )
+                end_replacement_index = main_text.index(
+                    ALERT_CHARACTER, inner_middle_replacement_index + 1
+                )
+                if is_resolving:
+                    replace_text = main_text[
+                        inner_start_replacement_index
+                        + 1 : inner_middle_replacement_index
+                    ]
+
+            length_before_mod = len(main_text)
+            main_text = (
+                main_text[0:start_replacement_index]
+                + replace_text
+                + main_text[end_replacement_index + 1 :]
+            )
+            start_index = (
+                end_replacement_index + 1 + (len(main_text) - length_before_mod)
+            )
+            start_replacement_index = MultiPassMarkerResolver.__find_with_escape(
+                main_text, ALERT_CHARACTER, start_index
+            )
+        return main_text
+
+    @staticmethod
+    def resolve_all_from_text(text_to_resolve):
+        """
+        Resolve all of the marker characters from the text, one pass at a time.
+        """
+        resolved_text = MultiPassMarkerResolver.__remove_characters(
+            text_to_resolve, BACKSPACE_CHARACTER, 1
+        )
+        resolved_text = MultiPassMarkerResolver.__replace_markers(resolved_text, True)
+        resolved_text = MultiPassMarkerResolver.__remove_characters(
+            resolved_text, ParserHelper.replace_noop_character, 0
+        )
+        resolved_text = MultiPassMarkerResolver.__remove_characters(
+            resolved_text, ParserHelper.blech_character, 0
+        )
+        return MultiPassMarkerResolver.__remove_escapes(resolved_text)
+
+    @staticmethod
+    def remove_all_from_text(text_to_remove):
+        """
+        Remove all of the marker characters from the text, one pass at a time.
+        """
+        removed_text = MultiPassMarkerResolver.__remove_characters(
+            text_to_remove, BACKSPACE_CHARACTER, 0
+        )
+        removed_text = MultiPassMarkerResolver.__replace_markers(removed_text, False)
+        return MultiPassMarkerResolver.__remove_escapes(removed_text)
+
+
+def generate_marker_text(marker_kind, marker_count):
+    """
+    Generate text with the specified number of markers of the specified kind.
+    """
+    escape_text = "some \\" + BACKSPACE_CHARACTER + "* text "
+    reference_text = ParserHelper.create_replacement_markers("&amp;", "&") + " text "
+    if marker_kind == "escapes":
+        return escape_text * marker_count
+    if marker_kind == "references":
+        return reference_text * marker_count
+    mixed_text = (
+        escape_text
+        + reference_text
+        + ParserHelper.replace_noop_character
+        + ParserHelper.blech_character
+        + ParserHelper.escape_character
+        + BACKSPACE_CHARACTER
+    )
+    return mixed_text * (marker_count // 4)
+
+
+def main():
+    """
+    Main entrance point.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compare the single scan and multiple pass marker resolvers."
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=3,
+        help="number of times to time each call, keeping the fastest",
+    )
+    parser.add_argument(
+        "--count",
+        dest="marker_counts",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="numbers of markers to generate text with",
+    )
+    args = parser.parse_args()
+
+    functions_to_compare = [
+        (
+            "resolve_all_from_text",
+            ParserHelper.resolve_all_from_text,
+            MultiPassMarkerResolver.resolve_all_from_text,
+        ),
+        (
+            "remove_all_from_text",
+            ParserHelper.remove_all_from_text,
+            MultiPassMarkerResolver.remove_all_from_text,
+        ),
+    ]
+    print(
+        f"{'function':<22} {'text':<10} {'markers':>8} "
+        + f"{'single scan':>12} {'multi pass':>12} {'speedup':>8}"
+    )
+    for (
+        function_name,
+        single_scan_function,
+        multi_pass_function,
+    ) in functions_to_compare:
+        for marker_kind in ["escapes", "references", "mixed"]:
+            for marker_count in args.marker_counts:
+                text_to_use = generate_marker_text(marker_kind, marker_count)
+                if single_scan_function(text_to_use) != multi_pass_function(
+                    text_to_use
+                ):
+                    print(
+                        f"{function_name} results differ for {marker_kind} text "
+                        + f"with {marker_count} markers.",
+                        file=sys.stderr,
+                    )
+                    return 1
+                single_scan_time = time_fastest(
+                    args.repeat_count, single_scan_function, text_to_use
+                )
+                multi_pass_time = time_fastest(
+                    args.repeat_count, multi_pass_function, text_to_use
+                )
+                print(
+                    f"{function_name:<22} {marker_kind:<10} {marker_count:>8} "
+                    + f"{single_scan_time:>11.4f}s {multi_pass_time:>11.4f}s "
+                    + f"{multi_pass_time / single_scan_time:>7.1f}x"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Module to measure how the time taken to parse and render generated stress
+documents grows with the size of those documents.
+
+Each scenario generates a document whose size grows with the size given to it.
+Most scenarios time the parsing of the document, while the render scenarios
+time only the transforming of its tokens to html.
+For each size, the fastest time taken is reported along with its ratio to the
+time taken for the first size.  If the work done for the scenario is linear,
+the time ratio stays close to the size ratio, instead of growing with its
+square.
+
+Usage:
+    python perf/measure_scaling.py [--repeat N] [--sizes N ...]
+        [--scenario NAME ...]
+"""
+import argparse
+import logging
+import sys
+
+from perf_helper import PROJECT_DIRECTORY, create_tokenizer, time_fastest
+
+sys.path.insert(0, PROJECT_DIRECTORY)
+
+# pylint: disable=wrong-import-position
+from pymarkdown.transform_to_gfm import TransformToGfm  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+
+def generate_unmatched_emphasis(size):
+    """
+    Generate a paragraph with many emphasis delimiters that are never matched.
+    """
+    return "foo_bar* " * size
+
+
+def generate_matched_emphasis(size):
+    """
+    Generate a paragraph with many pairs of emphasis delimiters that are each
+    matched.
+    """
+    return "*a* " * size
+
+
+def generate_nested_emphasis(size):
+    """
+    Generate a paragraph with many pairs of emphasis delimiters that are nested
+    inside each other.
+    """
+    return "*a " * size + "b*" + " c*" * (size - 1)
+
+
+def generate_links_and_images(size):
+    """
+    Generate a paragraph with many links and images separated by emphasis
+    delimiters that are never matched.
+    """
+    return "foo* [link](/url) and ![image](/img) " * size
+
+
+def generate_block_quote(size):
+    """
+    Generate a single block quote, with a line containing only the block quote
+    character after every four lines to end the paragraph within it.
+    """
+    return "\n".join(
+        f"> line {line_index} of the quoted text" if (line_index + 1) % 5 else ">"
+        for line_index in range(size)
+    )
+
+
+def generate_list_in_block_quote(size):
+    """
+    Generate a list in a block quote, with a nested block quote of many
+    paragraphs in its first item.
+    """
+    return "> - a\n" + ">   > b\n>\n" * size + "> - c\n>   - d\n>\n>   e"
+
+
+def generate_unterminated_link_title(size):
+    """
+    Generate a link reference definition with a title that continues over many
+    lines and is never closed.
+    """
+    return (
+        "[foo]: /url\n'title starts\n"
+        + "\n".join(f"title line {line_index}" for line_index in range(size))
+        + "\n\n[foo]"
+    )
+
+
+def generate_paragraphs(size):
+    """
+    Generate many paragraphs, each with emphasis, a code span, and a link.
+    """
+    return "\n\n".join(
+        f"paragraph *{paragraph_index}* with `code` and a [link](/url)"
+        for paragraph_index in range(size)
+    )
+
+
+SCENARIOS = {
+    "block-quote": (generate_block_quote, 2500, False),
+    "link": (generate_links_and_images, 250, False),
+    "list-in-block-quote": (generate_list_in_block_quote, 250, False),
+    "matched-emphasis": (generate_matched_emphasis, 500, False),
+    "nested-emphasis": (generate_nested_emphasis, 250, False),
+    "paragraphs-render": (generate_paragraphs, 1000, True),
+    "unmatched-emphasis": (generate_unmatched_emphasis, 500, False),
+    "unterminated-link-title": (generate_unterminated_link_title, 250, False),
+}
+
+
+def main():
+    """
+    Main entrance point.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure how the time taken for stress documents grows with their size."
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=3,
+        help="number of times to time each size, keeping the fastest",
+    )
+    parser.add_argument(
+        "--sizes",
+        dest="size_multipliers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="multiples of the base size of each scenario to generate",
+    )
+    parser.add_argument(
+        "--scenario",
+        dest="scenario_names",
+        nargs="+",
+        choices=sorted(SCENARIOS),
+        default=sorted(SCENARIOS),
+        help="scenarios to measure",
+    )
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    tokenizer, transformer = create_tokenizer(), TransformToGfm()
+
+    print(f"{'scenario':<28} {'size':>8} {'time':>10} {'ratio':>8}")
+    for scenario_name in args.scenario_names:
+        generate_document, base_size, measure_render = SCENARIOS[scenario_name]
+        first_time = None
+        for size_multiplier in args.size_multipliers:
+            document_text = generate_document(base_size * size_multiplier)
+            if measure_render:
+                elapsed_time = time_fastest(
+                    args.repeat_count,
+                    transformer.transform,
+                    tokenizer.transform(document_text),
+                )
+            else:
+                elapsed_time = time_fastest(
+                    args.repeat_count, tokenizer.transform, document_text
+                )
+            first_time = first_time or elapsed_time
+            print(
+                f"{scenario_name:<28} {base_size * size_multiplier:>8} "
+                + f"{elapsed_time:>9.3f}s {elapsed_time / first_time:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Module to measure the memory used by each token produced by the parser, and the
+time taken to dispatch those tokens to the plugins.
+
+Three measurements are reported for a generated document with a mix of block
+and inline elements:
+
+- the number of bytes retained for each token after the document is parsed
+- the time taken to check every `is_*` property of every token
+- the time taken by the `next_token` function of every enabled plugin
+
+Usage:
+    python perf/measure_token_footprint.py [--repeat N] [--scale N]
+"""
+import argparse
+import logging
+import sys
+import tracemalloc
+
+from perf_helper import (
+    PROJECT_DIRECTORY,
+    create_plugin_manager,
+    create_tokenizer,
+    time_fastest,
+)
+
+sys.path.insert(0, PROJECT_DIRECTORY)
+
+# pylint: disable=wrong-import-position
+from pymarkdown.markdown_token import MarkdownToken  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+
+def generate_document(scale):
+    """
+    Generate a document with a mix of block and inline elements.
+    """
+    document_lines = []
+    for section_index in range(scale):
+        document_lines.extend(
+            [
+                f"## Section {section_index}",
+                "",
+                f"Some *emphasis* and `code` with a [link](/url{section_index}) "
+                + "and **strong** text &amp; more.",
+                "",
+                "- item one",
+                "- item *two*",
+                "  1. nested item",
+                "",
+                "> quoted `text` here",
+                "",
+                "```text",
+                "code line",
+                "```",
+                "",
+                "---",
+                "",
+            ]
+        )
+    return "\n".join(document_lines)
+
+
+def collect_property_names():
+    """
+    Collect the names of every `is_*` property on the base token.
+    """
+    return [
+        x
+        for x in dir(MarkdownToken)
+        if x.startswith("is_") and isinstance(getattr(MarkdownToken, x), property)
+    ]
+
+
+def measure_bytes_per_token(tokenizer, document_text):
+    """
+    Measure the bytes retained by the tokens that are parsed from the document.
+    """
+    tracemalloc.start()
+    before_size, _ = tracemalloc.get_traced_memory()
+    parsed_tokens = tokenizer.transform(document_text)
+    after_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed_tokens, (after_size - before_size) / len(parsed_tokens)
+
+
+def check_every_property(parsed_tokens, property_names):
+    """
+    Check every `is_*` property of every token.
+    """
+    for next_token in parsed_tokens:
+        for property_name in property_names:
+            getattr(next_token, property_name)
+
+
+def dispatch_to_plugins(plugins, parsed_tokens):
+    """
+    Pass every token to the `next_token` function of every enabled plugin.
+    """
+    context = plugins.starting_new_file("footprint.md")
+    for next_plugin in plugins.enabled_plugins:
+        plugin_instance = next_plugin.plugin_instance
+        for next_token in parsed_tokens:
+            plugin_instance.next_token(context, next_token)
+
+
+def main():
+    """
+    Main entrance point.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure the memory and dispatch time of the parsed tokens."
+    )
+    parser.add_argument(
+        "--repeat",
+        dest="repeat_count",
+        type=int,
+        default=5,
+        help="number of times to time each measurement, keeping the fastest",
+    )
+    parser.add_argument(
+        "--scale",
+        dest="scale",
+        type=int,
+        default=500,
+        help="number of sections to generate in the document",
+    )
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    tokenizer, plugins = create_tokenizer(), create_plugin_manager()
+
+    parsed_tokens, bytes_per_token = measure_bytes_per_token(
+        tokenizer, generate_document(args.scale)
+    )
+    if parsed_tokens[-1].is_pragma:
+        parsed_tokens = parsed_tokens[:-1]
+    property_names = collect_property_names()
+
+    property_time = time_fastest(
+        args.repeat_count, check_every_property, parsed_tokens, property_names
+    )
+    plugin_time = time_fastest(
+        args.repeat_count, dispatch_to_plugins, plugins, parsed_tokens
+    )
+    print(f"tokens:               {len(parsed_tokens)}")
+    print(f"bytes per token:      {bytes_per_token:.1f}")
+    print(
+        f"is_* property checks: {property_time:.4f}s "
+        + f"({len(property_names)} properties)"
+    )
+    print(f"plugin next_token:    {plugin_time:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Module to provide the helper functions shared by the performance scripts.
+
+The project's modules are only imported when a tokenizer or plugin manager is
+created, so that a script can change how they are loaded before that happens.
+"""
+import os
+import time
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def collect_markdown_documents(paths_to_scan):
+    """
+    Collect the contents of each Markdown document found in the paths.
+    """
+    markdown_documents = []
+    for next_path in paths_to_scan:
+        if os.path.isdir(next_path):
+            for root_directory, _, file_names in os.walk(next_path):
+                for next_file_name in sorted(file_names):
+                    if next_file_name.endswith(".md"):
+                        markdown_documents.append(
+                            os.path.join(root_directory, next_file_name)
+                        )
+        else:
+            markdown_documents.append(next_path)
+
+    document_contents = []
+    for next_document in markdown_documents:
+        with open(next_document, encoding="utf-8") as document_file:
+            document_contents.append(document_file.read())
+    return document_contents
+
+
+def time_fastest(repeat_count, function_to_time, *function_arguments):
+    """
+    Time the function with the arguments, keeping the fastest of the repeats.
+    """
+    fastest_time = None
+    for _ in range(repeat_count):
+        start_time = time.perf_counter()
+        function_to_time(*function_arguments)
+        elapsed_time = time.perf_counter() - start_time
+        if fastest_time is None or elapsed_time < fastest_time:
+            fastest_time = elapsed_time
+    return fastest_time
+
+
+def create_tokenizer():
+    """
+    Create a tokenizer with the default configuration and extensions.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from application_properties import ApplicationProperties
+
+    from pymarkdown.extension_manager import ExtensionManager
+    from pymarkdown.tokenized_markdown import TokenizedMarkdown
+
+    # pylint: enable=import-outside-toplevel
+
+    properties = ApplicationProperties()
+    extension_manager = ExtensionManager()
+    extension_manager.initialize(None, properties)
+    extension_manager.apply_configuration()
+    tokenizer = TokenizedMarkdown()
+    tokenizer.apply_configuration(properties, extension_manager)
+    return tokenizer
+
+
+def create_plugin_manager():
+    """
+    Create a plugin manager with the default set of plugins enabled, ignoring
+    any failures that they report.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from application_properties import ApplicationProperties
+
+    from pymarkdown.plugin_manager import PluginManager
+
+    # pylint: enable=import-outside-toplevel
+
+    properties = ApplicationProperties()
+    plugins = PluginManager(
+        scan_failure_reporter=lambda x: None,
+        pragma_failure_reporter=lambda x: None,
+    )
+    plugins.initialize(
+        os.path.join(PROJECT_DIRECTORY, "pymarkdown", "plugins"),
+        None,
+        None,
+        None,
+        properties,
+        False,
+    )
+    plugins.apply_configuration(properties)
+    return plugins
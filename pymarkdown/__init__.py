@@ -2,7 +2,9 @@
 Module to provide for command line access but does not perform
 any actions if imported into another Python module.
 """
+from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException  # noqa F401
 from pymarkdown.main import PyMarkdownLint  # noqa F401
+from pymarkdown.parsed_document import ParsedDocument  # noqa F401
 
 # def main():
 #    PyMarkdownLint().main()
@@ -0,0 +1,278 @@
+"""
+Module to provide for linting Markdown from within another Python program.
+"""
+import os
+
+from application_properties import (
+    ApplicationProperties,
+    ApplicationPropertiesJsonLoader,
+)
+
+from pymarkdown.bad_tokenization_error import BadTokenizationError
+from pymarkdown.extension_manager import ExtensionManager
+from pymarkdown.parsed_document import ParsedDocument
+from pymarkdown.plugin_manager import BadPluginError, PluginManager
+from pymarkdown.source_providers import FileSourceProvider, InMemorySourceProvider
+from pymarkdown.tokenized_markdown import TokenizedMarkdown
+
+
+class PyMarkdownApiException(Exception):
+    """
+    Class to allow for any error raised while initializing the linter or while
+    scanning with it to be reported to the caller.
+    """
+
+
+# pylint: disable=too-few-public-methods
+class PyMarkdownScanResult:
+    """
+    Class to contain the failures reported while scanning one or more documents.
+    """
+
+    def __init__(self, scan_failures, pragma_failures):
+        self.scan_failures, self.pragma_failures = scan_failures, pragma_failures
+
+
+# pylint: enable=too-few-public-methods
+
+
+class PyMarkdownApi:
+    """
+    Class to provide for linting Markdown without going through the command line.
+
+    All of the expensive work, such as discovering and loading the plugins and
+    setting up the parser, is done once when the object is constructed.  After
+    that, the scan_string and scan_path functions can be called as many times as
+    needed, each returning the failures found instead of printing them.
+    """
+
+    default_scan_name = "in-memory.md"
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        configuration_file=None,
+        configuration_properties=None,
+        enable_rules=None,
+        disable_rules=None,
+        additional_plugins=None,
+        strict_configuration=False,
+    ):
+        self.__scan_failures, self.__pragma_failures = [], []
+        self.__properties = ApplicationProperties()
+        self.__plugins = PluginManager(
+            scan_failure_reporter=self.__scan_failures.append,
+            pragma_failure_reporter=self.__pragma_failures.append,
+        )
+        self.__extensions = ExtensionManager()
+        self.__tokenizer = None
+
+        if configuration_file:
+            ApplicationPropertiesJsonLoader.load_and_set(
+                self.__properties, configuration_file, self.__handle_error
+            )
+        try:
+            if configuration_properties:
+                self.__properties.set_manual_property(configuration_properties)
+            if strict_configuration or self.__properties.get_boolean_property(
+                "mode.strict-config", strict_mode=True
+            ):
+                self.__properties.enable_strict_mode()
+        except ValueError as this_exception:
+            self.__handle_error(
+                f"Configuration Error: {this_exception}", this_exception
+            )
+
+        self.__initialize_plugins(enable_rules, disable_rules, additional_plugins)
+        self.__initialize_extensions()
+        self.__initialize_parser()
+
+    # pylint: enable=too-many-arguments
+
+    @staticmethod
+    def __handle_error(formatted_error, thrown_error):
+        raise PyMarkdownApiException(formatted_error) from thrown_error
+
+    @staticmethod
+    def __join_rules(rule_identifiers):
+        if not rule_identifiers or isinstance(rule_identifiers, str):
+            return rule_identifiers
+        return ",".join(rule_identifiers)
+
+    # pylint: disable=broad-except
+    def __initialize_plugins(self, enable_rules, disable_rules, additional_plugins):
+        plugin_dir = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "plugins"
+        )
+        try:
+            self.__plugins.initialize(
+                plugin_dir,
+                additional_plugins,
+                self.__join_rules(enable_rules),
+                self.__join_rules(disable_rules),
+                self.__properties,
+                False,
+            )
+        except BadPluginError as this_exception:
+            formatted_error = f"BadPluginError encountered while loading plugins:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+        except ValueError as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while initializing plugins:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+
+        try:
+            self.__plugins.apply_configuration(self.__properties)
+        except Exception as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while configuring plugins:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+
+    def __initialize_extensions(self):
+        try:
+            self.__extensions.initialize(None, self.__properties)
+            self.__extensions.apply_configuration()
+        except Exception as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while initializing extensions:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+
+    # pylint: enable=broad-except
+
+    def __initialize_parser(self):
+        try:
+            self.__tokenizer = TokenizedMarkdown()
+            self.__tokenizer.apply_configuration(self.__properties, self.__extensions)
+        except BadTokenizationError as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while initializing tokenizer:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+
+    @property
+    def enabled_rules(self):
+        """
+        Get a sorted list of the identifiers for each rule that is enabled.
+        """
+        return sorted(x.plugin_id for x in self.__plugins.enabled_plugins)
+
+    def scan_string(self, string_to_scan, scan_name=None):
+        """
+        Scan the supplied Markdown text, returning any failures that were found.
+        The scan_name is used in place of a file name when reporting failures.
+        """
+        scan_name = scan_name or PyMarkdownApi.default_scan_name
+        return self.__scan_sources([scan_name], string_to_scan)
+
+    def scan_document(self, parsed_document):
+        """
+        Scan a document that was already parsed, returning any failures that were
+        found.
+        """
+        return self.__scan_sources([parsed_document.scan_name], None, parsed_document)
+
+    # pylint: disable=broad-except
+    def parse_string(self, string_to_parse, scan_name=None):
+        """
+        Parse the supplied Markdown text, returning a ParsedDocument that can be
+        scanned, rendered, or passed to another process without parsing it again.
+        """
+        scan_name = scan_name or PyMarkdownApi.default_scan_name
+        try:
+            return ParsedDocument.from_provider(
+                self.__tokenizer,
+                scan_name,
+                InMemorySourceProvider(string_to_parse),
+                string_to_parse.split("\n"),
+            )
+        except Exception as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while parsing '{scan_name}':\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+        return None
+
+    def parse_file(self, file_to_parse):
+        """
+        Parse the Markdown file at the supplied path, returning a ParsedDocument
+        that can be scanned, rendered, or passed to another process without
+        parsing it again.
+        """
+        if not os.path.isfile(file_to_parse):
+            raise PyMarkdownApiException(
+                f"Provided file path '{file_to_parse}' is not a valid file."
+            )
+        try:
+            source_provider = FileSourceProvider(file_to_parse)
+            return ParsedDocument.from_provider(
+                self.__tokenizer,
+                file_to_parse,
+                source_provider,
+                source_provider.read_lines,
+            )
+        except Exception as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while parsing '{file_to_parse}':\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+        return None
+
+    # pylint: enable=broad-except
+
+    def scan_path(self, path_to_scan, recurse_directories=False):
+        """
+        Scan the Markdown file at the supplied path or, if the path is a directory,
+        each Markdown file within that directory, returning any failures that were
+        found.
+        """
+        if not os.path.exists(path_to_scan):
+            raise PyMarkdownApiException(
+                f"Provided path '{path_to_scan}' does not exist."
+            )
+
+        files_to_scan = []
+        if os.path.isdir(path_to_scan):
+            for root, directories, files in os.walk(path_to_scan):
+                if not recurse_directories:
+                    directories.clear()
+                normalized_root = root.replace("\\", "/").rstrip("/")
+                files_to_scan.extend(
+                    f"{normalized_root}/{x}" for x in files if x.endswith(".md")
+                )
+            files_to_scan.sort()
+        elif path_to_scan.endswith(".md"):
+            files_to_scan.append(path_to_scan)
+        else:
+            raise PyMarkdownApiException(
+                f"Provided file path '{path_to_scan}' is not a valid file."
+            )
+
+        return self.__scan_sources(files_to_scan)
+
+    # pylint: disable=broad-except
+    def __scan_sources(self, scan_names, string_to_scan=None, parsed_document=None):
+        self.__scan_failures.clear()
+        self.__pragma_failures.clear()
+        for scan_name in scan_names:
+            try:
+                if parsed_document:
+                    self.__plugins.scan_document(
+                        scan_name,
+                        parsed_document.tokens,
+                        parsed_document.source_lines,
+                        parsed_document.pragma_lines,
+                    )
+                else:
+                    self.__scan_source(scan_name, string_to_scan)
+            except Exception as this_exception:
+                formatted_error = f"{str(type(this_exception).__name__)} encountered while scanning '{scan_name}':\n{str(this_exception)}"
+                self.__handle_error(formatted_error, this_exception)
+        return PyMarkdownScanResult(
+            list(self.__scan_failures), list(self.__pragma_failures)
+        )
+
+    # pylint: enable=broad-except
+
+    def __scan_source(self, scan_name, string_to_scan):
+        if string_to_scan is None:
+            source_provider = FileSourceProvider(scan_name)
+            source_lines = source_provider.read_lines
+        else:
+            source_provider = InMemorySourceProvider(string_to_scan)
+            source_lines = string_to_scan.split("\n")
+        self.__plugins.scan_document(
+            scan_name,
+            self.__tokenizer.stream_from_provider(source_provider),
+            source_lines,
+        )
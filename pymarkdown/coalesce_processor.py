@@ -20,86 +20,112 @@ class CoalesceProcessor:
         """
         Take a pass and combine any two adjacent text blocks into one.
         """
-        coalesced_list = []
+        is_debug_enabled = POGGER.is_debug_enabled
+        coalesced_list, combined_tokens = [], []
         coalesced_list.extend(first_pass_results[0:1])
         for coalesce_index in range(1, len(first_pass_results)):
-            did_process = False
-            POGGER.debug(
-                "coalesce_text_blocks>>>>$<<",
-                first_pass_results[coalesce_index],
-            )
+            next_token = first_pass_results[coalesce_index]
+            if is_debug_enabled:
+                POGGER.debug("coalesce_text_blocks>>>>$<<", next_token)
             if coalesced_list[-1].is_text:
-                POGGER.debug(">>coalesce_text_blocks>>>>$<<", coalesced_list[-1])
-                if first_pass_results[coalesce_index].is_text or (
-                    first_pass_results[coalesce_index].is_blank_line
-                    and coalesced_list[-2].is_code_block
-                ):
-
-                    POGGER.debug("text-text>>$<<", coalesced_list[-2])
-                    if coalesced_list[-2].is_indented_code_block:
-                        remove_leading_spaces = len(
-                            coalesced_list[-2].extracted_whitespace
-                        )
-                    elif (
-                        coalesced_list[-2].is_paragraph
-                        or coalesced_list[-2].is_setext_heading
-                    ):
-                        remove_leading_spaces = -1
-                    else:
-                        remove_leading_spaces = 0
-
-                    POGGER.debug("remove_leading_spaces>>$", remove_leading_spaces)
-                    POGGER.debug("combine1>>$", coalesced_list[-1])
-                    POGGER.debug("combine2>>$", first_pass_results[coalesce_index])
-                    indented_whitespace = coalesced_list[-1].combine(
-                        first_pass_results[coalesce_index], remove_leading_spaces
-                    )
-                    POGGER.debug("combined>>$", coalesced_list[-1])
-                    POGGER.debug("indented_whitespace>>$<<", indented_whitespace)
-                    if coalesced_list[-2].is_indented_code_block:
-                        coalesced_list[-2].add_indented_whitespace(indented_whitespace)
-                    did_process = True
-            elif (
-                first_pass_results[coalesce_index].is_blank_line
-                and coalesced_list[-1].is_code_block
-            ):
-                POGGER.debug("was>>$", first_pass_results[coalesce_index])
+                did_process = CoalesceProcessor.__combine_text_tokens(
+                    coalesced_list, next_token, combined_tokens, is_debug_enabled
+                )
+            elif next_token.is_blank_line and coalesced_list[-1].is_code_block:
+                if is_debug_enabled:
+                    POGGER.debug("was>>$", next_token)
                 replacement_token = TextMarkdownToken(
                     "",
-                    first_pass_results[coalesce_index].extracted_whitespace,
-                    line_number=first_pass_results[coalesce_index].line_number,
-                    column_number=first_pass_results[coalesce_index].column_number,
+                    next_token.extracted_whitespace,
+                    line_number=next_token.line_number,
+                    column_number=next_token.column_number,
                 )
-                POGGER.debug("now>>$", replacement_token)
+                if is_debug_enabled:
+                    POGGER.debug("now>>$", replacement_token)
                 coalesced_list.append(replacement_token)
                 did_process = True
+            else:
+                did_process = False
             if not did_process:
-                coalesced_list.append(first_pass_results[coalesce_index])
+                coalesced_list.append(next_token)
+
+        # The text of each combined token is only joined together once, instead
+        # of for each line that is combined into it.
+        for owning_token, combined_token in combined_tokens:
+            combined_token.finish_combine()
+            if owning_token.is_indented_code_block:
+                owning_token.finish_indented_whitespace()
 
         for coalesce_index in range(1, len(coalesced_list)):
             if coalesced_list[coalesce_index].is_text and (
                 coalesced_list[coalesce_index - 1].is_paragraph
                 or coalesced_list[coalesce_index - 1].is_setext_heading
             ):
-                POGGER.debug("full_paragraph_text>$<", coalesced_list[coalesce_index])
-                POGGER.debug(
-                    "full_paragraph_text>$<",
-                    coalesced_list[coalesce_index].token_text,
-                )
-                removed_ws = coalesced_list[coalesce_index].remove_final_whitespace()
-                POGGER.debug(
-                    "full_paragraph_text>$<",
-                    coalesced_list[coalesce_index].token_text,
-                )
-                POGGER.debug(
-                    "full_paragraph_text>$>", coalesced_list[coalesce_index - 1]
-                )
-                coalesced_list[coalesce_index - 1].set_final_whitespace(removed_ws)
-                POGGER.debug(
-                    "full_paragraph_text>$>", coalesced_list[coalesce_index - 1]
+                CoalesceProcessor.__move_final_whitespace(
+                    coalesced_list[coalesce_index - 1],
+                    coalesced_list[coalesce_index],
+                    is_debug_enabled,
                 )
 
         return coalesced_list
 
+    @staticmethod
+    def __combine_text_tokens(
+        coalesced_list, next_token, combined_tokens, is_debug_enabled
+    ):
+        """
+        Combine the next token into the text token at the end of the list, if the
+        two can be combined.
+        """
+        if is_debug_enabled:
+            POGGER.debug(">>coalesce_text_blocks>>>>$<<", coalesced_list[-1])
+        if not (
+            next_token.is_text
+            or (next_token.is_blank_line and coalesced_list[-2].is_code_block)
+        ):
+            return False
+
+        owning_token = coalesced_list[-2]
+        if is_debug_enabled:
+            POGGER.debug("text-text>>$<<", owning_token)
+        if owning_token.is_indented_code_block:
+            remove_leading_spaces = len(owning_token.extracted_whitespace)
+        elif owning_token.is_paragraph or owning_token.is_setext_heading:
+            remove_leading_spaces = -1
+        else:
+            remove_leading_spaces = 0
+
+        if is_debug_enabled:
+            POGGER.debug("remove_leading_spaces>>$", remove_leading_spaces)
+            POGGER.debug("combine1>>$", coalesced_list[-1])
+            POGGER.debug("combine2>>$", next_token)
+        indented_whitespace = coalesced_list[-1].combine(
+            next_token, remove_leading_spaces
+        )
+        if not combined_tokens or combined_tokens[-1][1] is not coalesced_list[-1]:
+            combined_tokens.append(coalesced_list[-2:])
+        if is_debug_enabled:
+            POGGER.debug("combined>>$", coalesced_list[-1])
+            POGGER.debug("indented_whitespace>>$<<", indented_whitespace)
+        if owning_token.is_indented_code_block:
+            owning_token.add_indented_whitespace(indented_whitespace)
+        return True
+
+    @staticmethod
+    def __move_final_whitespace(owning_token, text_token, is_debug_enabled):
+        """
+        Move the final whitespace of a paragraph's text into the paragraph token.
+        """
+        if is_debug_enabled:
+            POGGER.debug("full_paragraph_text>$<", text_token)
+            POGGER.debug("full_paragraph_text>$<", text_token.token_text)
+        removed_ws = text_token.remove_final_whitespace()
+        if is_debug_enabled:
+            POGGER.debug("full_paragraph_text>$<", text_token.token_text)
+            POGGER.debug("full_paragraph_text>$>", owning_token)
+        owning_token.set_final_whitespace(removed_ws)
+        if is_debug_enabled:
+            POGGER.debug("full_paragraph_text>$>", owning_token)
+
 
 # pylint: enable=too-few-public-methods
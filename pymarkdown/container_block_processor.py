@@ -552,12 +552,16 @@ class ContainerBlockProcessor:
                 "PLFCB>>Started list-last stack>>$",
                 parser_state.token_stack[stack_index],
             )
-            token_index = len(parser_state.token_document) - 1
-
-            while token_index >= 0 and not (
-                parser_state.token_document[token_index].is_any_list_token
-            ):
-                token_index -= 1
+            token_index = parser_state.find_last_list_token_in_document(
+                parser_state.token_stack[stack_index]
+            )
+            if POGGER.is_debug_enabled:
+                searched_index = len(parser_state.token_document) - 1
+                while searched_index >= 0 and not (
+                    parser_state.token_document[searched_index].is_any_list_token
+                ):
+                    searched_index -= 1
+                assert token_index == searched_index
             POGGER.debug(
                 "PLFCB>>Started list-last token>>$",
                 parser_state.token_document[token_index],
@@ -573,7 +577,7 @@ class ContainerBlockProcessor:
                 adj_ws = extracted_whitespace[old_start_index:]
         return adj_ws
 
-    # pylint: disable=too-many-arguments, too-many-locals, too-many-statements
+    # pylint: disable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
     @staticmethod
     def __handle_nested_container_blocks(
         parser_state,
@@ -685,9 +689,17 @@ class ContainerBlockProcessor:
                         "parser_state.nested_list_start.matching_markdown_token>>$<<",
                         parser_state.nested_list_start.matching_markdown_token,
                     )
-                    list_start_token_index = parser_state.token_document.index(
-                        parser_state.nested_list_start.matching_markdown_token
+                    list_start_token_index = (
+                        parser_state.find_matching_markdown_token_index(
+                            parser_state.nested_list_start
+                        )
                     )
+                    if POGGER.is_debug_enabled:
+                        assert list_start_token_index == (
+                            parser_state.token_document.index(
+                                parser_state.nested_list_start.matching_markdown_token
+                            )
+                        )
                     POGGER.debug(
                         "list_start_token_index>>$<<",
                         list_start_token_index,
@@ -829,7 +841,7 @@ class ContainerBlockProcessor:
             container_level_tokens,
         )
 
-    # pylint: enable=too-many-arguments, too-many-locals, too-many-statements
+    # pylint: enable=too-many-arguments, too-many-locals, too-many-statements, too-many-branches
 
     @staticmethod
     def __get_nested_container_starts(
@@ -1276,6 +1288,23 @@ class ContainerBlockProcessor:
             parser_state, extracted_whitespace
         )
 
+        if LeafBlockProcessor.is_paragraph_only(
+            parser_state, position_marker, extracted_whitespace
+        ):
+            stack_bq_count = parser_state.count_of_block_quotes_on_stack()
+            new_tokens = LeafBlockProcessor.parse_paragraph(
+                parser_state,
+                position_marker,
+                extracted_whitespace,
+                this_bq_count,
+                stack_bq_count,
+                text_removed_by_container,
+                force_it,
+            )
+            POGGER.debug(">>leaf--adding>>$", new_tokens)
+            pre_tokens.extend(new_tokens)
+            return pre_tokens, None
+
         outer_processed = ContainerBlockProcessor.__handle_fenced_code_block(
             parser_state,
             False,
@@ -16,6 +16,8 @@ class ContainerMarkdownToken(MarkdownToken):
     Class to provide for a container element that can be added to markdown parsing stream.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         token_name,
@@ -44,6 +46,12 @@ class NewListItemMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the new list item element.
     """
 
+    __slots__ = (
+        "__indent_level",
+        "__extracted_whitespace",
+        "__list_start_content",
+    )
+
     def __init__(
         self, indent_level, position_marker, extracted_whitespace, list_start_content
     ):
@@ -89,6 +97,16 @@ class OrderedListStartMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the ordered list start element.
     """
 
+    __slots__ = (
+        "__list_start_sequence",
+        "__list_start_content",
+        "__indent_level",
+        "__extracted_whitespace",
+        "__leading_spaces",
+        "is_loose",
+        "leading_spaces_index",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -121,7 +139,7 @@ class OrderedListStartMarkdownToken(ContainerMarkdownToken):
             "",
             position_marker=position_marker,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -170,9 +188,9 @@ class OrderedListStartMarkdownToken(ContainerMarkdownToken):
             new_list_item_token.indent_level,
             new_list_item_token.extracted_whitespace,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -196,7 +214,7 @@ class OrderedListStartMarkdownToken(ContainerMarkdownToken):
             if self.__leading_spaces is None
             else f"{self.__leading_spaces}{ParserHelper.newline_character}{ws_add}"
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
 
 # pylint: enable=too-many-instance-attributes
@@ -207,6 +225,15 @@ class UnorderedListStartMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the unordered list start element.
     """
 
+    __slots__ = (
+        "__list_start_sequence",
+        "__indent_level",
+        "__extracted_whitespace",
+        "__leading_spaces",
+        "is_loose",
+        "leading_spaces_index",
+    )
+
     def __init__(
         self, list_start_sequence, indent_level, extracted_whitespace, position_marker
     ):
@@ -224,7 +251,7 @@ class UnorderedListStartMarkdownToken(ContainerMarkdownToken):
             "",
             position_marker=position_marker,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     @property
     def extracted_whitespace(self):
@@ -264,9 +291,9 @@ class UnorderedListStartMarkdownToken(ContainerMarkdownToken):
             new_list_item_token.indent_level,
             new_list_item_token.extracted_whitespace,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -290,7 +317,7 @@ class UnorderedListStartMarkdownToken(ContainerMarkdownToken):
             if self.__leading_spaces is None
             else f"{self.__leading_spaces}{ParserHelper.newline_character}{ws_add}"
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
 
 class BlockQuoteMarkdownToken(ContainerMarkdownToken):
@@ -298,9 +325,22 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
     Class to provide for an encapsulation of the block quote element.
     """
 
+    __slots__ = (
+        "__extracted_whitespace",
+        "__leading_space_parts",
+        "__leading_spaces",
+        "leading_text_index",
+    )
+
     def __init__(self, extracted_whitespace, position_marker):
-        self.__extracted_whitespace, self.__leading_spaces, self.leading_text_index = (
+        (
+            self.__extracted_whitespace,
+            self.__leading_space_parts,
+            self.__leading_spaces,
+            self.leading_text_index,
+        ) = (
             extracted_whitespace,
+            [],
             "",
             0,
         )
@@ -310,7 +350,7 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
             "",
             position_marker=position_marker,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     @property
     def extracted_whitespace(self):
@@ -324,36 +364,49 @@ class BlockQuoteMarkdownToken(ContainerMarkdownToken):
         """
         Returns any leading spaces that preface the block quote.
         """
+        if self.__leading_spaces is None:
+            self.__leading_spaces = "".join(self.__leading_space_parts)
         return self.__leading_spaces
 
     def add_leading_spaces(self, leading_spaces_to_add, skip_adding_newline=False):
         """
         Add any leading spaces to the token, separating them with line feeds.
+
+        The parts are only collected here, and are joined the next time that the
+        leading_spaces are asked for.  As no empty parts are kept, the leading
+        spaces are empty only if there are no parts.
         """
-        POGGER.debug(
-            "__leading_spaces>>:$:<<",
-            self.__leading_spaces,
-        )
         POGGER.debug("add_leading_spaces>>:$:<<", leading_spaces_to_add)
-        if skip_adding_newline:
-            self.__leading_spaces = f"{self.__leading_spaces}{leading_spaces_to_add}"
-        else:
-            self.__leading_spaces = (
-                f"{self.__leading_spaces}{ParserHelper.newline_character}{leading_spaces_to_add}"
-                if self.__leading_spaces
-                else leading_spaces_to_add
-            )
-        POGGER.debug(
-            "__leading_spaces>>:$:<<",
-            self.__leading_spaces,
-        )
-        self.__compose_extra_data_field()
+        if self.__leading_space_parts and not skip_adding_newline:
+            self.__leading_space_parts.append(ParserHelper.newline_character)
+        if leading_spaces_to_add:
+            self.__leading_space_parts.append(leading_spaces_to_add)
+        self.__leading_spaces = None
+        self._invalidate_extra_data()
+
+    @property
+    def leading_spaces_state(self):
+        """
+        Returns a snapshot of the leading spaces that can later be given to
+        restore_leading_spaces_state to undo any leading spaces added since.
+        """
+        return len(self.__leading_space_parts), self.leading_text_index
+
+    def restore_leading_spaces_state(self, leading_spaces_state):
+        """
+        Undo any leading spaces added since the snapshot was taken.  To be used
+        only when rewinding.
+        """
+        part_count, self.leading_text_index = leading_spaces_state
+        del self.__leading_space_parts[part_count:]
+        self.__leading_spaces = None
+        self._invalidate_extra_data()
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
-        item_list = [self.__extracted_whitespace, self.__leading_spaces]
+        item_list = [self.__extracted_whitespace, self.leading_spaces]
         self._set_extra_data(MarkdownToken.extra_data_separator.join(item_list))
 
     def calculate_next_leading_space_part(self, increment_index=True):
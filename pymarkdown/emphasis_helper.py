@@ -11,6 +11,92 @@ from pymarkdown.parser_logger import ParserLogger
 POGGER = ParserLogger(logging.getLogger(__name__))
 
 
+class DelimiterStack:
+    """
+    Class to keep track of the special text tokens within the inline blocks of a
+    single text block, along with the index of each of those tokens within the
+    inline blocks.
+
+    Tokens are only ever appended to the inline blocks, and the inline blocks are
+    only changed at or after the start of a link or image when that link or image
+    is resolved.  Therefore, the index kept for each token in this stack stays
+    valid.  Once a link or image is resolved, every special text token after its
+    start is deactivated, so those tokens are removed from this stack instead of
+    being looked at again for each link or image that follows.
+
+    The stack index of each link or image start is also kept, so that finding
+    the start for a link close does not need to look at any emphasis tokens.
+    """
+
+    __link_starts = ["[", "!["]
+
+    def __init__(self):
+        self.special_tokens, self.inline_indices, self.link_start_indices = (
+            [],
+            [],
+            [],
+        )
+
+    def append_tokens(self, inline_blocks, new_tokens):
+        """
+        Append the new tokens to the inline blocks, keeping track of any that are
+        special text tokens.
+        """
+        for new_token in new_tokens:
+            if new_token.is_special_text:
+                if new_token.token_text in DelimiterStack.__link_starts:
+                    self.link_start_indices.append(len(self.special_tokens))
+                self.special_tokens.append(new_token)
+                self.inline_indices.append(len(inline_blocks))
+            inline_blocks.append(new_token)
+
+    def remove_last_link_start(self):
+        """
+        Stop keeping track of the most recent link or image start.
+        """
+        stack_index = self.link_start_indices.pop()
+        del self.special_tokens[stack_index]
+        del self.inline_indices[stack_index]
+
+    def last_link_start(self):
+        """
+        Return the stack index of the most recent link or image start, along with
+        its index within the inline blocks.  Both are -1 if there is none.
+        """
+        if not self.link_start_indices:
+            return -1, -1
+        stack_index = self.link_start_indices[-1]
+        return stack_index, self.inline_indices[stack_index]
+
+    def deactivate_link_starts(self):
+        """
+        Deactivate every link start before the most recent link or image start.
+        Any link start before an inactive link start was deactivated along with
+        it, so there is no need to look any further.
+        """
+        deactivate_index = len(self.link_start_indices) - 2
+        while deactivate_index >= 0:
+            deactivate_token = self.special_tokens[
+                self.link_start_indices[deactivate_index]
+            ]
+            POGGER.debug("inline_blocks>>>>>>>>>>>>>>>>>>$", deactivate_token)
+            if deactivate_token.token_text == DelimiterStack.__link_starts[0]:
+                if not deactivate_token.is_active:
+                    break
+                deactivate_token.deactivate()
+            deactivate_index -= 1
+
+    def remove_from(self, stack_index):
+        """
+        Stop keeping track of the token at the specified index in the stack, and
+        of every token after it.
+        """
+        del self.special_tokens[stack_index:]
+        del self.inline_indices[stack_index:]
+        while self.link_start_indices and self.link_start_indices[-1] >= stack_index:
+            del self.link_start_indices[-1]
+
+
 # pylint: disable=too-few-public-methods
 class EmphasisHelper:
     """
@@ -23,36 +109,30 @@ class EmphasisHelper:
 
     # pylint: disable=too-many-branches
     @staticmethod
-    def resolve_inline_emphasis(inline_blocks, wall_token):
+    def resolve_inline_emphasis(inline_blocks, delimiter_stack, stack_bottom=-1):
         """
-        Resolve the inline emphasis by interpreting the special text tokens.
+        Resolve the inline emphasis by interpreting the special text tokens in
+        the delimiter stack after the stack_bottom index.
         """
         is_debug_enabled = POGGER.is_debug_enabled
-        delimiter_stack, special_count = [], 0
-        for next_block in inline_blocks:
-            POGGER.debug(
-                "special_count>>$>>$",
-                special_count,
-                next_block,
-            )
-            special_count += 1
-            if not next_block.is_special_text:
-                continue
-            if is_debug_enabled:
+        inline_indices, delimiter_stack = (
+            delimiter_stack.inline_indices,
+            delimiter_stack.special_tokens,
+        )
+        if is_debug_enabled:
+            for next_block in delimiter_stack[stack_bottom + 1 :]:
                 POGGER.debug(
                     "i>>>$",
                     next_block.show_process_emphasis(),
                 )
-            delimiter_stack.append(next_block)
 
-        stack_bottom = EmphasisHelper.__find_token_in_delimiter_stack(
-            inline_blocks, delimiter_stack, wall_token
-        )
-        current_position, openers_bottom, stack_size = (
+        current_position, openers_bottom, previous_positions, emphasis_changes = (
             stack_bottom + 1,
-            stack_bottom,
-            len(delimiter_stack),
+            {},
+            {},
+            {},
         )
+        stack_size = len(delimiter_stack)
         if current_position < stack_size:
             if is_debug_enabled:
                 POGGER.debug("BLOCK($) of ($)", current_position, stack_size)
@@ -85,60 +165,114 @@ class EmphasisHelper:
                     POGGER.debug("not closer")
                     continue
 
-                close_token, scan_index, found_opener = (
-                    delimiter_stack[current_position],
-                    current_position - 1,
-                    None,
+                open_position = EmphasisHelper.__find_opener(
+                    delimiter_stack,
+                    current_position,
+                    (stack_bottom, openers_bottom),
+                    previous_positions,
                 )
-                POGGER.debug("potential closer-->$", current_position)
-                while (
-                    scan_index >= 0
-                    and scan_index > stack_bottom
-                    and scan_index > openers_bottom
-                ):
-                    POGGER.debug("potential opener:$", scan_index)
-                    open_token = delimiter_stack[scan_index]
-                    is_valid_opener = EmphasisHelper.__is_open_close_emphasis_valid(
-                        open_token, close_token
-                    )
-                    if is_valid_opener:
-                        found_opener = open_token
-                        break
-                    scan_index -= 1
-                    POGGER.debug(
-                        "scan_index-->$>stack_bottom>$>openers_bottom>$>",
-                        scan_index,
-                        stack_bottom,
-                        openers_bottom,
-                    )
-
-                if found_opener:
+                if open_position != -1:
                     POGGER.debug("FOUND OPEN")
                     current_position = EmphasisHelper.__process_emphasis_pair(
-                        inline_blocks,
-                        found_opener,
-                        close_token,
+                        delimiter_stack,
+                        open_position,
                         current_position,
+                        previous_positions,
+                        emphasis_changes,
                     )
-                else:
-                    # openers_bottom = current_position - 1
-                    POGGER.debug("NOT FOUND OPEN, openers_bottom=$", openers_bottom)
 
                 POGGER.debug("next->$", current_position)
 
-        EmphasisHelper.__reset_token_text(inline_blocks)
+        if emphasis_changes:
+            EmphasisHelper.__splice_emphasis_changes(
+                inline_blocks, inline_indices, emphasis_changes
+            )
+        EmphasisHelper.__reset_token_text(delimiter_stack, stack_bottom)
         EmphasisHelper.__clear_remaining_emphasis(delimiter_stack, stack_bottom)
         return inline_blocks
         # pylint: enable=too-many-branches
 
+    @staticmethod
+    def __find_opener(
+        delimiter_stack, current_position, search_bottoms, previous_positions
+    ):
+        """
+        Look for an opener for the closer at the current position, only looking
+        above the openers_bottom for its kind of closer, and return its position
+        in the delimiter stack, or -1 if there is none.  If no opener is found,
+        the openers_bottom for that kind of closer is raised to the closer.
+        """
+        stack_bottom, openers_bottom = search_bottoms
+        close_token = delimiter_stack[current_position]
+        closer_kind = EmphasisHelper.__calculate_closer_kind(close_token)
+        search_bottom = max(stack_bottom, openers_bottom.get(closer_kind, stack_bottom))
+        scan_index = previous_positions.get(current_position, current_position - 1)
+        POGGER.debug("potential closer-->$", current_position)
+        while scan_index > search_bottom:
+            POGGER.debug("potential opener:$", scan_index)
+            if EmphasisHelper.__is_open_close_emphasis_valid(
+                delimiter_stack[scan_index], close_token
+            ):
+                return scan_index
+            scan_index = previous_positions.get(scan_index, scan_index - 1)
+            POGGER.debug(
+                "scan_index-->$>search_bottom>$>",
+                scan_index,
+                search_bottom,
+            )
+
+        openers_bottom[closer_kind] = current_position - 1
+        POGGER.debug(
+            "NOT FOUND OPEN, openers_bottom[$]=$",
+            closer_kind,
+            current_position - 1,
+        )
+        return -1
+
+    @staticmethod
+    def __calculate_closer_kind(close_token):
+        """
+        Calculate the kind of closer, as used to track the openers_bottom for
+        each kind.  As __is_open_close_emphasis_valid only depends on the closer's
+        delimiter character, whether it can also be an opener, and its original
+        length modulo 3, two closers of the same kind are matched by exactly the
+        same openers.  Therefore, once no opener is found for a closer, no opener
+        will be found at or below that point for any later closer of the same
+        kind.  The original length is used as the lengths of both the closers and
+        the openers are reduced as emphasis is matched.
+        """
+        return (
+            close_token.token_text[0],
+            EmphasisHelper.__is_potential_opener(close_token),
+            close_token.original_repeat_count % 3,
+        )
+
     @staticmethod
     def __process_emphasis_pair(
-        inline_blocks, open_token, close_token, current_position
+        delimiter_stack,
+        open_position,
+        current_position,
+        previous_positions,
+        emphasis_changes,
     ):
         """
         Given that we have found a valid open and close block, process them.
+
+        Instead of inserting the new emphasis tokens into the inline blocks for
+        each pair, which means searching for the open and close blocks and moving
+        every block after them, the tokens are kept in emphasis_changes with the
+        positions of the open and close blocks in the delimiter stack, and added
+        to the inline blocks once all the pairs are processed.  Every block
+        between the open and close blocks is now inactive, so the closer is linked
+        in previous_positions to the opener, or to the block before the opener if
+        the opener is used up, so that those blocks are not looked at again.
         """
 
+        open_token, close_token = (
+            delimiter_stack[open_position],
+            delimiter_stack[current_position],
+        )
+
         # Figure out whether we have emphasis or strong emphasis
         emphasis_character, emphasis_length = (
             open_token.token_text[0],
@@ -158,43 +292,34 @@ class EmphasisHelper:
         )
         POGGER.debug("open_column_number_delta>>$", open_column_number_delta)
 
-        start_index_in_blocks = inline_blocks.index(open_token)
         new_token = EmphasisMarkdownToken(
             emphasis_length,
             emphasis_character,
             line_number=open_token.line_number,
             column_number=open_token.column_number + open_column_number_delta,
         )
-        inline_blocks.insert(
-            start_index_in_blocks + 1,
-            new_token,
-        )
-        end_index_in_blocks = inline_blocks.index(close_token)
-        inline_blocks.insert(
-            end_index_in_blocks,
+        emphasis_changes.setdefault(open_position, ([], []))[1].append(new_token)
+        emphasis_changes.setdefault(current_position, ([], []))[0].append(
             new_token.generate_close_markdown_token_from_markdown_token(
                 "",
                 "",
                 False,
                 line_number=close_token.line_number,
                 column_number=close_token.column_number,
-            ),
+            )
         )
-        end_index_in_blocks += 1
 
         # remove emphasis_length from open and close nodes
         is_debug_enabled = POGGER.is_debug_enabled
         if is_debug_enabled:
             POGGER.debug(
                 "$>>close_token>>$<<",
-                end_index_in_blocks,
+                current_position,
                 close_token.show_process_emphasis(),
             )
         close_token.reduce_repeat_count(emphasis_length, adjust_column_number=True)
         if not close_token.repeat_count:
-            inline_blocks.remove(close_token)
             POGGER.debug("close_token>>removed")
-            end_index_in_blocks -= 1
             close_token.deactivate()
         else:
             current_position -= 1
@@ -202,66 +327,65 @@ class EmphasisHelper:
             POGGER.debug("close_token>>$<<", close_token.show_process_emphasis())
             POGGER.debug(
                 "$>>open_token>>$<<",
-                start_index_in_blocks,
+                open_position,
                 open_token.show_process_emphasis(),
             )
         open_token.reduce_repeat_count(emphasis_length)
         if not open_token.repeat_count:
-            inline_blocks.remove(open_token)
             POGGER.debug("open_token>>removed")
-            end_index_in_blocks -= 1
             open_token.deactivate()
         if is_debug_enabled:
             POGGER.debug("open_token>>$<<", open_token.show_process_emphasis())
 
         # "remove" between start and end from delimiter_stack
-        inline_index = start_index_in_blocks + 1
-        while inline_index < end_index_in_blocks:
-            POGGER.debug(
-                "inline_index>>$>>end>>$>>$",
-                inline_index,
-                end_index_in_blocks,
-                len(inline_blocks),
-            )
-            if inline_blocks[inline_index].is_special_text:
-                inline_blocks[inline_index].deactivate()
-            inline_index += 1
+        close_position = current_position + (1 if close_token.repeat_count else 0)
+        stack_index = previous_positions.get(close_position, close_position - 1)
+        while stack_index > open_position:
+            POGGER.debug("stack_index>>$>>end>>$", stack_index, close_position)
+            delimiter_stack[stack_index].deactivate()
+            stack_index = previous_positions.get(stack_index, stack_index - 1)
+        previous_positions[close_position] = (
+            open_position
+            if open_token.repeat_count
+            else previous_positions.get(open_position, open_position - 1)
+        )
 
         return current_position
 
     @staticmethod
-    def __find_token_in_delimiter_stack(inline_blocks, delimiter_stack, wall_token):
+    def __splice_emphasis_changes(inline_blocks, inline_indices, emphasis_changes):
         """
-        Find the specified token in the delimiter stack, based solely on
-        position in the inline_blocks.
+        Add the emphasis tokens kept for each changed block to the inline blocks,
+        with the end tokens before the block and the start tokens after it, and
+        remove any changed block that is used up.  As each new start token was
+        placed right after its open block, the start tokens are added in the
+        reverse of the order that they were kept in.
         """
 
-        if wall_token:
-            wall_index_in_inlines = inline_blocks.index(wall_token)
-            POGGER.debug(">>wall_index_in_inlines>>$", wall_index_in_inlines)
-            while wall_index_in_inlines >= 0:
-                if inline_blocks[wall_index_in_inlines].is_special_text:
-                    wall_index_in_inlines = delimiter_stack.index(
-                        inline_blocks[wall_index_in_inlines]
-                    )
-                    break
-                wall_index_in_inlines -= 1
-            POGGER.debug(">>wall_index_in_inlines(mod)>>$", wall_index_in_inlines)
-            stack_bottom = wall_index_in_inlines
-        else:
-            stack_bottom = -1
-        return stack_bottom
+        changed_positions = sorted(emphasis_changes)
+        first_index = previous_index = inline_indices[changed_positions[0]]
+        spliced_blocks = []
+        for changed_position in changed_positions:
+            inline_index = inline_indices[changed_position]
+            spliced_blocks.extend(inline_blocks[previous_index:inline_index])
+            end_tokens, start_tokens = emphasis_changes[changed_position]
+            spliced_blocks.extend(end_tokens)
+            if inline_blocks[inline_index].repeat_count:
+                spliced_blocks.append(inline_blocks[inline_index])
+            spliced_blocks.extend(reversed(start_tokens))
+            previous_index = inline_index + 1
+        spliced_blocks.extend(inline_blocks[previous_index:])
+        inline_blocks[first_index:] = spliced_blocks
 
     @staticmethod
-    def __reset_token_text(inline_blocks):
+    def __reset_token_text(delimiter_stack, stack_bottom):
         """
         Once we are completed with any emphasis processing, ensure that any
         special emphasis tokens are limited to the specified lengths.
         """
 
-        for next_block in inline_blocks:
-            if next_block.is_special_text:
-                next_block.adjust_token_text_by_repeat_count()
+        for next_block in delimiter_stack[stack_bottom + 1 :]:
+            next_block.adjust_token_text_by_repeat_count()
 
     @staticmethod
     def __clear_remaining_emphasis(delimiter_stack, stack_bottom):
@@ -396,15 +520,17 @@ class EmphasisHelper:
             ) and EmphasisHelper.__is_potential_opener(open_token)
             POGGER.debug("is_opener_both>>$", is_opener_both)
             if is_closer_both or is_opener_both:
-                sum_repeat_count = close_token.repeat_count + open_token.repeat_count
+                sum_repeat_count = (
+                    close_token.original_repeat_count + open_token.original_repeat_count
+                )
                 POGGER.debug("sum_delims>>$", sum_repeat_count)
-                POGGER.debug("closer_delims>>$", close_token.repeat_count)
-                POGGER.debug("opener_delims>>$", open_token.repeat_count)
+                POGGER.debug("closer_delims>>$", close_token.original_repeat_count)
+                POGGER.debug("opener_delims>>$", open_token.original_repeat_count)
 
                 if sum_repeat_count % 3 == 0:
                     is_valid_opener = (
-                        close_token.repeat_count % 3 == 0
-                        and open_token.repeat_count % 3 == 0
+                        close_token.original_repeat_count % 3 == 0
+                        and open_token.original_repeat_count % 3 == 0
                     )
 
         return is_valid_opener
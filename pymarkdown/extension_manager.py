@@ -93,6 +93,16 @@ class ExtensionManager:
             PragmaExtension().get_identifier() in self.__enabled_extensions
         )
 
+    @property
+    def enabled_extensions(self):
+        """
+        Get the details for each of the enabled extensions.
+        """
+        return [
+            self.__extension_details[next_extension_id]
+            for next_extension_id in self.__enabled_extensions
+        ]
+
     @property
     def is_front_matter_enabled(self):
         """
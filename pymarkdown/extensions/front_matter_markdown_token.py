@@ -50,14 +50,12 @@ class FrontMatterExtension:
         _ = extension_specific_facade
 
     @staticmethod
-    def handle_front_matter_token(output_html, next_token, transform_state):
+    def handle_front_matter_token(html_writer, next_token, transform_state):
         """
         Handle the front matter token.  Note that it does not contribute anything
         at all to the HTML output.
         """
-        _ = (next_token, transform_state)
-
-        return output_html
+        _ = (html_writer, next_token, transform_state)
 
     @staticmethod
     def rehydrate_front_matter(current_token, previous_token):
@@ -211,6 +209,13 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the front matter data.
     """
 
+    __slots__ = (
+        "__start_boundary_line",
+        "__end_boundary_line",
+        "__collected_lines",
+        "__matter_map",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -232,7 +237,7 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
             position_marker=position_marker,
             is_extension=True,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -264,7 +269,7 @@ class FrontMatterMarkdownToken(LeafMarkdownToken):
         """
         return self.__matter_map
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
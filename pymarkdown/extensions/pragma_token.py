@@ -92,6 +92,15 @@ class PragmaExtension:
                 return True
         return False
 
+    @staticmethod
+    def could_contain_pragmas(source_lines):
+        """
+        Determine whether any of the lines could be a pragma, without parsing them.
+        As a pragma must start at the beginning of its line, any line that does not
+        start with the pragma prefix cannot be a pragma.
+        """
+        return any(x.startswith(PragmaToken.pragma_prefix) for x in source_lines)
+
     # pylint: disable=too-many-locals, too-many-arguments
     @staticmethod
     def compile_single_pragma(
@@ -171,6 +180,8 @@ class PragmaToken(MarkdownToken):
     Token that contains the pragmas for the document.
     """
 
+    __slots__ = ("__pragma_lines",)
+
     pragma_prefix = "<!--"
     pragma_alternate_prefix = "<!---"
     pragma_title = "pyml "
@@ -38,6 +38,7 @@ class InlineRequest:
         line_number=None,
         column_number=None,
         para_owner=None,
+        delimiter_stack=None,
     ):
         (
             self.source_text,
@@ -48,6 +49,7 @@ class InlineRequest:
             self.line_number,
             self.column_number,
             self.para_owner,
+            self.delimiter_stack,
         ) = (
             source_text,
             next_index,
@@ -57,6 +59,7 @@ class InlineRequest:
             line_number,
             column_number,
             para_owner,
+            delimiter_stack,
         )
 
     # pylint: enable=too-many-arguments
@@ -126,6 +129,8 @@ class InlineHelper:
     code_span_bounds = "`"
     backslash_character = "\\"
     __entity_map = {}
+    __entity_map_resource_path = None
+    __loaded_entity_maps = {}
     character_reference_start_character = "&"
     __numeric_character_reference_start_character = "#"
     __hex_character_reference_start_character = "xX"
@@ -143,11 +148,38 @@ class InlineHelper:
     __entities_file_name = "entities.json"
 
     @staticmethod
-    def initialize(resource_path):
+    def initialize(resource_path, defer_loading=False):
         """
         Initialize the inline subsystem.
+
+        Each entity map is only loaded once per process and is then shared by
+        every tokenizer that uses the same resource path.  If loading is deferred,
+        the entity map is not loaded until the first named character reference
+        needs to be looked up.
         """
-        InlineHelper.__entity_map = InlineHelper.__load_entity_map(resource_path)
+        entity_map = InlineHelper.__loaded_entity_maps.get(
+            InlineHelper.__entity_map_key(resource_path)
+        )
+        if entity_map is None and not defer_loading:
+            entity_map = InlineHelper.__load_entity_map(resource_path)
+        InlineHelper.__entity_map_resource_path, InlineHelper.__entity_map = (
+            resource_path,
+            entity_map,
+        )
+
+    @staticmethod
+    def __entity_map_key(resource_path):
+        return os.path.abspath(
+            os.path.join(resource_path, InlineHelper.__entities_file_name)
+        )
+
+    @staticmethod
+    def __get_entity_map():
+        if InlineHelper.__entity_map is None:
+            InlineHelper.__entity_map = InlineHelper.__load_entity_map(
+                InlineHelper.__entity_map_resource_path
+            )
+        return InlineHelper.__entity_map
 
     @staticmethod
     def handle_inline_backslash(inline_request, add_text_signature=True):
@@ -248,9 +280,10 @@ class InlineHelper:
                     end_index += 1
                     collected_string += InlineHelper.__character_reference_end_character
                     original_collected_string = collected_string
-                    if collected_string in InlineHelper.__entity_map:
+                    entity_map = InlineHelper.__get_entity_map()
+                    if collected_string in entity_map:
                         inline_response.original_string = collected_string
-                        collected_string = InlineHelper.__entity_map[collected_string]
+                        collected_string = entity_map[collected_string]
                         inline_response.new_string_unresolved = (
                             original_collected_string
                         )
@@ -846,6 +879,9 @@ class InlineHelper:
                 assert ord(entity_characters[0]) == entity_codepoints[0]
                 assert ord(entity_characters[1]) == entity_codepoints[1]
             approved_entity_map[next_name] = entity_characters
+        InlineHelper.__loaded_entity_maps[
+            InlineHelper.__entity_map_key(resource_path)
+        ] = approved_entity_map
         return approved_entity_map
 
     @staticmethod
@@ -17,6 +17,8 @@ class InlineMarkdownToken(MarkdownToken):
     Class to provide for a leaf element that can be added to markdown parsing stream.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         token_name,
@@ -48,6 +50,11 @@ class EmphasisMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline emphasis element.
     """
 
+    __slots__ = (
+        "__emphasis_length",
+        "__emphasis_character",
+    )
+
     def __init__(
         self, emphasis_length, emphasis_character, line_number=0, column_number=0
     ):
@@ -87,6 +94,8 @@ class RawHtmlMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline raw html element.
     """
 
+    __slots__ = ("__raw_tag",)
+
     def __init__(self, raw_tag, line_number, column_number):
         self.__raw_tag = raw_tag
         InlineMarkdownToken.__init__(
@@ -110,6 +119,8 @@ class EmailAutolinkMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline email autolink element.
     """
 
+    __slots__ = ("__autolink_text",)
+
     def __init__(self, autolink_text, line_number, column_number):
         self.__autolink_text = autolink_text
         InlineMarkdownToken.__init__(
@@ -133,6 +144,8 @@ class UriAutolinkMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline uri autolink element.
     """
 
+    __slots__ = ("__autolink_text",)
+
     def __init__(self, autolink_text, line_number, column_number):
         self.__autolink_text = autolink_text
         InlineMarkdownToken.__init__(
@@ -156,6 +169,13 @@ class InlineCodeSpanMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline code span element.
     """
 
+    __slots__ = (
+        "__span_text",
+        "__extracted_start_backticks",
+        "__leading_whitespace",
+        "__trailing_whitespace",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -227,6 +247,8 @@ class HardBreakMarkdownToken(InlineMarkdownToken):
     Class to provide for an encapsulation of the inline hard line break element.
     """
 
+    __slots__ = ("__line_end",)
+
     def __init__(self, line_end, line_number, column_number):
         self.__line_end = line_end
         InlineMarkdownToken.__init__(
@@ -256,6 +278,21 @@ class ReferenceMarkdownToken(InlineMarkdownToken):
     Base class for images and links.
     """
 
+    __slots__ = (
+        "__label_type",
+        "__link_uri",
+        "__link_title",
+        "__pre_link_uri",
+        "__pre_link_title",
+        "__ex_label",
+        "__text_from_blocks",
+        "__did_use_angle_start",
+        "__inline_title_bounding_character",
+        "__before_link_whitespace",
+        "__before_title_whitespace",
+        "__after_title_whitespace",
+    )
+
     # pylint: disable=too-many-arguments, too-many-locals
     def __init__(
         self,
@@ -433,6 +470,8 @@ class LinkStartMarkdownToken(ReferenceMarkdownToken):
     Class to provide for an encapsulation of the link element.
     """
 
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -485,6 +524,8 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
     Class to provide for an encapsulation of the image element.
     """
 
+    __slots__ = ("__image_alt_text",)
+
     # pylint: disable=too-many-arguments, too-many-locals
     def __init__(
         self,
@@ -538,11 +579,24 @@ class ImageStartMarkdownToken(ReferenceMarkdownToken):
 # pylint: enable=too-many-instance-attributes
 
 
+# pylint: disable=too-many-instance-attributes
 class TextMarkdownToken(InlineMarkdownToken):
     """
     Class to provide for an encapsulation of the text element.
     """
 
+    __slots__ = (
+        "__token_text",
+        "__extracted_whitespace",
+        "__end_whitespace",
+        "__is_special",
+        "__combined_text_parts",
+        "__combined_whitespace_parts",
+        "__text_spans",
+        "__resolved_text",
+        "__original_text",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -559,7 +613,10 @@ class TextMarkdownToken(InlineMarkdownToken):
             self.__extracted_whitespace,
             self.__end_whitespace,
             self.__is_special,
-        ) = (token_text, extracted_whitespace, end_whitespace, is_special)
+            self.__combined_text_parts,
+            self.__combined_whitespace_parts,
+        ) = (token_text, extracted_whitespace, end_whitespace, is_special, None, None)
+        self.__clear_text_spans()
         InlineMarkdownToken.__init__(
             self,
             MarkdownToken._token_text,
@@ -568,13 +625,22 @@ class TextMarkdownToken(InlineMarkdownToken):
             line_number=line_number,
             column_number=column_number,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
     def _set_token_text(self, new_text):
+        self.finish_combine()
         self.__token_text = new_text
-        self.__compose_extra_data_field()
+        self.__clear_text_spans()
+        self._invalidate_extra_data()
+
+    def __clear_text_spans(self):
+        self.__text_spans, self.__resolved_text, self.__original_text = (
+            None,
+            None,
+            None,
+        )
 
     @property
     def is_special(self):
@@ -591,13 +657,51 @@ class TextMarkdownToken(InlineMarkdownToken):
         """
         Returns the text associated with the token.
         """
+        if self.__combined_text_parts is not None:
+            self.finish_combine()
         return self.__token_text
 
+    @property
+    def text_spans(self):
+        """
+        Returns the text associated with the token as a list of spans, each a
+        tuple of the kind of span, its original text and its replacement text.
+        """
+        if self.__text_spans is None:
+            self.__text_spans = ParserHelper.split_into_spans(self.token_text)
+        return self.__text_spans
+
+    @property
+    def resolved_text(self):
+        """
+        Returns the text associated with the token, with any escapes and
+        replacements resolved, as it is rendered.
+        """
+        if self.__resolved_text is None:
+            self.__resolved_text = "".join(
+                replacement_text for _, _, replacement_text in self.text_spans
+            )
+        return self.__resolved_text
+
+    @property
+    def original_text(self):
+        """
+        Returns the text associated with the token, with any escapes and
+        replacements removed, as it was in the document.
+        """
+        if self.__original_text is None:
+            self.__original_text = "".join(
+                original_text for _, original_text, _ in self.text_spans
+            )
+        return self.__original_text
+
     @property
     def extracted_whitespace(self):
         """
         Returns any whitespace that was extracted before the processing of this element occurred.
         """
+        if self.__combined_text_parts is not None:
+            self.finish_combine()
         return self.__extracted_whitespace
 
     @property
@@ -612,20 +716,20 @@ class TextMarkdownToken(InlineMarkdownToken):
         Create a copy of this token.
         """
         new_token = TextMarkdownToken(
-            self.__token_text,
-            self.__extracted_whitespace,
+            self.token_text,
+            self.extracted_whitespace,
             self.__end_whitespace,
             line_number=self.line_number,
             column_number=self.column_number,
         )
         return new_token
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
 
-        data_field_parts = [self.__token_text, self.__extracted_whitespace]
+        data_field_parts = [self.token_text, self.extracted_whitespace]
         if self.end_whitespace:
             data_field_parts.append(self.__end_whitespace)
         self._set_extra_data(MarkdownToken.extra_data_separator.join(data_field_parts))
@@ -636,6 +740,7 @@ class TextMarkdownToken(InlineMarkdownToken):
         end with a hard break.
         """
 
+        self.finish_combine()
         removed_whitespace = ""
         (
             collected_whitespace_length,
@@ -649,6 +754,7 @@ class TextMarkdownToken(InlineMarkdownToken):
                 + collected_whitespace_length
             ]
             self.__token_text = self.__token_text[0:first_non_whitespace_index]
+            self.__clear_text_spans()
         return removed_whitespace
 
     def combine(self, other_text_token, remove_leading_spaces):
@@ -658,6 +764,11 @@ class TextMarkdownToken(InlineMarkdownToken):
         removed from each line, if present.
         If remove_leading_spaces == -1, then.
         If remove_leading_spaces == 0, then.
+
+        Note: To avoid building a new string for each line that is combined,
+              the parts are only collected here.  They are joined together when
+              the text of this token is next used, or when the finish_combine
+              function is called.
         """
 
         if other_text_token.is_blank_line:
@@ -695,18 +806,56 @@ class TextMarkdownToken(InlineMarkdownToken):
                     whitespace_present[remove_leading_spaces:],
                 )
 
+        if self.__combined_text_parts is None:
+            self.__combined_text_parts, self.__combined_whitespace_parts = (
+                [self.__token_text],
+                [self.__extracted_whitespace],
+            )
+            self.__clear_text_spans()
+            self._invalidate_extra_data()
         if whitespace_to_append is not None:
-            self.__extracted_whitespace = f"{self.__extracted_whitespace}{ParserHelper.newline_character}{whitespace_to_append}"
-        self.__token_text = f"{self.__token_text}{ParserHelper.newline_character}{blank_line_sequence}{prefix_whitespace}{text_to_combine}"
-        self.__compose_extra_data_field()
+            self.__combined_whitespace_parts.extend(
+                [ParserHelper.newline_character, whitespace_to_append]
+            )
+        self.__combined_text_parts.extend(
+            [
+                ParserHelper.newline_character,
+                blank_line_sequence,
+                prefix_whitespace,
+                text_to_combine,
+            ]
+        )
         return removed_whitespace
 
+    def finish_combine(self):
+        """
+        Join the parts collected by any calls to the combine function into the
+        text and whitespace for this token.
+        """
+        if self.__combined_text_parts is not None:
+            self.__token_text, self.__extracted_whitespace = (
+                "".join(self.__combined_text_parts),
+                "".join(self.__combined_whitespace_parts),
+            )
+            self.__combined_text_parts, self.__combined_whitespace_parts = None, None
+
+
+# pylint: enable=too-many-instance-attributes
+
 
 class SpecialTextMarkdownToken(TextMarkdownToken):
     """
     Class to provide for special tokens that represent exceptional inline elements.
     """
 
+    __slots__ = (
+        "__repeat_count",
+        "__original_repeat_count",
+        "__is_active",
+        "__preceding_two",
+        "__following_two",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -720,10 +869,11 @@ class SpecialTextMarkdownToken(TextMarkdownToken):
     ):
         (
             self.__repeat_count,
+            self.__original_repeat_count,
             self.__is_active,
             self.__preceding_two,
             self.__following_two,
-        ) = (repeat_count, is_active, preceding_two, following_two)
+        ) = (repeat_count, repeat_count, is_active, preceding_two, following_two)
         TextMarkdownToken.__init__(
             self,
             token_text,
@@ -750,6 +900,14 @@ class SpecialTextMarkdownToken(TextMarkdownToken):
         """
         return self.__repeat_count
 
+    @property
+    def original_repeat_count(self):
+        """
+        Returns the repeat count for the special text element before any of it
+        was used for emphasis.
+        """
+        return self.__original_repeat_count
+
     @property
     def preceding_two(self):
         """
@@ -3,7 +3,7 @@ Inline processing
 """
 import logging
 
-from pymarkdown.emphasis_helper import EmphasisHelper
+from pymarkdown.emphasis_helper import DelimiterStack, EmphasisHelper
 from pymarkdown.inline_helper import InlineHelper, InlineRequest, InlineResponse
 from pymarkdown.inline_markdown_token import SpecialTextMarkdownToken, TextMarkdownToken
 from pymarkdown.link_helper import LinkHelper
@@ -108,184 +108,205 @@ class InlineProcessor:
             )
 
     @staticmethod
-    # pylint: disable=too-many-branches, too-many-statements, too-many-nested-blocks
     def parse_inline(coalesced_results):
         """
         Parse and resolve any inline elements.
         """
-        POGGER.info("coalesced_results")
-        POGGER.info("-----")
-        for next_token in coalesced_results:
-            POGGER.info(">>$<<", next_token)
-        POGGER.info("-----")
-
-        coalesced_stack, coalesced_list, current_token = [], [], coalesced_results[0]
+        is_info_enabled = POGGER.is_info_enabled
+        is_debug_enabled = POGGER.is_debug_enabled
+        if is_info_enabled:
+            POGGER.info("coalesced_results")
+            POGGER.info("-----")
+            for next_token in coalesced_results:
+                POGGER.info(">>$<<", next_token)
+            POGGER.info("-----")
+
+        coalesced_stack, coalesced_list = [], []
         coalesced_list.extend(coalesced_results[0:1])
-
-        POGGER.debug("STACK?:$", current_token)
-        if current_token.is_container:
-            POGGER.debug("STACK:$", coalesced_stack)
-            coalesced_stack.append(current_token)
-            POGGER.debug("STACK-ADD:$", current_token)
-            POGGER.debug("STACK:$", coalesced_stack)
+        InlineProcessor.__update_coalesced_stack(
+            coalesced_stack, coalesced_results[0], is_debug_enabled
+        )
 
         for coalesce_index in range(1, len(coalesced_results)):
-            if coalesced_results[coalesce_index].is_text and (
+            current_token = coalesced_results[coalesce_index]
+            if current_token.is_text and (
                 coalesced_list[-1].is_paragraph
                 or coalesced_list[-1].is_setext_heading
                 or coalesced_list[-1].is_atx_heading
                 or coalesced_list[-1].is_code_block
             ):
-                POGGER.info("coalesced_results:$<", coalesced_list[-1])
+                if is_info_enabled:
+                    POGGER.info("coalesced_results:$<", coalesced_list[-1])
                 if coalesced_list[-1].is_code_block:
-                    encoded_text = InlineHelper.append_text(
-                        "", coalesced_results[coalesce_index].token_text
-                    )
-                    line_number_delta, new_column_number = (
-                        0,
-                        coalesced_list[-1].column_number,
-                    )
-                    if coalesced_list[-1].is_fenced_code_block:
-                        line_number_delta, new_column_number = 1, 1
-
-                        POGGER.info("coalesced_stack:$<", coalesced_stack)
-                        if coalesced_stack:
-                            assert coalesced_stack[-1].leading_spaces
-                            split_leading_spaces = coalesced_stack[
-                                -1
-                            ].leading_spaces.split(ParserHelper.newline_character)
-                            new_column_number += (
-                                (len(split_leading_spaces[1]))
-                                if len(split_leading_spaces) >= 2
-                                else (len(split_leading_spaces[0]))
-                            )
-                        else:
-                            leading_whitespace = coalesced_results[
-                                coalesce_index
-                            ].extracted_whitespace
-                            POGGER.debug(">>$<<", coalesced_results[coalesce_index])
-                            assert (
-                                ParserHelper.newline_character not in leading_whitespace
-                            )
-                            POGGER.info(
-                                "leading_whitespace:$<",
-                                leading_whitespace,
-                            )
-                            leading_whitespace = ParserHelper.remove_all_from_text(
-                                leading_whitespace
-                            )
-                            POGGER.info("leading_whitespace:$<", leading_whitespace)
-                            new_column_number += len(leading_whitespace)
-                    processed_tokens = [
-                        TextMarkdownToken(
-                            encoded_text,
-                            coalesced_results[coalesce_index].extracted_whitespace,
-                            line_number=coalesced_list[-1].line_number
-                            + line_number_delta,
-                            column_number=new_column_number,
-                        )
-                    ]
-                    POGGER.debug(
-                        "new Text>>$>>",
-                        processed_tokens,
+                    processed_tokens = InlineProcessor.__process_code_block_text(
+                        coalesced_list[-1],
+                        current_token,
+                        coalesced_stack,
+                        is_info_enabled,
+                        is_debug_enabled,
                     )
                 elif coalesced_list[-1].is_setext_heading:
-                    combined_text, combined_whitespace_text = (
-                        coalesced_results[coalesce_index].token_text,
-                        coalesced_results[coalesce_index].extracted_whitespace.replace(
-                            ParserHelper.tab_character, "    "
-                        ),
-                    )
-                    POGGER.debug(
-                        "combined_text>>$",
-                        combined_text,
-                    )
-                    POGGER.debug(
-                        "combined_whitespace_text>>$",
-                        combined_whitespace_text,
-                    )
-                    processed_tokens = InlineProcessor.__process_inline_text_block(
-                        coalesced_results[coalesce_index].token_text.replace(
-                            ParserHelper.tab_character, "    "
-                        ),
-                        whitespace_to_recombine=combined_whitespace_text,
-                        is_setext=True,
-                        para_space=coalesced_results[
-                            coalesce_index
-                        ].extracted_whitespace,
-                        line_number=coalesced_results[coalesce_index].line_number,
-                        column_number=coalesced_results[coalesce_index].column_number,
-                    )
-                    POGGER.debug(
-                        "processed_tokens>>$",
-                        processed_tokens,
+                    processed_tokens = InlineProcessor.__process_setext_text(
+                        current_token, is_debug_enabled
                     )
                 elif coalesced_list[-1].is_atx_heading:
-                    POGGER.debug("atx-block>>$<<", coalesced_results[coalesce_index])
-                    POGGER.debug(
-                        "atx-block-text>>$<<",
-                        coalesced_results[coalesce_index].token_text,
-                    )
-                    POGGER.debug(
-                        "atx-block-ws>>$<<",
-                        coalesced_results[coalesce_index].extracted_whitespace,
-                    )
-                    processed_tokens = InlineProcessor.__process_inline_text_block(
-                        coalesced_results[coalesce_index].token_text,
-                        coalesced_results[coalesce_index].extracted_whitespace,
-                        line_number=coalesced_results[coalesce_index].line_number,
-                        column_number=coalesced_results[coalesce_index].column_number
-                        + len(coalesced_results[coalesce_index].extracted_whitespace)
-                        + coalesced_list[-1].hash_count,
+                    processed_tokens = InlineProcessor.__process_atx_text(
+                        coalesced_list[-1], current_token, is_debug_enabled
                     )
                 else:
-                    assert coalesced_list[-1].is_paragraph
-                    POGGER.debug(
-                        ">>before_add_ws>>$>>add>>$>>",
-                        coalesced_list[-1],
-                        coalesced_results[coalesce_index].extracted_whitespace,
-                    )
-                    coalesced_list[-1].add_whitespace(
-                        coalesced_results[coalesce_index].extracted_whitespace.replace(
-                            ParserHelper.tab_character, "    "
-                        )
-                    )
-                    POGGER.debug(">>after_add_ws>>$", coalesced_list[-1])
-                    processed_tokens = InlineProcessor.__process_inline_text_block(
-                        coalesced_results[coalesce_index].token_text.replace(
-                            ParserHelper.tab_character, "    "
-                        ),
-                        is_para=True,
-                        para_space=coalesced_results[
-                            coalesce_index
-                        ].extracted_whitespace,
-                        line_number=coalesced_results[coalesce_index].line_number,
-                        column_number=coalesced_results[coalesce_index].column_number,
-                        para_owner=coalesced_list[-1],
+                    processed_tokens = InlineProcessor.__process_paragraph_text(
+                        coalesced_list[-1], current_token, is_debug_enabled
                     )
                 coalesced_list.extend(processed_tokens)
             else:
-                coalesced_list.append(coalesced_results[coalesce_index])
+                coalesced_list.append(current_token)
 
-            current_token = coalesced_results[coalesce_index]
+            InlineProcessor.__update_coalesced_stack(
+                coalesced_stack, current_token, is_debug_enabled
+            )
+        return coalesced_list
+
+    @staticmethod
+    def __update_coalesced_stack(coalesced_stack, current_token, is_debug_enabled):
+        if is_debug_enabled:
             POGGER.debug("STACK?:$", current_token)
-            if current_token.is_container and not current_token.is_new_list_item:
+        if current_token.is_container and not current_token.is_new_list_item:
+            if is_debug_enabled:
                 POGGER.debug("STACK:$", coalesced_stack)
-                coalesced_stack.append(current_token)
+            coalesced_stack.append(current_token)
+            if is_debug_enabled:
                 POGGER.debug("STACK-ADD:$", current_token)
                 POGGER.debug("STACK:$", coalesced_stack)
-
-            elif current_token.is_list_end or current_token.is_block_quote_end:
+        elif current_token.is_list_end or current_token.is_block_quote_end:
+            if is_debug_enabled:
                 POGGER.debug("STACK:$", coalesced_stack)
-                del coalesced_stack[-1]
+            del coalesced_stack[-1]
+            if is_debug_enabled:
                 POGGER.debug(
                     "STACK-REMOVE:$",
                     current_token,
                 )
                 POGGER.debug("STACK:$", coalesced_stack)
-        return coalesced_list
 
-    # pylint: enable=too-many-branches, too-many-statements, too-many-nested-blocks
+    @staticmethod
+    def __process_code_block_text(
+        code_block_token, text_token, coalesced_stack, is_info_enabled, is_debug_enabled
+    ):
+        encoded_text = InlineHelper.append_text("", text_token.token_text)
+        line_number_delta, new_column_number = (0, code_block_token.column_number)
+        if code_block_token.is_fenced_code_block:
+            line_number_delta, new_column_number = 1, 1
+
+            if is_info_enabled:
+                POGGER.info("coalesced_stack:$<", coalesced_stack)
+            if coalesced_stack:
+                assert coalesced_stack[-1].leading_spaces
+                split_leading_spaces = coalesced_stack[-1].leading_spaces.split(
+                    ParserHelper.newline_character
+                )
+                new_column_number += (
+                    (len(split_leading_spaces[1]))
+                    if len(split_leading_spaces) >= 2
+                    else (len(split_leading_spaces[0]))
+                )
+            else:
+                leading_whitespace = text_token.extracted_whitespace
+                if is_debug_enabled:
+                    POGGER.debug(">>$<<", text_token)
+                assert ParserHelper.newline_character not in leading_whitespace
+                if is_info_enabled:
+                    POGGER.info(
+                        "leading_whitespace:$<",
+                        leading_whitespace,
+                    )
+                leading_whitespace = ParserHelper.remove_all_from_text(
+                    leading_whitespace
+                )
+                if is_info_enabled:
+                    POGGER.info("leading_whitespace:$<", leading_whitespace)
+                new_column_number += len(leading_whitespace)
+        processed_tokens = [
+            TextMarkdownToken(
+                encoded_text,
+                text_token.extracted_whitespace,
+                line_number=code_block_token.line_number + line_number_delta,
+                column_number=new_column_number,
+            )
+        ]
+        if is_debug_enabled:
+            POGGER.debug(
+                "new Text>>$>>",
+                processed_tokens,
+            )
+        return processed_tokens
+
+    @staticmethod
+    def __process_setext_text(text_token, is_debug_enabled):
+        combined_text, combined_whitespace_text = (
+            text_token.token_text,
+            text_token.extracted_whitespace.replace(ParserHelper.tab_character, "    "),
+        )
+        if is_debug_enabled:
+            POGGER.debug(
+                "combined_text>>$",
+                combined_text,
+            )
+            POGGER.debug(
+                "combined_whitespace_text>>$",
+                combined_whitespace_text,
+            )
+        processed_tokens = InlineProcessor.__process_inline_text_block(
+            text_token.token_text.replace(ParserHelper.tab_character, "    "),
+            whitespace_to_recombine=combined_whitespace_text,
+            is_setext=True,
+            para_space=text_token.extracted_whitespace,
+            line_number=text_token.line_number,
+            column_number=text_token.column_number,
+        )
+        if is_debug_enabled:
+            POGGER.debug(
+                "processed_tokens>>$",
+                processed_tokens,
+            )
+        return processed_tokens
+
+    @staticmethod
+    def __process_atx_text(atx_token, text_token, is_debug_enabled):
+        if is_debug_enabled:
+            POGGER.debug("atx-block>>$<<", text_token)
+            POGGER.debug("atx-block-text>>$<<", text_token.token_text)
+            POGGER.debug("atx-block-ws>>$<<", text_token.extracted_whitespace)
+        return InlineProcessor.__process_inline_text_block(
+            text_token.token_text,
+            text_token.extracted_whitespace,
+            line_number=text_token.line_number,
+            column_number=text_token.column_number
+            + len(text_token.extracted_whitespace)
+            + atx_token.hash_count,
+        )
+
+    @staticmethod
+    def __process_paragraph_text(paragraph_token, text_token, is_debug_enabled):
+        assert paragraph_token.is_paragraph
+        if is_debug_enabled:
+            POGGER.debug(
+                ">>before_add_ws>>$>>add>>$>>",
+                paragraph_token,
+                text_token.extracted_whitespace,
+            )
+        paragraph_token.add_whitespace(
+            text_token.extracted_whitespace.replace(ParserHelper.tab_character, "    ")
+        )
+        if is_debug_enabled:
+            POGGER.debug(">>after_add_ws>>$", paragraph_token)
+        return InlineProcessor.__process_inline_text_block(
+            text_token.token_text.replace(ParserHelper.tab_character, "    "),
+            is_para=True,
+            para_space=text_token.extracted_whitespace,
+            line_number=text_token.line_number,
+            column_number=text_token.column_number,
+            para_owner=paragraph_token,
+        )
 
     @staticmethod
     def __handle_inline_special_single_character(inline_request):
@@ -293,6 +314,7 @@ class InlineProcessor:
             inline_request.source_text,
             inline_request.next_index,
             inline_request.inline_blocks,
+            inline_request.delimiter_stack,
             1,
             inline_request.remaining_line,
             inline_request.current_string_unresolved,
@@ -312,6 +334,7 @@ class InlineProcessor:
                 inline_request.source_text,
                 inline_request.next_index,
                 inline_request.inline_blocks,
+                inline_request.delimiter_stack,
                 2,
                 inline_request.remaining_line,
                 inline_request.current_string_unresolved,
@@ -335,6 +358,7 @@ class InlineProcessor:
         source_text,
         next_index,
         inline_blocks,
+        delimiter_stack,
         special_length,
         remaining_line,
         current_string_unresolved,
@@ -404,6 +428,7 @@ class InlineProcessor:
                     consume_rest_of_line,
                 ) = LinkHelper.look_for_link_or_image(
                     inline_blocks,
+                    delimiter_stack,
                     source_text,
                     next_index,
                     remaining_line,
@@ -733,7 +758,7 @@ class InlineProcessor:
         parser.  Debugging should be uncommented only if needed.
         """
 
-        inline_blocks, start_index = [], 0
+        inline_blocks, delimiter_stack, start_index = [], DelimiterStack(), 0
         # POGGER.debug(
         #    "__process_inline_text_block>>source_text>>$>",
         #    source_text,
@@ -848,6 +873,7 @@ class InlineProcessor:
                 line_number,
                 column_number,
                 para_owner,
+                delimiter_stack,
             )
             if source_text[next_index] in InlineProcessor.__inline_character_handlers:
                 # POGGER.debug(
@@ -1047,7 +1073,7 @@ class InlineProcessor:
                     # POGGER.debug("new Text>>$>>", inline_blocks)
                     starting_whitespace = ""
 
-                inline_blocks.extend(inline_response.new_tokens)
+                delimiter_stack.append_tokens(inline_blocks, inline_response.new_tokens)
 
             # POGGER.debug(
             #     "l/c(before)>>$,$<<",
@@ -1139,6 +1165,7 @@ class InlineProcessor:
         # )
         return InlineProcessor.__complete_inline_block_processing(
             inline_blocks,
+            delimiter_stack,
             source_text,
             start_index,
             current_string,
@@ -1276,6 +1303,7 @@ class InlineProcessor:
     # pylint: disable=too-many-arguments
     def __complete_inline_block_processing(
         inline_blocks,
+        delimiter_stack,
         source_text,
         start_index,
         current_string,
@@ -1332,7 +1360,7 @@ class InlineProcessor:
             )
         POGGER.debug(">>$<<", inline_blocks)
 
-        return EmphasisHelper.resolve_inline_emphasis(inline_blocks, None)
+        return EmphasisHelper.resolve_inline_emphasis(inline_blocks, delimiter_stack)
 
     # pylint: enable=too-many-arguments
 
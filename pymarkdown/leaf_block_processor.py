@@ -42,6 +42,36 @@ class LeafBlockProcessor:
     __thematic_break_characters = "*_-"
     __atx_character = "#"
     __setext_characters = "-="
+    __non_paragraph_start_characters = frozenset(
+        f"{__fenced_code_block_start_characters}{__thematic_break_characters}"
+        + f"{__atx_character}{__setext_characters}<["
+    )
+
+    @staticmethod
+    def is_paragraph_only(parser_state, position_marker, extracted_whitespace):
+        """
+        Determine if the line can only start or continue a paragraph, going by
+        its first non-whitespace character and its indentation.  This is true if
+        no leaf block is in progress other than a paragraph, and the character
+        cannot start any other leaf block.  Unless a paragraph is being
+        continued, the line must also not be indented, so that it cannot start
+        an indented code block.
+        """
+
+        if position_marker.index_number >= len(position_marker.text_to_parse) or (
+            position_marker.text_to_parse[position_marker.index_number]
+            in LeafBlockProcessor.__non_paragraph_start_characters
+        ):
+            return False
+        top_stack_token = parser_state.token_stack[-1]
+        return top_stack_token.is_paragraph or (
+            not extracted_whitespace
+            and (
+                top_stack_token.is_document
+                or top_stack_token.is_list
+                or top_stack_token.is_block_quote
+            )
+        )
 
     @staticmethod
     def is_fenced_code_block(line_to_parse, start_index, extracted_whitespace):
@@ -923,8 +953,9 @@ class LeafBlockProcessor:
         # In cases where the list ended on the same line as we are processing, the
         # container tokens will not yet be added to the token_document.  As such,
         # make sure to construct a "proper" list that takes those into account
-        # before checking to see if this is an issue.
-        adjusted_document = parser_state.token_document[:]
+        # before checking to see if this is an issue.  Only the last two tokens
+        # are checked, so only those are copied.
+        adjusted_document = parser_state.token_document[-2:]
         if parser_state.same_line_container_tokens:
             adjusted_document.extend(parser_state.same_line_container_tokens)
 
@@ -10,6 +10,8 @@ class LeafMarkdownToken(MarkdownToken):
     Class to provide for a leaf element that can be added to markdown parsing stream.
     """
 
+    __slots__ = ("__extracted_whitespace",)
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -53,6 +55,8 @@ class BlankLineMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the blank line element.
     """
 
+    __slots__ = ()
+
     def __init__(self, extracted_whitespace, position_marker, column_delta=0):
 
         if position_marker:
@@ -78,11 +82,18 @@ class BlankLineMarkdownToken(LeafMarkdownToken):
 # pylint: enable=too-few-public-methods
 
 
+# pylint: disable=redefined-slots-in-subclass
 class ParagraphMarkdownToken(LeafMarkdownToken):
     """
     Class to provide for an encapsulation of the paragraph element.
     """
 
+    __slots__ = (
+        "__extracted_whitespace",
+        "__final_whitespace",
+        "rehydrate_index",
+    )
+
     def __init__(self, extracted_whitespace, position_marker):
         self.__extracted_whitespace, self.__final_whitespace, self.rehydrate_index = (
             extracted_whitespace,
@@ -96,7 +107,7 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
             position_marker=position_marker,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     @property
     def extracted_whitespace(self):
@@ -112,7 +123,7 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         """
         return self.__final_whitespace
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -132,7 +143,7 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         self.__extracted_whitespace = (
             f"{self.__extracted_whitespace}{whitespace_to_add}"
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     def set_final_whitespace(self, whitespace_to_set):
         """
@@ -141,7 +152,10 @@ class ParagraphMarkdownToken(LeafMarkdownToken):
         """
 
         self.__final_whitespace = whitespace_to_set
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
+
+
+# pylint: enable=redefined-slots-in-subclass
 
 
 class ThematicBreakMarkdownToken(LeafMarkdownToken):
@@ -149,6 +163,8 @@ class ThematicBreakMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the thematic break element.
     """
 
+    __slots__ = ("__rest_of_line",)
+
     def __init__(
         self, start_character, extracted_whitespace, rest_of_line, position_marker
     ):
@@ -176,6 +192,8 @@ class HtmlBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the html block element.
     """
 
+    __slots__ = ()
+
     def __init__(self, position_marker, extracted_whitespace):
         if position_marker:
             line_number, column_number = position_marker.line_number, (
@@ -204,6 +222,19 @@ class LinkReferenceDefinitionMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the link reference definition element.
     """
 
+    __slots__ = (
+        "__did_add_definition",
+        "__link_name",
+        "__link_destination",
+        "__link_title",
+        "__link_name_debug",
+        "__link_destination_whitespace",
+        "__link_destination_raw",
+        "__link_title_whitespace",
+        "__link_title_raw",
+        "__end_whitespace",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -350,6 +381,11 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the atx heading element.
     """
 
+    __slots__ = (
+        "__hash_count",
+        "__remove_trailing_count",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -372,7 +408,7 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
             requires_end_token=True,
             can_force_close=False,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -390,7 +426,7 @@ class AtxHeadingMarkdownToken(LeafMarkdownToken):
         """
         return self.__remove_trailing_count
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -411,6 +447,15 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the setext heading element.
     """
 
+    __slots__ = (
+        "__heading_character",
+        "__heading_character_count",
+        "__final_whitespace",
+        "__original_line_number",
+        "__original_column_number",
+        "__hash_count",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -450,7 +495,7 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
             requires_end_token=True,
             can_force_close=False,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -503,9 +548,9 @@ class SetextHeadingMarkdownToken(LeafMarkdownToken):
         """
 
         self.__final_whitespace = whitespace_to_set
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -532,8 +577,13 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the indented code block element.
     """
 
+    __slots__ = (
+        "__indented_whitespace",
+        "__indented_whitespace_parts",
+    )
+
     def __init__(self, extracted_whitespace, line_number, column_number):
-        self.__indented_whitespace = ""
+        self.__indented_whitespace, self.__indented_whitespace_parts = "", None
         LeafMarkdownToken.__init__(
             self,
             MarkdownToken._token_indented_code_block,
@@ -543,16 +593,18 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
             extracted_whitespace=extracted_whitespace,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     @property
     def indented_whitespace(self):
         """
         Returns any indented whitespace that comes before the text.
         """
+        if self.__indented_whitespace_parts is not None:
+            self.finish_indented_whitespace()
         return self.__indented_whitespace
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
@@ -564,10 +616,26 @@ class IndentedCodeBlockMarkdownToken(LeafMarkdownToken):
 
     def add_indented_whitespace(self, indented_whitespace):
         """
-        Add the indented whitespace that comes before the text.
+        Add the indented whitespace that comes before the text.  To avoid
+        building a new string for each line that is added, the parts are only
+        collected here, and are joined together when the indented whitespace is
+        next used, or when finish_indented_whitespace is called.
+        """
+        if self.__indented_whitespace_parts is None:
+            self.__indented_whitespace_parts = [self.__indented_whitespace]
+            self._invalidate_extra_data()
+        self.__indented_whitespace_parts.extend(
+            [ParserHelper.newline_character, indented_whitespace]
+        )
+
+    def finish_indented_whitespace(self):
         """
-        self.__indented_whitespace = f"{self.__indented_whitespace}{ParserHelper.newline_character}{indented_whitespace}"
-        self.__compose_extra_data_field()
+        Join the parts collected by any calls to the add_indented_whitespace
+        function into the indented whitespace for this token.
+        """
+        if self.__indented_whitespace_parts is not None:
+            self.__indented_whitespace = "".join(self.__indented_whitespace_parts)
+            self.__indented_whitespace_parts = None
 
 
 # pylint: disable=too-many-instance-attributes
@@ -576,6 +644,16 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
     Class to provide for an encapsulation of the fenced code block element.
     """
 
+    __slots__ = (
+        "__extracted_text",
+        "__pre_extracted_text",
+        "__extracted_whitespace_before_info_string",
+        "__text_after_extracted_text",
+        "__pre_text_after_extracted_text",
+        "__fence_character",
+        "__fence_count",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -614,7 +692,7 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
             extracted_whitespace=extracted_whitespace,
             requires_end_token=True,
         )
-        self.__compose_extra_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -667,7 +745,7 @@ class FencedCodeBlockMarkdownToken(LeafMarkdownToken):
         """
         return self.__extracted_whitespace_before_info_string
 
-    def __compose_extra_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
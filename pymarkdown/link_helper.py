@@ -25,6 +25,7 @@ class LinkHelper:
     """
 
     __link_definitions = {}
+    __missed_link_labels = None
     __link_safe_characters = "/#:?=()*!$'+,;@"
 
     __special_link_destination_characters = "%&"
@@ -58,7 +59,6 @@ class LinkHelper:
 
     __link_start_sequence = "["
     image_start_sequence = "!["
-    __valid_link_starts = [__link_start_sequence, image_start_sequence]
 
     @staticmethod
     def initialize():
@@ -66,6 +66,22 @@ class LinkHelper:
         Initialize the inline subsystem.
         """
         LinkHelper.__link_definitions = {}
+        LinkHelper.__missed_link_labels = None
+
+    @staticmethod
+    def record_missed_link_labels(missed_link_labels):
+        """
+        Start recording the label of any link reference that is looked up but
+        is not defined into the supplied set, or stop recording if None.
+        """
+        LinkHelper.__missed_link_labels = missed_link_labels
+
+    @staticmethod
+    def is_link_label_defined(link_label):
+        """
+        Determine whether a link definition exists for the normalized label.
+        """
+        return link_label in LinkHelper.__link_definitions
 
     @staticmethod
     def add_link_definition(link_name, link_value):
@@ -224,6 +240,7 @@ class LinkHelper:
     @staticmethod
     def look_for_link_or_image(
         inline_blocks,
+        delimiter_stack,
         source_text,
         next_index,
         remaining_line,
@@ -257,47 +274,44 @@ class LinkHelper:
         POGGER.debug("LOOKING FOR START")
         LinkHelper.__display_specials_in_tokens(inline_blocks)
 
-        valid_special_start_text, search_index = None, len(inline_blocks) - 1
-        while search_index >= 0:
-            if inline_blocks[search_index].is_special_text:
-                if POGGER.is_debug_enabled:
-                    POGGER.debug(
-                        "search_index>>$>>$",
-                        search_index,
-                        inline_blocks[search_index].show_process_emphasis(),
-                    )
-                if (
-                    inline_blocks[search_index].token_text
-                    in LinkHelper.__valid_link_starts
-                ):
-                    valid_special_start_text = inline_blocks[search_index].token_text
-                    if inline_blocks[search_index].is_active:
-                        POGGER.debug(">>>>>>$", inline_blocks)
-                        (
-                            updated_index,
-                            token_to_append,
-                            consume_rest_of_line,
-                        ) = LinkHelper.__handle_link_types(
-                            inline_blocks,
-                            search_index,
-                            source_text,
-                            new_index,
-                            valid_special_start_text,
-                            remaining_line,
-                            current_string_unresolved,
-                            xx_fn,
-                        )
-                        if updated_index != -1:
-                            is_valid = True
-                            break
+        valid_special_start_text = None
+        stack_index, search_index = delimiter_stack.last_link_start()
+        if stack_index != -1:
+            assert (
+                inline_blocks[search_index]
+                is delimiter_stack.special_tokens[stack_index]
+            )
+            if POGGER.is_debug_enabled:
+                POGGER.debug(
+                    "search_index>>$>>$",
+                    search_index,
+                    inline_blocks[search_index].show_process_emphasis(),
+                )
+            valid_special_start_text = inline_blocks[search_index].token_text
+            if inline_blocks[search_index].is_active:
+                POGGER.debug(">>>>>>$", inline_blocks)
+                (
+                    updated_index,
+                    token_to_append,
+                    consume_rest_of_line,
+                ) = LinkHelper.__handle_link_types(
+                    inline_blocks,
+                    search_index,
+                    source_text,
+                    new_index,
+                    valid_special_start_text,
+                    remaining_line,
+                    current_string_unresolved,
+                    xx_fn,
+                )
+                is_valid = updated_index != -1
 
-                    POGGER.debug("  not active:$", search_index)
-                    LinkHelper.__revert_token_to_normal_text_token(
-                        inline_blocks, search_index
-                    )
-                    break
-                POGGER.debug("  not link")
-            search_index -= 1
+            if not is_valid:
+                POGGER.debug("  not active:$", search_index)
+                LinkHelper.__revert_token_to_normal_text_token(
+                    inline_blocks, search_index
+                )
+                delimiter_stack.remove_last_link_start()
 
         POGGER.debug(
             ">>look_for_link_or_image>>$<<is_valid<<$<<$<<",
@@ -316,12 +330,16 @@ class LinkHelper:
                 or inline_blocks[search_index].is_inline_image
             )
 
+            # The tokens after the start of an image were consumed for its alt text.
+            if inline_blocks[search_index].is_inline_image:
+                delimiter_stack.remove_from(stack_index + 1)
+
             POGGER.debug(
                 "\nresolve_inline_emphasis>>$",
                 inline_blocks,
             )
             EmphasisHelper.resolve_inline_emphasis(
-                inline_blocks, inline_blocks[search_index]
+                inline_blocks, delimiter_stack, stack_index
             )
             POGGER.debug(
                 "resolve_inline_emphasis>>$\n",
@@ -331,18 +349,13 @@ class LinkHelper:
             if valid_special_start_text == LinkHelper.__link_start_sequence:
                 POGGER.debug("DEACTIVATING")
                 LinkHelper.__display_specials_in_tokens(inline_blocks)
-                for deactivate_token in inline_blocks:
-                    if deactivate_token.is_special_text:
-                        POGGER.debug(
-                            "inline_blocks>>>>>>>>>>>>>>>>>>$", deactivate_token
-                        )
-                        if (
-                            deactivate_token.token_text
-                            == LinkHelper.__link_start_sequence
-                        ):
-                            deactivate_token.deactivate()
+                delimiter_stack.deactivate_link_starts()
                 POGGER.debug("DEACTIVATED")
                 LinkHelper.__display_specials_in_tokens(inline_blocks)
+
+            # Everything from the start of the link onwards is now either part of
+            # the link or no longer active, so there is no need to look at it again.
+            delimiter_stack.remove_from(stack_index)
             return updated_index, True, token_to_append, consume_rest_of_line
         return new_index, False, token_to_append, consume_rest_of_line
 
@@ -366,6 +379,8 @@ class LinkHelper:
 
     @staticmethod
     def __display_specials_in_tokens(inline_blocks):
+        if not POGGER.is_debug_enabled:
+            return
         display_parts = []
         for deactivate_token in inline_blocks:
             if deactivate_token.is_special_text:
@@ -892,6 +907,8 @@ class LinkHelper:
         POGGER.debug("defs>>$<<", LinkHelper.__link_definitions)
         if not link_label or link_label not in LinkHelper.__link_definitions:
             update_index = -1
+            if link_label and LinkHelper.__missed_link_labels is not None:
+                LinkHelper.__missed_link_labels.add(link_label)
         else:
             POGGER.debug(link_type)
             update_index, inline_link, inline_title = (
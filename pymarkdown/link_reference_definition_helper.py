@@ -58,6 +58,7 @@ class LinkReferenceDefinitionHelper:
         )
 
         is_blank_line = not line_to_parse and not start_index
+        unjoined_line_to_parse = line_to_parse
         if parser_state.token_stack[-1].was_link_definition_started:
             was_started, lrd_stack_token = True, parser_state.token_stack[-1]
             original_stack_depth, original_document_depth = (
@@ -74,13 +75,14 @@ class LinkReferenceDefinitionHelper:
             )
             POGGER.debug(">>line_to_parse>>$<<", line_to_parse)
 
-        line_to_parse_size = len(line_to_parse)
+        line_to_parse_size, is_known_failure = len(line_to_parse), False
         if was_started:
             POGGER.debug(">>parse_link_reference_definition>>was_started")
             (
                 did_complete_lrd,
                 end_lrd_index,
                 parsed_lrd_tuple,
+                is_blank_line_sensitive,
             ) = LinkReferenceDefinitionHelper.__parse_link_reference_definition(
                 parser_state,
                 line_to_parse,
@@ -118,11 +120,18 @@ class LinkReferenceDefinitionHelper:
                     lines_to_requeue,
                     unmodified_line_to_parse,
                 )
+            else:
+                is_known_failure = (
+                    not did_complete_lrd
+                    and not is_blank_line_sensitive
+                    and unjoined_line_to_parse == remaining_line_to_parse
+                )
         else:
             (
                 did_complete_lrd,
                 end_lrd_index,
                 parsed_lrd_tuple,
+                _,
             ) = LinkReferenceDefinitionHelper.__parse_link_reference_definition(
                 parser_state,
                 line_to_parse,
@@ -151,6 +160,7 @@ class LinkReferenceDefinitionHelper:
                 unmodified_line_to_parse,
                 original_stack_depth,
                 original_document_depth,
+                is_known_failure,
             )
             did_pause_lrd = True
         if (not did_pause_lrd and was_started) or did_complete_lrd:
@@ -182,30 +192,19 @@ class LinkReferenceDefinitionHelper:
             # elements so they can be reset on the rewind.
             # i.e. icode would go back on stack, end-icode would not be in document.
             POGGER.debug(
-                ">>XXXXXX>>copy_of_last_block_quote_markdown_token:$:",
-                lrd_stack_token.copy_of_last_block_quote_markdown_token,
+                ">>XXXXXX>>last_block_quote_leading_spaces_state:$:",
+                lrd_stack_token.last_block_quote_leading_spaces_state,
             )
-            if lrd_stack_token.copy_of_last_block_quote_markdown_token:
-                POGGER.debug(
-                    ">>XXXXXX>>last_block_quote_markdown_token_index:$:",
-                    lrd_stack_token.last_block_quote_markdown_token_index,
+            if lrd_stack_token.last_block_quote_leading_spaces_state:
+                last_block_quote_markdown_token = (
+                    lrd_stack_token.last_block_quote_stack_token.matching_markdown_token
                 )
                 POGGER.debug(
                     ">>XXXXXX>>st-now:$:",
-                    parser_state.token_document[
-                        lrd_stack_token.last_block_quote_markdown_token_index
-                    ],
-                )
-
-                del parser_state.token_document[
-                    lrd_stack_token.last_block_quote_markdown_token_index
-                ]
-                parser_state.token_document.insert(
-                    lrd_stack_token.last_block_quote_markdown_token_index,
-                    lrd_stack_token.copy_of_last_block_quote_markdown_token,
+                    last_block_quote_markdown_token,
                 )
-                lrd_stack_token.last_block_quote_stack_token.reset_matching_markdown_token(
-                    lrd_stack_token.copy_of_last_block_quote_markdown_token
+                last_block_quote_markdown_token.restore_leading_spaces_state(
+                    lrd_stack_token.last_block_quote_leading_spaces_state
                 )
 
             POGGER.debug(">>XXXXXX>>original_stack_depth:$:", original_stack_depth)
@@ -309,6 +308,9 @@ class LinkReferenceDefinitionHelper:
     ):
         """
         Handle the parsing of what appears to be a link reference definition.
+
+        Along with the outcome of the parse, returns whether the parse stopped at
+        the end of the text only because the text was not followed by a blank line.
         """
         POGGER.debug("parse_link_reference_definition:$:", line_to_parse)
         POGGER.debug("start_index:$:", start_index)
@@ -318,10 +320,10 @@ class LinkReferenceDefinitionHelper:
         )
         if not did_start:
             POGGER.debug("BAIL")
-            return False, -1, None
+            return False, -1, None, False
 
         POGGER.debug("parse_link_reference_definition")
-        inline_title, inline_link = "", None
+        inline_title, inline_link, is_blank_line_sensitive = "", None, False
         keep_going, new_index, collected_destination = LinkHelper.extract_link_label(
             line_to_parse, start_index + 1
         )
@@ -336,7 +338,9 @@ class LinkReferenceDefinitionHelper:
             ) = LinkHelper.extract_link_destination(
                 line_to_parse, new_index, is_blank_line
             )
+            is_blank_line_sensitive = not keep_going and new_index == len(line_to_parse)
         if keep_going:
+            title_start_index = new_index
             (
                 keep_going,
                 new_index,
@@ -345,6 +349,13 @@ class LinkReferenceDefinitionHelper:
                 line_title_whitespace,
                 inline_raw_title,
             ) = LinkHelper.extract_link_title(line_to_parse, new_index, is_blank_line)
+            is_blank_line_sensitive = (
+                not keep_going
+                and ParserHelper.extract_any_whitespace(
+                    line_to_parse, title_start_index
+                )[0]
+                == len(line_to_parse)
+            )
         if keep_going:
             (
                 keep_going,
@@ -363,7 +374,7 @@ class LinkReferenceDefinitionHelper:
             if not normalized_destination:
                 keep_going, new_index = False, -1
         if not keep_going:
-            return False, new_index, None
+            return False, new_index, None, is_blank_line_sensitive
 
         assert new_index != -1
 
@@ -393,7 +404,7 @@ class LinkReferenceDefinitionHelper:
                 end_whitespace,
             ),
         )
-        return True, new_index, parsed_lrd_tuple
+        return True, new_index, parsed_lrd_tuple, False
 
     # pylint: enable=too-many-locals
 
@@ -408,6 +419,7 @@ class LinkReferenceDefinitionHelper:
         unmodified_line_to_parse,
         original_stack_depth,
         original_document_depth,
+        is_known_failure,
     ):
         """
         As part of processing a link reference definition, add a line to the continuation.
@@ -428,16 +440,13 @@ class LinkReferenceDefinitionHelper:
             ].last_block_quote_stack_token = parser_state.last_block_quote_stack_token
             parser_state.token_stack[
                 -1
-            ].last_block_quote_markdown_token_index = (
-                parser_state.last_block_quote_markdown_token_index
-            )
-            parser_state.token_stack[
-                -1
-            ].copy_of_last_block_quote_markdown_token = (
-                parser_state.copy_of_last_block_quote_markdown_token
+            ].last_block_quote_leading_spaces_state = (
+                parser_state.last_block_quote_leading_spaces_state
             )
         POGGER.debug(">>parse_link_reference_definition>>add>:$<<", line_to_store)
-        parser_state.token_stack[-1].add_continuation_line(line_to_store)
+        parser_state.token_stack[-1].add_continuation_line(
+            line_to_store, is_known_failure
+        )
         parser_state.token_stack[-1].add_unmodified_line(unmodified_line_to_parse)
 
     # pylint: enable=too-many-arguments
@@ -494,7 +503,9 @@ class LinkReferenceDefinitionHelper:
         """
         In cases of a hard failure, we have had continuations to the original line
         that make it a bit more difficult to figure out if we have an actual good
-        LRD in the mix somehow.  So take lines off the end while we have lines.
+        LRD in the mix somehow.  So take lines off the end while we have lines,
+        skipping the parse of any lines that the journal of the continuations
+        already knows cannot end a complete LRD.
         """
         (
             do_again,
@@ -504,35 +515,35 @@ class LinkReferenceDefinitionHelper:
             end_lrd_index,
             parsed_lrd_tuple,
         ) = (True, None, None, None, None, None)
-        parser_state.token_stack[-1].add_continuation_line(remaining_line_to_parse)
-        parser_state.token_stack[-1].add_unmodified_line(unmodified_line_to_parse)
-        while do_again and parser_state.token_stack[-1].continuation_lines:
+        lrd_stack_token = parser_state.token_stack[-1]
+        lrd_stack_token.add_continuation_line(remaining_line_to_parse)
+        lrd_stack_token.add_unmodified_line(unmodified_line_to_parse)
+        while do_again and lrd_stack_token.continuation_lines:
             POGGER.debug(
                 "continuation_lines>>$<<",
-                parser_state.token_stack[-1].continuation_lines,
+                lrd_stack_token.continuation_lines,
             )
-
-            lines_to_requeue.append(parser_state.token_stack[-1].unmodified_lines[-1])
             POGGER.debug(
                 ">>continuation_line>>$",
-                parser_state.token_stack[-1].continuation_lines[-1],
+                lrd_stack_token.continuation_lines[-1],
             )
             POGGER.debug(
                 ">>unmodified_line>>$",
-                parser_state.token_stack[-1].unmodified_lines[-1],
+                lrd_stack_token.unmodified_lines[-1],
             )
-            del parser_state.token_stack[-1].continuation_lines[-1]
-            del parser_state.token_stack[-1].unmodified_lines[-1]
+            lines_to_requeue.append(lrd_stack_token.remove_last_continuation_line())
             POGGER.debug(
                 ">>lines_to_requeue>>$>>",
                 lines_to_requeue,
             )
             POGGER.debug(
                 ">>continuation_lines>>$<<",
-                parser_state.token_stack[-1].continuation_lines,
+                lrd_stack_token.continuation_lines,
             )
             is_blank_line = True
-            line_to_parse = parser_state.token_stack[-1].get_joined_lines("")
+            if lrd_stack_token.is_known_failure:
+                continue
+            line_to_parse = lrd_stack_token.get_joined_lines("")
             line_to_parse = line_to_parse[0:-1]
             start_index, extracted_whitespace = ParserHelper.extract_whitespace(
                 line_to_parse, 0
@@ -542,6 +553,7 @@ class LinkReferenceDefinitionHelper:
                 did_complete_lrd,
                 end_lrd_index,
                 parsed_lrd_tuple,
+                _,
             ) = LinkReferenceDefinitionHelper.__parse_link_reference_definition(
                 parser_state,
                 line_to_parse,
@@ -1112,9 +1112,15 @@ class ListBlockProcessor:
                 POGGER.debug("current_container_blocks-->$", parser_state.token_stack)
                 last_stack_depth = parser_state.token_stack[-1].ws_before_marker
                 while current_start_index < last_stack_depth:
-                    last_stack_index = parser_state.token_stack.index(
-                        parser_state.token_stack[-1]
-                    )
+                    last_stack_index = len(parser_state.token_stack) - 1
+                    if POGGER.is_debug_enabled:
+                        assert last_stack_index == next(
+                            stack_index
+                            for stack_index, stack_token in enumerate(
+                                parser_state.token_stack
+                            )
+                            if stack_token is parser_state.token_stack[-1]
+                        )
                     close_tokens, _ = parser_state.close_open_blocks_fn(
                         parser_state,
                         until_this_index=last_stack_index,
@@ -2,7 +2,11 @@
 Module to provide for a simple implementation of a title case algorithm.
 """
 import argparse
+import concurrent.futures
+import contextlib
 import glob
+import inspect
+import io
 import logging
 import os
 import runpy
@@ -18,6 +22,7 @@ from pymarkdown.bad_tokenization_error import BadTokenizationError
 from pymarkdown.extension_manager import ExtensionManager
 from pymarkdown.parser_logger import ParserLogger
 from pymarkdown.plugin_manager import BadPluginError, PluginManager
+from pymarkdown.scan_cache import ScanCache
 from pymarkdown.source_providers import FileSourceProvider
 from pymarkdown.tokenized_markdown import TokenizedMarkdown
 
@@ -26,6 +31,7 @@ POGGER = ParserLogger(logging.getLogger(__name__))
 LOGGER = logging.getLogger(__name__)
 
 
+# pylint: disable=too-many-instance-attributes
 class PyMarkdownLint:
     """
     Class to provide for a simple implementation of a title case algorithm.
@@ -39,6 +45,9 @@ class PyMarkdownLint:
         "DEBUG": logging.DEBUG,
     }
 
+    __worker_instance = None
+    __worker_args = None
+
     def __init__(self):
         self.__version_number = PyMarkdownLint.__get_semantic_version()
         self.__show_stack_trace = False
@@ -49,6 +58,7 @@ class PyMarkdownLint:
         self.__extensions = ExtensionManager()
 
         self.__tokenizer = None
+        self.__scan_cache = None
         self.default_log_level = "CRITICAL"
 
     @staticmethod
@@ -71,6 +81,36 @@ class PyMarkdownLint:
             return argument
         raise ValueError(f"Value '{argument}' is not a valid log level.")
 
+    @staticmethod
+    def __jobs_type(argument):
+        """
+        Function to help argparse limit the number of jobs to positive integers.
+        """
+        try:
+            number_of_jobs = int(argument)
+        except ValueError:
+            number_of_jobs = 0
+        if number_of_jobs > 0:
+            return number_of_jobs
+        raise argparse.ArgumentTypeError(
+            f"Value '{argument}' is not a valid number of jobs."
+        )
+
+    @staticmethod
+    def __cache_entries_type(argument):
+        """
+        Function to help argparse limit the number of cache entries to positive integers.
+        """
+        try:
+            maximum_entries = int(argument)
+        except ValueError:
+            maximum_entries = 0
+        if maximum_entries > 0:
+            return maximum_entries
+        raise argparse.ArgumentTypeError(
+            f"Value '{argument}' is not a valid number of cache entries."
+        )
+
     def __parse_arguments(self):
         parser = argparse.ArgumentParser(description="Lint any found Markdown files.")
 
@@ -181,6 +221,32 @@ class PyMarkdownLint:
             default=False,
             help="recursively scan directories",
         )
+        new_sub_parser.add_argument(
+            "-j",
+            "--jobs",
+            dest="number_of_jobs",
+            metavar="JOBS",
+            action="store",
+            default=1,
+            type=PyMarkdownLint.__jobs_type,
+            help="number of processes to use when scanning files (default is 1)",
+        )
+        new_sub_parser.add_argument(
+            "--cache-dir",
+            dest="cache_directory",
+            action="store",
+            default=None,
+            help="directory used to cache scan results for unchanged files",
+        )
+        new_sub_parser.add_argument(
+            "--cache-max-entries",
+            dest="cache_maximum_entries",
+            metavar="CACHE_MAX_ENTRIES",
+            action="store",
+            default=ScanCache.default_maximum_entries,
+            type=PyMarkdownLint.__cache_entries_type,
+            help=f"maximum number of files kept in the cache (default is {ScanCache.default_maximum_entries})",
+        )
         new_sub_parser.add_argument(
             "paths",
             metavar="path",
@@ -209,44 +275,262 @@ class PyMarkdownLint:
         return path_to_test.endswith(".md")
 
     # pylint: disable=broad-except
-    def __scan_file(self, args, next_file):
+    def __scan_file(self, args, next_file, source_provider=None):
         """
         Scan a given file and call the plugin manager for any significant events.
         """
 
-        POGGER.info("Scanning file '$'.", next_file)
-        context = self.__plugins.starting_new_file(next_file)
-
-        POGGER.info("Scanning file '$' token-by-token.", next_file)
-        source_provider = FileSourceProvider(next_file)
+        if not source_provider:
+            source_provider = FileSourceProvider(next_file)
+        source_lines = source_provider.read_lines
         if args.x_test_scan_fault:
             source_provider = None
-        actual_tokens = self.__tokenizer.transform_from_provider(source_provider)
-
-        if actual_tokens and actual_tokens[-1].is_pragma:
-            self.__plugins.compile_pragmas(next_file, actual_tokens[-1].pragma_lines)
-            actual_tokens = actual_tokens[:-1]
-
-        POGGER.info("Scanning file '$' tokens.", next_file)
-        for next_token in actual_tokens:
-            POGGER.info("Processing token: $", next_token)
-            self.__plugins.next_token(context, next_token)
-
-        POGGER.info("Scanning file '$' line-by-line.", next_file)
-        source_provider = FileSourceProvider(next_file)
-        line_number = 1
-        next_line = source_provider.get_next_line()
-        while next_line is not None:
-            POGGER.info("Processing line $: $", line_number, next_line)
-            self.__plugins.next_line(context, line_number, next_line)
-            line_number += 1
-            next_line = source_provider.get_next_line()
-
-        POGGER.info("Completed scanning file '$'.", next_file)
-        self.__plugins.completed_file(context, line_number)
+
+        self.__plugins.scan_document(
+            next_file,
+            self.__tokenizer.stream_from_provider(source_provider),
+            source_lines,
+        )
 
     # pylint: enable=broad-except
 
+    # pylint: disable=protected-access,unused-private-member
+    @staticmethod
+    def initialize_scan_worker(args, properties, log_level, scan_cache):
+        """
+        Initialize the linter instance that is local to a worker process when
+        scanning with more than one job.  Each worker gets its own tokenizer and
+        plugin manager, keeping any state in those objects isolated per process.
+        """
+        logging.getLogger().setLevel(log_level)
+        ParserLogger.sync_on_next_call()
+
+        worker_instance = PyMarkdownLint()
+        worker_instance.__properties = properties
+        worker_instance.__show_stack_trace = args.show_stack_trace
+        worker_instance.__initialize_plugins(args)
+        worker_instance.__initialize_extensions(args)
+        worker_instance.__initialize_parser(args)
+        worker_instance.__scan_cache = scan_cache
+        PyMarkdownLint.__worker_instance, PyMarkdownLint.__worker_args = (
+            worker_instance,
+            args,
+        )
+
+    @staticmethod
+    def scan_file_in_worker(next_file):
+        """
+        Scan a single file within a worker process, capturing any output
+        instead of printing it so that the parent can report it in order.
+        """
+        return PyMarkdownLint.__worker_instance.__scan_file_with_captured_output(
+            PyMarkdownLint.__worker_args, next_file
+        )
+
+    # pylint: enable=protected-access,unused-private-member
+
+    # pylint: disable=broad-except
+    def __scan_file_with_captured_output(self, args, next_file):
+
+        source_provider, content_hash = FileSourceProvider(next_file), None
+        if self.__scan_cache:
+            content_hash = ScanCache.calculate_content_hash(source_provider.read_lines)
+            cached_results = self.__scan_cache.load_results(next_file, content_hash)
+            if cached_results:
+                POGGER.info("Using cached results for file '$'.", next_file)
+                return cached_results + (None,)
+
+        (
+            captured_output,
+            scan_failures_before,
+            pragma_failures_before,
+            error_details,
+        ) = (
+            io.StringIO(),
+            self.__plugins.number_of_scan_failures,
+            self.__plugins.number_of_pragma_failures,
+            None,
+        )
+        with contextlib.redirect_stdout(captured_output):
+            try:
+                self.__scan_file(args, next_file, source_provider)
+            except (BadPluginError, BadTokenizationError) as this_exception:
+                error_details = (
+                    type(this_exception).__name__,
+                    str(this_exception),
+                    traceback.format_exc() if self.__show_stack_trace else None,
+                )
+        scan_results = (
+            captured_output.getvalue(),
+            self.__plugins.number_of_scan_failures - scan_failures_before,
+            self.__plugins.number_of_pragma_failures - pragma_failures_before,
+        )
+        if self.__scan_cache and not error_details:
+            self.__scan_cache.save_results(next_file, content_hash, *scan_results)
+        return scan_results + (error_details,)
+
+    # pylint: enable=broad-except
+
+    def __scan_files_in_parallel(self, args, files_to_scan):
+        """
+        Scan the files using a pool of worker processes, reporting the results
+        in the same order as the files were provided.
+        """
+
+        POGGER.info(
+            "Scanning $ files using $ jobs.", len(files_to_scan), args.number_of_jobs
+        )
+        chunk_size = max(1, len(files_to_scan) // (args.number_of_jobs * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.number_of_jobs,
+            initializer=PyMarkdownLint.initialize_scan_worker,
+            initargs=(
+                args,
+                self.__properties,
+                logging.getLogger().level,
+                self.__scan_cache,
+            ),
+        ) as executor:
+            scan_results = executor.map(
+                PyMarkdownLint.scan_file_in_worker, files_to_scan, chunksize=chunk_size
+            )
+            failed_file, error_details = self.__report_scan_results(
+                files_to_scan, scan_results
+            )
+        self.__handle_reported_scan_error(failed_file, error_details)
+
+    def __report_scan_results(self, files_to_scan, scan_results):
+        """
+        Report the results of scanning each file, in the order of the files.  If
+        a file failed to scan, the scans that have not started are cancelled and
+        the file and its error details are returned, so that the error can be
+        handled once the pool of worker processes is shut down.
+        """
+
+        for next_file, next_result in zip(files_to_scan, scan_results):
+            (
+                captured_output,
+                scan_failure_count,
+                pragma_failure_count,
+                error_details,
+            ) = next_result
+            print(captured_output, end="")
+            self.__plugins.number_of_scan_failures += scan_failure_count
+            self.__plugins.number_of_pragma_failures += pragma_failure_count
+            if error_details:
+                scan_results.close()
+                return next_file, error_details
+        return None, None
+
+    def __handle_reported_scan_error(self, failed_file, error_details):
+        """
+        Handle the error, if any, returned by __report_scan_results for the file
+        that failed to scan.
+        """
+
+        if error_details:
+            try:
+                PyMarkdownLint.__raise_worker_scan_error(error_details)
+            except BadPluginError as this_exception:
+                self.__handle_scan_error(failed_file, this_exception)
+            except BadTokenizationError as this_exception:
+                self.__handle_scan_error(failed_file, this_exception)
+
+    @staticmethod
+    def __raise_worker_scan_error(error_details):
+        """
+        Exceptions are passed back from the workers as simple strings, so recreate
+        the original exception in this process.
+        """
+
+        error_type_name, error_message, worker_stack_trace = error_details
+        if worker_stack_trace:
+            print(worker_stack_trace, file=sys.stderr)
+        if error_type_name == BadPluginError.__name__:
+            raise BadPluginError(formatted_message=error_message)
+        raise BadTokenizationError(error_message)
+
+    def __scan_files(self, args, files_to_scan):
+
+        if args.number_of_jobs > 1 and len(files_to_scan) > 1:
+            self.__scan_files_in_parallel(args, files_to_scan)
+            return
+        if self.__scan_cache:
+            failed_file, error_details = self.__report_scan_results(
+                files_to_scan,
+                (
+                    self.__scan_file_with_captured_output(args, next_file)
+                    for next_file in files_to_scan
+                ),
+            )
+            self.__handle_reported_scan_error(failed_file, error_details)
+            return
+
+        for next_file in files_to_scan:
+            try:
+                self.__scan_file(args, next_file)
+            except BadPluginError as this_exception:
+                self.__handle_scan_error(next_file, this_exception)
+            except BadTokenizationError as this_exception:
+                self.__handle_scan_error(next_file, this_exception)
+
+    @staticmethod
+    def __calculate_added_plugin_hash(next_plugin):
+        """
+        Calculate a hash of the source file for a plugin that was added to the
+        built-in plugins, so that editing that file without changing the plugin's
+        version invalidates the cached results.  The built-in plugins are already
+        covered by the version number of the project.
+        """
+        plugin_source_path = os.path.realpath(
+            inspect.getfile(type(next_plugin.plugin_instance))
+        )
+        built_in_plugin_dir = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "plugins"
+        )
+        if os.path.dirname(plugin_source_path) == built_in_plugin_dir:
+            return None
+        return ScanCache.calculate_file_hash(plugin_source_path)
+
+    def __initialize_scan_cache(self, args):
+        """
+        Create the cache for the scan results, keyed to the current configuration.
+        """
+
+        configuration_file_contents = None
+        if args.configuration_file:
+            with open(args.configuration_file, encoding="utf-8") as configuration_file:
+                configuration_file_contents = configuration_file.read()
+
+        fingerprint_values = {
+            "version": self.__version_number,
+            "plugins": [
+                [
+                    next_plugin.plugin_id,
+                    next_plugin.plugin_version,
+                    next_plugin.plugin_file_name,
+                    PyMarkdownLint.__calculate_added_plugin_hash(next_plugin),
+                ]
+                for next_plugin in self.__plugins.enabled_plugins
+            ],
+            "extensions": [
+                [next_extension.extension_id, next_extension.extension_version]
+                for next_extension in self.__extensions.enabled_extensions
+            ],
+            "configuration_file": configuration_file_contents,
+            "set_configuration": args.set_configuration,
+            "strict_configuration": args.strict_configuration,
+        }
+        try:
+            self.__scan_cache = ScanCache(
+                args.cache_directory,
+                ScanCache.calculate_fingerprint(fingerprint_values),
+                args.cache_maximum_entries,
+            )
+        except OSError as this_exception:
+            formatted_error = f"{str(type(this_exception).__name__)} encountered while initializing scan cache:\n{str(this_exception)}"
+            self.__handle_error(formatted_error, this_exception)
+
     def __process_next_path(self, next_path, files_to_parse, recurse_directories):
 
         did_find_any = False
@@ -527,13 +811,11 @@ class PyMarkdownLint:
                     return_code = self.__handle_list_files(files_to_scan)
                     sys.exit(return_code)
 
-                for next_file in files_to_scan:
-                    try:
-                        self.__scan_file(args, next_file)
-                    except BadPluginError as this_exception:
-                        self.__handle_scan_error(next_file, this_exception)
-                    except BadTokenizationError as this_exception:
-                        self.__handle_scan_error(next_file, this_exception)
+                if args.cache_directory:
+                    self.__initialize_scan_cache(args)
+                self.__scan_files(args, files_to_scan)
+                if self.__scan_cache:
+                    self.__scan_cache.evict_entries()
         except ValueError as this_exception:
             formatted_error = f"Configuration Error: {this_exception}"
             self.__handle_error(formatted_error, this_exception)
@@ -548,5 +830,8 @@ class PyMarkdownLint:
     # pylint: enable=too-many-branches
 
 
+# pylint: enable=too-many-instance-attributes
+
+
 if __name__ == "__main__":
     PyMarkdownLint().main()
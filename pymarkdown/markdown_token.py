@@ -52,6 +52,123 @@ class MarkdownToken:
     _token_inline_link = "link"
     _token_inline_image = "image"
 
+    # Each kind of token is given its own bit, with the end of that kind of token
+    # also having the end bit set, so that the type of a token is checked with a
+    # single integer comparison instead of comparing its name.
+    _kind_end = 1
+    _kind_pragma = 1 << 1
+    _kind_paragraph = 1 << 2
+    _kind_blank_line = 1 << 3
+    _kind_atx_heading = 1 << 4
+    _kind_setext_heading = 1 << 5
+    _kind_thematic_break = 1 << 6
+    _kind_link_reference_definition = 1 << 7
+    _kind_html_block = 1 << 8
+    _kind_fenced_code_block = 1 << 9
+    _kind_indented_code_block = 1 << 10
+    _kind_block_quote = 1 << 11
+    _kind_text = 1 << 12
+    _kind_front_matter = 1 << 13
+    _kind_unordered_list_start = 1 << 14
+    _kind_ordered_list_start = 1 << 15
+    _kind_new_list_item = 1 << 16
+    _kind_inline_code_span = 1 << 17
+    _kind_inline_hard_break = 1 << 18
+    _kind_inline_uri_autolink = 1 << 19
+    _kind_inline_email_autolink = 1 << 20
+    _kind_inline_raw_html = 1 << 21
+    _kind_inline_emphasis = 1 << 22
+    _kind_inline_link = 1 << 23
+    _kind_inline_image = 1 << 24
+
+    __token_kinds = {
+        _token_pragma: _kind_pragma,
+        _token_paragraph: _kind_paragraph,
+        _token_blank_line: _kind_blank_line,
+        _token_atx_heading: _kind_atx_heading,
+        _token_setext_heading: _kind_setext_heading,
+        _token_thematic_break: _kind_thematic_break,
+        _token_link_reference_definition: _kind_link_reference_definition,
+        _token_html_block: _kind_html_block,
+        _token_fenced_code_block: _kind_fenced_code_block,
+        _token_indented_code_block: _kind_indented_code_block,
+        _token_block_quote: _kind_block_quote,
+        _token_text: _kind_text,
+        _token_front_matter: _kind_front_matter,
+        _token_unordered_list_start: _kind_unordered_list_start,
+        _token_ordered_list_start: _kind_ordered_list_start,
+        _token_new_list_item: _kind_new_list_item,
+        _token_inline_code_span: _kind_inline_code_span,
+        _token_inline_hard_break: _kind_inline_hard_break,
+        _token_inline_uri_autolink: _kind_inline_uri_autolink,
+        _token_inline_email_autolink: _kind_inline_email_autolink,
+        _token_inline_raw_html: _kind_inline_raw_html,
+        _token_inline_emphasis: _kind_inline_emphasis,
+        _token_inline_link: _kind_inline_link,
+        _token_inline_image: _kind_inline_image,
+    }
+    __block_kinds = frozenset(
+        [
+            _kind_block_quote,
+            _kind_unordered_list_start,
+            _kind_ordered_list_start,
+            _kind_thematic_break,
+            _kind_atx_heading,
+            _kind_setext_heading,
+            _kind_indented_code_block,
+            _kind_fenced_code_block,
+            _kind_html_block,
+            _kind_paragraph,
+        ]
+    )
+    __list_start_kinds = frozenset(
+        [_kind_unordered_list_start, _kind_ordered_list_start]
+    )
+    __list_end_kinds = frozenset(
+        [_kind_unordered_list_start | _kind_end, _kind_ordered_list_start | _kind_end]
+    )
+    __any_list_kinds = frozenset(
+        [_kind_unordered_list_start, _kind_ordered_list_start, _kind_new_list_item]
+    )
+    __container_end_kinds = frozenset(
+        [
+            _kind_unordered_list_start | _kind_end,
+            _kind_ordered_list_start | _kind_end,
+            _kind_block_quote | _kind_end,
+        ]
+    )
+    __leaf_end_kinds = frozenset(
+        [
+            _kind_paragraph | _kind_end,
+            _kind_atx_heading | _kind_end,
+            _kind_setext_heading | _kind_end,
+            _kind_thematic_break,
+            _kind_html_block | _kind_end,
+            _kind_fenced_code_block | _kind_end,
+            _kind_indented_code_block | _kind_end,
+        ]
+    )
+    __code_block_kinds = frozenset([_kind_indented_code_block, _kind_fenced_code_block])
+    __code_block_end_kinds = frozenset(
+        [_kind_indented_code_block | _kind_end, _kind_fenced_code_block | _kind_end]
+    )
+    __autolink_kinds = frozenset(
+        [_kind_inline_uri_autolink, _kind_inline_email_autolink]
+    )
+
+    __slots__ = (
+        "__token_name",
+        "__token_kind",
+        "__token_class",
+        "__extra_data",
+        "__line_number",
+        "__column_number",
+        "__is_extension",
+        "__requires_end_token",
+        "__can_force_close",
+        "__is_extra_data_stale",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -70,8 +187,14 @@ class MarkdownToken:
                 position_marker.line_number,
                 position_marker.index_number + position_marker.index_indent + 1,
             )
+        token_kind = MarkdownToken.__token_kinds.get(token_name, 0)
+        if not token_kind and token_name.startswith(MarkdownToken._end_token_prefix):
+            token_kind = MarkdownToken._kind_end | MarkdownToken.__token_kinds.get(
+                token_name[len(MarkdownToken._end_token_prefix) :], 0
+            )
         (
             self.__token_name,
+            self.__token_kind,
             self.__token_class,
             self.__extra_data,
             self.__line_number,
@@ -79,8 +202,10 @@ class MarkdownToken:
             self.__is_extension,
             self.__requires_end_token,
             self.__can_force_close,
+            self.__is_extra_data_stale,
         ) = (
             token_name,
+            token_kind,
             token_class,
             extra_data,
             line_number,
@@ -88,6 +213,7 @@ class MarkdownToken:
             is_extension,
             requires_end_token,
             can_force_close,
+            False,
         )
 
     # pylint: enable=too-many-arguments
@@ -143,11 +269,28 @@ class MarkdownToken:
         """
         Returns the extra data associated with the token.
         """
+        if self.__is_extra_data_stale:
+            self.__is_extra_data_stale = False
+            self._compose_extra_data_field()
         return self.__extra_data
 
     def _set_extra_data(self, extra_data):
         self.__extra_data = extra_data
 
+    def _invalidate_extra_data(self):
+        """
+        Signal that the fields that make up the extra data have changed.  As the
+        extra data is only needed to describe the token, it is not composed again
+        until the next time it is asked for.
+        """
+        self.__is_extra_data_stale = True
+
+    def _compose_extra_data_field(self):
+        """
+        Compose the extra data from the fields of the token.  Tokens whose extra
+        data is not fixed when they are created override this function.
+        """
+
     @property
     def line_number(self):
         """
@@ -191,23 +334,14 @@ class MarkdownToken:
         """
         Returns whether the current token is an end element.
         """
-        return self.token_name.startswith(MarkdownToken._end_token_prefix)
+        return bool(self.__token_kind & MarkdownToken._kind_end)
 
     @property
     def is_block(self):
         """
         Returns whether the current token is one of the block tokens.
         """
-        return (
-            self.is_block_quote_start
-            or self.is_list_start
-            or self.is_thematic_break
-            or self.is_atx_heading
-            or self.is_setext_heading
-            or self.is_code_block
-            or self.is_html_block
-            or self.is_paragraph
-        )
+        return self.__token_kind in MarkdownToken.__block_kinds
         # or tables
 
     @property
@@ -215,30 +349,29 @@ class MarkdownToken:
         """
         Returns whether the current token is the pragma element.
         """
-        return self.token_name == MarkdownToken._token_pragma
+        return self.__token_kind == MarkdownToken._kind_pragma
 
     @property
     def is_blank_line(self):
         """
         Returns whether the current token is the blank line element.
         """
-        return self.token_name == MarkdownToken._token_blank_line
+        return self.__token_kind == MarkdownToken._kind_blank_line
 
     @property
     def is_block_quote_start(self):
         """
         Returns whether the current token is a block quote.
         """
-        return self.token_name == MarkdownToken._token_block_quote
+        return self.__token_kind == MarkdownToken._kind_block_quote
 
     @property
     def is_block_quote_end(self):
         """
         Returns whether the current token is a block quote.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_block_quote
+        return self.__token_kind == (
+            MarkdownToken._kind_block_quote | MarkdownToken._kind_end
         )
 
     @property
@@ -246,38 +379,36 @@ class MarkdownToken:
         """
         Returns whether the current token is a list element.
         """
-        return self.is_unordered_list_start or self.is_ordered_list_start
+        return self.__token_kind in MarkdownToken.__list_start_kinds
 
     @property
     def is_list_end(self):
         """
         Returns whether the current token is a list end element.
         """
-        return self.is_unordered_list_end or self.is_ordered_list_end
+        return self.__token_kind in MarkdownToken.__list_end_kinds
 
     @property
     def is_unordered_list_start(self):
         """
         Returns whether the current token is a unordered list element.
         """
-        return self.token_name == MarkdownToken._token_unordered_list_start
+        return self.__token_kind == MarkdownToken._kind_unordered_list_start
 
     @property
     def is_ordered_list_start(self):
         """
         Returns whether the current token is a ordered list element.
         """
-        return self.token_name == MarkdownToken._token_ordered_list_start
+        return self.__token_kind == MarkdownToken._kind_ordered_list_start
 
     @property
     def is_unordered_list_end(self):
         """
         Returns whether the current token is a unordered list end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix
-            + MarkdownToken._token_unordered_list_start
+        return self.__token_kind == (
+            MarkdownToken._kind_unordered_list_start | MarkdownToken._kind_end
         )
 
     @property
@@ -285,9 +416,8 @@ class MarkdownToken:
         """
         Returns whether the current token is a ordered list end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_ordered_list_start
+        return self.__token_kind == (
+            MarkdownToken._kind_ordered_list_start | MarkdownToken._kind_end
         )
 
     @property
@@ -295,59 +425,43 @@ class MarkdownToken:
         """
         Returns whether the current token is an end element for a container elements.
         """
-        if self.is_list_end or self.is_block_quote_end:
-            return True
-        return False
+        return self.__token_kind in MarkdownToken.__container_end_kinds
 
-    # pylint: disable=too-many-boolean-expressions
     @property
     def is_leaf_end_token(self):
         """
         Returns whether the current token is an end element for a leaf element.
         """
-        if (
-            self.is_paragraph_end
-            or self.is_atx_heading_end
-            or self.is_setext_heading_end
-            or self.is_thematic_break
-            or self.is_html_block_end
-            or self.is_fenced_code_block_end
-            or self.is_indented_code_block_end
-        ):
-            return True
-        return False
-
-    # pylint: enable=too-many-boolean-expressions
+        return self.__token_kind in MarkdownToken.__leaf_end_kinds
 
     @property
     def is_new_list_item(self):
         """
         Returns whether the current token is a list item element.
         """
-        return self.token_name == MarkdownToken._token_new_list_item
+        return self.__token_kind == MarkdownToken._kind_new_list_item
 
     @property
     def is_any_list_token(self):
         """
         Returns whether the current token is a list item element or a list element.
         """
-        return self.is_new_list_item or self.is_list_start
+        return self.__token_kind in MarkdownToken.__any_list_kinds
 
     @property
     def is_paragraph(self):
         """
         Returns whether the current token is a paragraph element.
         """
-        return self.token_name == MarkdownToken._token_paragraph
+        return self.__token_kind == MarkdownToken._kind_paragraph
 
     @property
     def is_paragraph_end(self):
         """
         Returns whether the current token is a paragraph end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_paragraph
+        return self.__token_kind == (
+            MarkdownToken._kind_paragraph | MarkdownToken._kind_end
         )
 
     @property
@@ -355,21 +469,21 @@ class MarkdownToken:
         """
         Returns whether the current token is a thematic break element.
         """
-        return self.token_name == MarkdownToken._token_thematic_break
+        return self.__token_kind == MarkdownToken._kind_thematic_break
 
     @property
     def is_front_matter(self):
         """
         Returns whether the current token is the front matter element.
         """
-        return self.token_name == MarkdownToken._token_front_matter
+        return self.__token_kind == MarkdownToken._kind_front_matter
 
     @property
     def is_text(self):
         """
         Returns whether the current token is a text element.
         """
-        return self.token_name == MarkdownToken._token_text
+        return self.__token_kind == MarkdownToken._kind_text
 
     # pylint: disable=no-member
     @property
@@ -386,16 +500,15 @@ class MarkdownToken:
         """
         Returns whether the current token is a setext heading element.
         """
-        return self.token_name == MarkdownToken._token_setext_heading
+        return self.__token_kind == MarkdownToken._kind_setext_heading
 
     @property
     def is_setext_heading_end(self):
         """
         Returns whether the current token is a setext heading end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_setext_heading
+        return self.__token_kind == (
+            MarkdownToken._kind_setext_heading | MarkdownToken._kind_end
         )
 
     @property
@@ -403,16 +516,15 @@ class MarkdownToken:
         """
         Returns whether the current token is an atx element.
         """
-        return self.token_name == MarkdownToken._token_atx_heading
+        return self.__token_kind == MarkdownToken._kind_atx_heading
 
     @property
     def is_atx_heading_end(self):
         """
         Returns whether the current token is an atx heading end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_atx_heading
+        return self.__token_kind == (
+            MarkdownToken._kind_atx_heading | MarkdownToken._kind_end
         )
 
     @property
@@ -420,31 +532,29 @@ class MarkdownToken:
         """
         Returns whether the current token is a code block element.
         """
-        return self.is_indented_code_block or self.is_fenced_code_block
+        return self.__token_kind in MarkdownToken.__code_block_kinds
 
     @property
     def is_code_block_end(self):
         """
         Returns whether the current token is a code block end element.
         """
-        return self.is_indented_code_block_end or self.is_fenced_code_block_end
+        return self.__token_kind in MarkdownToken.__code_block_end_kinds
 
     @property
     def is_indented_code_block(self):
         """
         Returns whether the current token is an indented code block element.
         """
-        return self.token_name == MarkdownToken._token_indented_code_block
+        return self.__token_kind == MarkdownToken._kind_indented_code_block
 
     @property
     def is_indented_code_block_end(self):
         """
         Returns whether the current token is an indented code block end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix
-            + MarkdownToken._token_indented_code_block
+        return self.__token_kind == (
+            MarkdownToken._kind_indented_code_block | MarkdownToken._kind_end
         )
 
     @property
@@ -452,16 +562,15 @@ class MarkdownToken:
         """
         Returns whether the current token is a fenced code block element.
         """
-        return self.token_name == MarkdownToken._token_fenced_code_block
+        return self.__token_kind == MarkdownToken._kind_fenced_code_block
 
     @property
     def is_fenced_code_block_end(self):
         """
         Returns whether the current token is a fenced code block element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_fenced_code_block
+        return self.__token_kind == (
+            MarkdownToken._kind_fenced_code_block | MarkdownToken._kind_end
         )
 
     @property
@@ -469,23 +578,22 @@ class MarkdownToken:
         """
         Returns whether the current token is a link reference definition element.
         """
-        return self.token_name == MarkdownToken._token_link_reference_definition
+        return self.__token_kind == MarkdownToken._kind_link_reference_definition
 
     @property
     def is_html_block(self):
         """
         Returns whether the current token is a html block element.
         """
-        return self.token_name == MarkdownToken._token_html_block
+        return self.__token_kind == MarkdownToken._kind_html_block
 
     @property
     def is_html_block_end(self):
         """
         Returns whether the current token is a html block element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_html_block
+        return self.__token_kind == (
+            MarkdownToken._kind_html_block | MarkdownToken._kind_end
         )
 
     @property
@@ -493,58 +601,57 @@ class MarkdownToken:
         """
         Returns whether the current token is a code span element.
         """
-        return self.token_name == MarkdownToken._token_inline_code_span
+        return self.__token_kind == MarkdownToken._kind_inline_code_span
 
     @property
     def is_inline_hard_break(self):
         """
         Returns whether the current token is a hard break element.
         """
-        return self.token_name == MarkdownToken._token_inline_hard_break
+        return self.__token_kind == MarkdownToken._kind_inline_hard_break
 
     @property
     def is_inline_autolink(self):
         """
         Returns whether the current token is an uri autolink or an email autolink element.
         """
-        return self.is_inline_uri_autolink or self.is_inline_email_autolink
+        return self.__token_kind in MarkdownToken.__autolink_kinds
 
     @property
     def is_inline_uri_autolink(self):
         """
         Returns whether the current token is an uri autolink element.
         """
-        return self.token_name == MarkdownToken._token_inline_uri_autolink
+        return self.__token_kind == MarkdownToken._kind_inline_uri_autolink
 
     @property
     def is_inline_email_autolink(self):
         """
         Returns whether the current token is an email autolink element.
         """
-        return self.token_name == MarkdownToken._token_inline_email_autolink
+        return self.__token_kind == MarkdownToken._kind_inline_email_autolink
 
     @property
     def is_inline_raw_html(self):
         """
         Returns whether the current token is an email autolink element.
         """
-        return self.token_name == MarkdownToken._token_inline_raw_html
+        return self.__token_kind == MarkdownToken._kind_inline_raw_html
 
     @property
     def is_inline_emphasis(self):
         """
         Returns whether the current token is an emphasis element.
         """
-        return self.token_name == MarkdownToken._token_inline_emphasis
+        return self.__token_kind == MarkdownToken._kind_inline_emphasis
 
     @property
     def is_inline_emphasis_end(self):
         """
         Returns whether the current token is an emphasis end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_inline_emphasis
+        return self.__token_kind == (
+            MarkdownToken._kind_inline_emphasis | MarkdownToken._kind_end
         )
 
     @property
@@ -552,16 +659,15 @@ class MarkdownToken:
         """
         Returns whether the current token is a link element.
         """
-        return self.token_name == MarkdownToken._token_inline_link
+        return self.__token_kind == MarkdownToken._kind_inline_link
 
     @property
     def is_inline_link_end(self):
         """
         Returns whether the current token is a link end element.
         """
-        return (
-            self.token_name
-            == MarkdownToken._end_token_prefix + MarkdownToken._token_inline_link
+        return self.__token_kind == (
+            MarkdownToken._kind_inline_link | MarkdownToken._kind_end
         )
 
     @property
@@ -569,7 +675,7 @@ class MarkdownToken:
         """
         Returns whether the current token is an image element.
         """
-        return self.token_name == MarkdownToken._token_inline_image
+        return self.__token_kind == MarkdownToken._kind_inline_image
 
     # pylint: disable=too-many-arguments
     def generate_close_markdown_token_from_markdown_token(
@@ -604,6 +710,14 @@ class EndMarkdownToken(MarkdownToken):
     Class to provide for an encapsulation of the end element to a matching start.
     """
 
+    __slots__ = (
+        "__type_name",
+        "__extracted_whitespace",
+        "__extra_end_data",
+        "__start_markdown_token",
+        "__was_forced",
+    )
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -646,7 +760,7 @@ class EndMarkdownToken(MarkdownToken):
             line_number=line_number,
             column_number=column_number,
         )
-        self.__compose_data_field()
+        self._invalidate_extra_data()
 
     # pylint: enable=too-many-arguments
 
@@ -685,7 +799,7 @@ class EndMarkdownToken(MarkdownToken):
         """
         return self.__was_forced
 
-    def __compose_data_field(self):
+    def _compose_extra_data_field(self):
         """
         Compose the object's self.extra_data field from the local object's variables.
         """
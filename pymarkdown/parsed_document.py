@@ -0,0 +1,68 @@
+"""
+Module to provide for the results of parsing a single Markdown document.
+"""
+import pickle
+
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+
+class ParsedDocument:
+    """
+    Class to provide for the results of parsing a single Markdown document,
+    namely its tokens, the lines of its source and any pragmas within it.
+
+    Once a document is parsed, the same object can be scanned by the rules,
+    rendered as HTML, or used to get back to the Markdown, without having to
+    parse the document again.  The object can also be serialized, so that the
+    parsing can be done in one process and the consuming in another.
+    """
+
+    def __init__(self, scan_name, source_lines, tokens, pragma_lines):
+        self.scan_name, self.source_lines = scan_name, source_lines
+        self.tokens, self.pragma_lines = tokens, pragma_lines
+
+    @staticmethod
+    def from_provider(tokenizer, scan_name, source_provider, source_lines):
+        """
+        Parse the data from the source provider with the tokenizer.
+        """
+        actual_tokens, pragma_lines = (
+            tokenizer.transform_from_provider(source_provider),
+            {},
+        )
+        if actual_tokens and actual_tokens[-1].is_pragma:
+            pragma_lines = actual_tokens[-1].pragma_lines
+            actual_tokens = actual_tokens[:-1]
+        return ParsedDocument(scan_name, source_lines, actual_tokens, pragma_lines)
+
+    @staticmethod
+    def from_bytes(serialized_document):
+        """
+        Create a parsed document from the result of a call to to_bytes.  As with
+        any pickled data, this should only be used with data that is trusted.
+        """
+        parsed_document = pickle.loads(serialized_document)
+        if not isinstance(parsed_document, ParsedDocument):
+            raise ValueError("Serialized data does not contain a parsed document.")
+        return parsed_document
+
+    def to_bytes(self):
+        """
+        Serialize the parsed document so that it can be passed to another process.
+        """
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @property
+    def source_text(self):
+        """
+        Get the Markdown that was parsed.
+        """
+        return "\n".join(self.source_lines)
+
+    def to_html(self, output_stream=None):
+        """
+        Render the parsed document as GitHub Flavored Markdown HTML.  If an output
+        stream is supplied, the HTML is written to that stream instead of being
+        returned.
+        """
+        return TransformToGfm().transform(self.tokens, output_stream)
@@ -1,7 +1,8 @@
 """
 Module to provide helper functions for parsing.
 """
-import copy
+import itertools
+import re
 
 
 # pylint: disable=too-many-lines
@@ -25,8 +26,21 @@ class ParserHelper:
 
     all_escape_characters = f"{__backspace_character}{__alert_character}{whitespace_split_character}{replace_noop_character}{blech_character}{escape_character}"
 
+    __resolvable_markers_regex = re.compile(
+        f"[{__backspace_character}{__alert_character}{replace_noop_character}{blech_character}{escape_character}]"
+    )
+
+    __collect_until_regex_cache = {}
+
     backslash_escape_sequence = f"{backslash_character}{__backspace_character}"
 
+    text_span = "text"
+    escape_span = "escape"
+    backslash_span = "backslash"
+    replacement_span = "replacement"
+    noop_span = "noop"
+    blech_span = "blech"
+
     @staticmethod
     def is_character_at_index(source_string, index_in_string, valid_character):
         """
@@ -303,11 +317,16 @@ class ParserHelper:
         if not 0 <= start_index <= source_string_size:
             return None, None
 
-        index = start_index
-        while (
-            index < source_string_size and source_string[index] not in match_characters
-        ):
-            index += 1
+        collect_regex = ParserHelper.__collect_until_regex_cache.get(match_characters)
+        if collect_regex is None:
+            collect_regex = re.compile(
+                f"[^{re.escape(''.join(match_characters))}]*"
+                if match_characters
+                else ".*",
+                re.DOTALL,
+            )
+            ParserHelper.__collect_until_regex_cache[match_characters] = collect_regex
+        index = collect_regex.match(source_string, start_index).end()
 
         return index, source_string[start_index:index]
 
@@ -424,10 +443,9 @@ class ParserHelper:
             split_raw_tag = text_to_analyze.split(ParserHelper.newline_character)
             delta_line_number += len(split_raw_tag) - 1
 
-            last_element = ParserHelper.__resolve_replacement_markers_from_text(
-                split_raw_tag[-1]
+            last_element = ParserHelper.__scan_markers_from_text(
+                split_raw_tag[-1], False, is_removing_backspaces=False
             )
-            last_element = ParserHelper.__remove_escapes_from_text(last_element)
             length_of_last_elements = len(last_element)
 
             delta_column_number = -(length_of_last_elements + 1)
@@ -532,26 +550,6 @@ class ParserHelper:
             string_parts.append(next_character)
         return "".join(string_parts)
 
-    @staticmethod
-    def __remove_backspaces_from_text(token_text):
-        """
-        Remove any backspaces from the text.
-        """
-        start_index, adjusted_text_token = 0, token_text[0:]
-        next_backspace_index = ParserHelper.__find_with_escape(
-            adjusted_text_token, ParserHelper.__backspace_character, start_index
-        )
-        while next_backspace_index != -1:
-            adjusted_text_token = (
-                adjusted_text_token[0:next_backspace_index]
-                + adjusted_text_token[next_backspace_index + 1 :]
-            )
-            start_index = next_backspace_index
-            next_backspace_index = ParserHelper.__find_with_escape(
-                adjusted_text_token, ParserHelper.__backspace_character, start_index
-            )
-        return adjusted_text_token
-
     @staticmethod
     def resolve_backspaces_from_text(token_text):
         """
@@ -592,21 +590,18 @@ class ParserHelper:
         """
         Resolve the specific character out of the text string.
         """
-        start_index = 0
-        adjusted_text_token = token_text[0:]
-        next_backspace_index = ParserHelper.__find_with_escape(
-            adjusted_text_token, sequence_to_remove, start_index
+        text_parts, start_index = [], 0
+        next_sequence_index = ParserHelper.__find_with_escape(
+            token_text, sequence_to_remove, start_index
         )
-        while next_backspace_index != -1:
-            adjusted_text_token = (
-                adjusted_text_token[0:next_backspace_index]
-                + adjusted_text_token[next_backspace_index + 1 :]
-            )
-            start_index = next_backspace_index
-            next_backspace_index = ParserHelper.__find_with_escape(
-                adjusted_text_token, sequence_to_remove, start_index
+        while next_sequence_index != -1:
+            text_parts.append(token_text[start_index:next_sequence_index])
+            start_index = next_sequence_index + 1
+            next_sequence_index = ParserHelper.__find_with_escape(
+                token_text, sequence_to_remove, start_index
             )
-        return adjusted_text_token
+        text_parts.append(token_text[start_index:])
+        return "".join(text_parts)
 
     @staticmethod
     def resolve_noops_from_text(token_text):
@@ -617,96 +612,6 @@ class ParserHelper:
             token_text, ParserHelper.replace_noop_character
         )
 
-    @staticmethod
-    def __resolve_blechs_from_text(token_text):
-        """
-        Resolve the blech character out of the text string.
-        """
-        return ParserHelper.__remove_sequence_from_text(
-            token_text, ParserHelper.blech_character
-        )
-
-    @staticmethod
-    def __resolve_escapes_from_text(token_text):
-        """
-        Resolve any escapes from the text, leaving only what they escaped.
-        """
-        start_index, adjusted_text_token = 0, token_text[0:]
-        next_backspace_index = ParserHelper.__find_with_escape(
-            adjusted_text_token, ParserHelper.escape_character, start_index
-        )
-        while next_backspace_index != -1:
-            adjusted_text_token = (
-                adjusted_text_token[0:next_backspace_index]
-                + adjusted_text_token[next_backspace_index + 1 :]
-            )
-            start_index = next_backspace_index + 1
-            next_backspace_index = ParserHelper.__find_with_escape(
-                adjusted_text_token, ParserHelper.escape_character, start_index
-            )
-        return adjusted_text_token
-
-    @staticmethod
-    def __remove_escapes_from_text(token_text):
-        """
-        Remove any escape characters from the text.
-        """
-        return ParserHelper.__resolve_escapes_from_text(token_text)
-
-    @staticmethod
-    def __resolve_replacement_markers_from_text(main_text):
-        """
-        Resolve the alert characters (i.e. replacement markers) out of the text string.
-        """
-        start_index = 0
-        start_replacement_index = ParserHelper.__find_with_escape(
-            main_text, ParserHelper.__alert_character, start_index
-        )
-        while start_replacement_index != -1:
-            middle_replacement_index = main_text.index(
-                ParserHelper.__alert_character, start_replacement_index + 1
-            )
-            end_replacement_index = main_text.index(
-                ParserHelper.__alert_character, middle_replacement_index + 1
-            )
-
-            replace_text = main_text[
-                start_replacement_index + 1 : middle_replacement_index
-            ]
-
-            # It is possible to have one level of nesting, so deal with it.
-            if middle_replacement_index + 1 == end_replacement_index:
-                inner_start_replacement_index = main_text.index(
-                    ParserHelper.__alert_character, end_replacement_index + 1
-                )
-                inner_middle_replacement_index = main_text.index(
-                    ParserHelper.__alert_character, inner_start_replacement_index + 1
-                )
-                inner_end_replacement_index = main_text.index(
-                    ParserHelper.__alert_character, inner_middle_replacement_index + 1
-                )
-                assert inner_middle_replacement_index + 1 == inner_end_replacement_index
-                end_replacement_index = inner_end_replacement_index
-
-            length_before_mod = len(main_text)
-            main_text = (
-                (
-                    main_text[0:start_replacement_index]
-                    + replace_text
-                    + main_text[end_replacement_index + 1 :]
-                )
-                if start_replacement_index
-                else (replace_text + main_text[end_replacement_index + 1 :])
-            )
-            length_after_mod = len(main_text)
-            start_index = (
-                end_replacement_index + 1 + (length_after_mod - length_before_mod)
-            )
-            start_replacement_index = ParserHelper.__find_with_escape(
-                main_text, ParserHelper.__alert_character, start_index
-            )
-        return main_text
-
     @staticmethod
     def __find_with_escape(adjusted_text_token, find_char, start_index):
         repeat_me, found_index = True, -1
@@ -726,83 +631,173 @@ class ParserHelper:
         return found_index
 
     @staticmethod
-    def __resolve_references_from_text(adjusted_text_token):
+    def __find_replacement_marker_text(source_text, start_index, is_resolving):
         """
-        The alert characters signal that a replacement has occurred, so make sure
-        we take the right text from the replacement.
+        Given the index of the alert character that starts a replacement marker,
+        find the text to use in place of that marker and the index after it.
+        If resolving, this is the replacement text, otherwise the original text.
         """
-        start_index = 0
-        start_replacement_index = ParserHelper.__find_with_escape(
-            adjusted_text_token, ParserHelper.__alert_character, start_index
+        middle_index = source_text.index(
+            ParserHelper.__alert_character, start_index + 1
         )
-        while start_replacement_index != -1:
-            middle_replacement_index = adjusted_text_token.index(
-                ParserHelper.__alert_character, start_replacement_index + 1
+        end_index = source_text.index(ParserHelper.__alert_character, middle_index + 1)
+        replace_text = (
+            source_text[middle_index + 1 : end_index]
+            if is_resolving
+            else source_text[start_index + 1 : middle_index]
+        )
+
+        # It is possible to have one level of nesting, so deal with it.
+        if middle_index + 1 == end_index:
+            inner_start_index = source_text.index(
+                ParserHelper.__alert_character, end_index + 1
             )
-            end_replacement_index = adjusted_text_token.index(
-                ParserHelper.__alert_character, middle_replacement_index + 1
+            inner_middle_index = source_text.index(
+                ParserHelper.__alert_character, inner_start_index + 1
             )
+            end_index = source_text.index(
+                ParserHelper.__alert_character, inner_middle_index + 1
+            )
+            assert inner_middle_index + 1 == end_index
+            if is_resolving:
+                replace_text = source_text[inner_start_index + 1 : inner_middle_index]
+        return replace_text, end_index + 1
 
-            if middle_replacement_index + 1 == end_replacement_index:
-                inner_start_replacement_index = adjusted_text_token.index(
-                    ParserHelper.__alert_character, end_replacement_index + 1
+    @staticmethod
+    def __scan_markers_from_text(
+        source_text, is_resolving, is_removing_backspaces=True
+    ):
+        """
+        Deal with all of the marker characters in the text in a single scan.
+
+        If resolving, each marker is replaced with what it stands for, so that
+        backslash escapes and replacements take effect and the noop and blech
+        characters are dropped.  Otherwise, each marker is removed to get back
+        to the original text, keeping any noop and blech characters, and also
+        keeping any backspace characters if not is_removing_backspaces.  In all
+        cases, any escaped marker character is kept as itself.
+        """
+        next_match = ParserHelper.__resolvable_markers_regex.search(source_text)
+        if not next_match:
+            return source_text
+        text_parts, start_index = [], 0
+        while next_match:
+            marker_index = next_match.start()
+            text_parts.append(source_text[start_index:marker_index])
+            marker_character, start_index = source_text[marker_index], marker_index + 1
+            if marker_character == ParserHelper.escape_character:
+                text_parts.append(source_text[start_index : start_index + 1])
+                start_index += 1
+            elif marker_character == ParserHelper.__alert_character:
+                (
+                    replace_text,
+                    start_index,
+                ) = ParserHelper.__find_replacement_marker_text(
+                    source_text, marker_index, is_resolving
                 )
-                inner_middle_replacement_index = adjusted_text_token.index(
-                    ParserHelper.__alert_character, inner_start_replacement_index + 1
+                text_parts.append(
+                    ParserHelper.__scan_markers_from_text(
+                        replace_text, is_resolving, is_removing_backspaces
+                    )
                 )
-                inner_end_replacement_index = adjusted_text_token.index(
-                    ParserHelper.__alert_character, inner_middle_replacement_index + 1
+            elif marker_character == ParserHelper.__backspace_character:
+                if is_resolving:
+                    while text_parts and not text_parts[-1]:
+                        del text_parts[-1]
+                    if text_parts:
+                        text_parts[-1] = text_parts[-1][:-1]
+                elif not is_removing_backspaces:
+                    text_parts.append(marker_character)
+            elif not is_resolving:
+                text_parts.append(marker_character)
+            next_match = ParserHelper.__resolvable_markers_regex.search(
+                source_text, start_index
+            )
+        text_parts.append(source_text[start_index:])
+        return "".join(text_parts)
+
+    @staticmethod
+    def split_into_spans(source_text):
+        """
+        Split the text into a list of spans, each a tuple of the kind of span,
+        its original text and its replacement text.  Joining the original text
+        of each span gives the same text as remove_all_from_text, and joining
+        the replacement text gives the same text as resolve_all_from_text.
+        """
+        next_match = ParserHelper.__resolvable_markers_regex.search(source_text)
+        if not next_match:
+            return [(ParserHelper.text_span, source_text, source_text)]
+        text_spans, start_index = [], 0
+        while next_match:
+            marker_index = next_match.start()
+            marker_character, text_before_marker = (
+                source_text[marker_index],
+                source_text[start_index:marker_index],
+            )
+            if marker_character == ParserHelper.__backspace_character:
+                if text_before_marker:
+                    text_before_marker, removed_character = (
+                        text_before_marker[:-1],
+                        text_before_marker[-1],
+                    )
+                else:
+                    removed_character = ""
+            if text_before_marker:
+                text_spans.append(
+                    (ParserHelper.text_span, text_before_marker, text_before_marker)
                 )
-                replace_text = adjusted_text_token[
-                    inner_start_replacement_index + 1 : inner_middle_replacement_index
-                ]
-                assert inner_middle_replacement_index + 1 == inner_end_replacement_index
-                end_replacement_index = inner_end_replacement_index
-            else:
-                replace_text = adjusted_text_token[
-                    middle_replacement_index + 1 : end_replacement_index
-                ]
 
-            length_before_mod = len(adjusted_text_token)
-            adjusted_text_token = (
+            start_index = marker_index + 1
+            if marker_character == ParserHelper.escape_character:
+                escaped_character = source_text[start_index : start_index + 1]
+                text_spans.append(
+                    (ParserHelper.escape_span, escaped_character, escaped_character)
+                )
+                start_index += 1
+            elif marker_character == ParserHelper.__alert_character:
+                original_text, _ = ParserHelper.__find_replacement_marker_text(
+                    source_text, marker_index, False
+                )
                 (
-                    adjusted_text_token[0:start_replacement_index]
-                    + replace_text
-                    + adjusted_text_token[end_replacement_index + 1 :]
+                    replacement_text,
+                    start_index,
+                ) = ParserHelper.__find_replacement_marker_text(
+                    source_text, marker_index, True
                 )
-                if start_replacement_index
-                else (replace_text + adjusted_text_token[end_replacement_index + 1 :])
-            )
-            length_after_mod = len(adjusted_text_token)
-            start_index = (
-                end_replacement_index + 1 + (length_after_mod - length_before_mod)
-            )
-            start_replacement_index = ParserHelper.__find_with_escape(
-                adjusted_text_token, ParserHelper.__alert_character, start_index
+                text_spans.append(
+                    (
+                        ParserHelper.replacement_span,
+                        ParserHelper.remove_all_from_text(original_text),
+                        ParserHelper.resolve_all_from_text(replacement_text),
+                    )
+                )
+            elif marker_character == ParserHelper.__backspace_character:
+                text_spans.append((ParserHelper.backslash_span, removed_character, ""))
+            elif marker_character == ParserHelper.replace_noop_character:
+                text_spans.append((ParserHelper.noop_span, marker_character, ""))
+            else:
+                text_spans.append((ParserHelper.blech_span, marker_character, ""))
+            next_match = ParserHelper.__resolvable_markers_regex.search(
+                source_text, start_index
             )
-        return adjusted_text_token
+        if start_index < len(source_text):
+            remaining_text = source_text[start_index:]
+            text_spans.append((ParserHelper.text_span, remaining_text, remaining_text))
+        return text_spans
 
     @staticmethod
     def resolve_all_from_text(text_to_resolve):
         """
         Combination to resolve all of these special characters from the text.
         """
-        resolved_text = ParserHelper.resolve_backspaces_from_text(text_to_resolve)
-        resolved_text = ParserHelper.__resolve_references_from_text(resolved_text)
-        resolved_text = ParserHelper.resolve_noops_from_text(resolved_text)
-        resolved_text = ParserHelper.__resolve_blechs_from_text(resolved_text)
-        return ParserHelper.__resolve_escapes_from_text(resolved_text)
+        return ParserHelper.__scan_markers_from_text(text_to_resolve, True)
 
     @staticmethod
     def remove_all_from_text(text_to_remove):
         """
         Combination to remove all of these special characters from the text.
         """
-        removed_text = ParserHelper.__remove_backspaces_from_text(text_to_remove)
-        removed_text = ParserHelper.__resolve_replacement_markers_from_text(
-            removed_text
-        )
-        return ParserHelper.__remove_escapes_from_text(removed_text)
+        return ParserHelper.__scan_markers_from_text(text_to_remove, False)
 
     @staticmethod
     def repeat_string(string_to_repeat, repeat_count):
@@ -850,7 +845,7 @@ class ParserHelper:
 # pylint: enable=too-many-public-methods
 
 
-# pylint: disable=too-few-public-methods, too-many-instance-attributes
+# pylint: disable=too-few-public-methods, too-many-instance-attributes, too-many-public-methods
 class ParserState:
     """
     Class to provide for an encapsulation of the high level state of the parser.
@@ -869,13 +864,12 @@ class ParserState:
         (
             self.__same_line_container_tokens,
             self.__last_block_quote_stack_token,
-            self.__last_block_quote_markdown_token_index,
-            self.__copy_of_last_block_quote_markdown_token,
+            self.__last_block_quote_leading_spaces_state,
             self.__original_line_to_parse,
             self.__original_stack_depth,
             self.__original_document_depth,
             self.__no_para_start_if_empty,
-        ) = (None, None, None, None, None, None, None, False)
+        ) = (None, None, None, None, None, None, False)
         self.nested_list_start = None
 
     @property
@@ -921,18 +915,11 @@ class ParserState:
         return self.__last_block_quote_stack_token
 
     @property
-    def last_block_quote_markdown_token_index(self):
+    def last_block_quote_leading_spaces_state(self):
         """
-        Index of the last block quote token.
+        Snapshot of the leading spaces of the last block quote token, before any changes.
         """
-        return self.__last_block_quote_markdown_token_index
-
-    @property
-    def copy_of_last_block_quote_markdown_token(self):
-        """
-        Copy of the last block quote markdown token, before any changes.
-        """
-        return self.__copy_of_last_block_quote_markdown_token
+        return self.__last_block_quote_leading_spaces_state
 
     @property
     def original_line_to_parse(self):
@@ -1001,6 +988,90 @@ class ParserState:
             last_stack_index -= 1
         return last_stack_index
 
+    def find_matching_markdown_token_index(self, stack_token):
+        """
+        Find the index of the markdown token matching the stack token within the
+        document.  The index is kept in the stack token once found.  If the token
+        is no longer at the kept index, the tokens after that index are searched
+        first, as the document mostly changes at its end, and then the tokens
+        before it.  With no kept index, the document is searched from its end.
+        """
+
+        matching_markdown_token, document_index, document_size = (
+            stack_token.matching_markdown_token,
+            stack_token.matching_markdown_token_index,
+            len(self.token_document),
+        )
+        if (
+            document_index is not None
+            and document_index < document_size
+            and self.token_document[document_index] is matching_markdown_token
+        ):
+            return document_index
+
+        if document_index is None:
+            search_indices = range(document_size - 1, -1, -1)
+        else:
+            search_indices = itertools.chain(
+                range(document_index + 1, document_size),
+                range(min(document_index, document_size) - 1, -1, -1),
+            )
+        document_index = next(
+            (
+                search_index
+                for search_index in search_indices
+                if self.token_document[search_index] is matching_markdown_token
+            ),
+            -1,
+        )
+        assert document_index >= 0
+        stack_token.matching_markdown_token_index = document_index
+        return document_index
+
+    def find_last_list_token_in_document(self, list_stack_token):
+        """
+        Find the index of the last list token in the document, or -1 if there
+        is none.  The result of the last search is kept in the stack token for
+        the last list on the stack, along with the last token that it looked at.
+        If both tokens are still where they were, only the tokens added to the
+        document since then are searched.
+        """
+
+        document_index, search_start_index = len(self.token_document) - 1, 0
+        if list_stack_token.last_list_token_search:
+            (
+                last_list_index,
+                last_list_token,
+                last_searched_index,
+                last_searched_token,
+            ) = list_stack_token.last_list_token_search
+            if (
+                last_searched_index <= document_index
+                and self.token_document[last_searched_index] is last_searched_token
+                and self.token_document[last_list_index] is last_list_token
+            ):
+                search_start_index = last_searched_index + 1
+
+        while (
+            document_index >= search_start_index
+            and not self.token_document[document_index].is_any_list_token
+        ):
+            document_index -= 1
+        if document_index < search_start_index and search_start_index:
+            document_index = list_stack_token.last_list_token_search[0]
+
+        list_stack_token.last_list_token_search = (
+            (
+                document_index,
+                self.token_document[document_index],
+                len(self.token_document) - 1,
+                self.token_document[-1],
+            )
+            if document_index >= 0
+            else None
+        )
+        return document_index
+
     def count_of_block_quotes_on_stack(self):
         """
         Helper method to count the number of block quotes currently on the stack.
@@ -1017,6 +1088,10 @@ class ParserState:
         """
         Mark the start of processing this line of information.  A lot of
         this information is to allow a requeue to occur, if needed.
+
+        The index of the token for the innermost block quote is kept in its
+        stack token the first time it is looked for, as it only moves if the
+        document is no longer in step with the stack.
         """
         (
             self.__original_line_to_parse,
@@ -1034,16 +1109,21 @@ class ParserState:
 
         (
             self.__last_block_quote_stack_token,
-            self.__last_block_quote_markdown_token_index,
-            self.__copy_of_last_block_quote_markdown_token,
-        ) = (None, None, None)
+            self.__last_block_quote_leading_spaces_state,
+        ) = (None, None)
         if not self.token_stack[last_stack_index].is_document:
-            self.__last_block_quote_stack_token = self.token_stack[last_stack_index]
-            self.__last_block_quote_markdown_token_index = self.token_document.index(
-                self.token_stack[last_stack_index].matching_markdown_token
+            block_quote_stack_token = self.token_stack[last_stack_index]
+            if block_quote_stack_token.matching_markdown_token_index is None:
+                self.find_matching_markdown_token_index(block_quote_stack_token)
+            document_index = block_quote_stack_token.matching_markdown_token_index
+            assert (
+                document_index < len(self.token_document)
+                and self.token_document[document_index]
+                is block_quote_stack_token.matching_markdown_token
             )
-            self.__copy_of_last_block_quote_markdown_token = copy.deepcopy(
-                self.token_document[self.__last_block_quote_markdown_token_index]
+            self.__last_block_quote_stack_token = block_quote_stack_token
+            self.__last_block_quote_leading_spaces_state = (
+                block_quote_stack_token.matching_markdown_token.leading_spaces_state
             )
 
     def mark_for_leaf_processing(self, container_level_tokens):
@@ -1065,7 +1145,7 @@ class ParserState:
         self.__no_para_start_if_empty = True
 
 
-# pylint: enable=too-few-public-methods, too-many-instance-attributes
+# pylint: enable=too-few-public-methods, too-many-instance-attributes, too-many-public-methods
 
 
 # pylint: disable=too-few-public-methods
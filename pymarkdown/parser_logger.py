@@ -3,6 +3,7 @@ Module to provide for a simple logger wrapper that provides extra
 functionality for logging parsing information.
 """
 import logging
+import weakref
 
 from pymarkdown.parser_helper import ParserHelper
 
@@ -13,41 +14,53 @@ class ParserLogger:
     functionality for logging parsing information.
 
     To keep things performant, the calls to the underlying logging libraries
-    are only done when needed.
+    are only done when needed.  As the enabled state of each logger is cached,
+    the only cost of a call when logging is disabled is a single check of that
+    state.  Hot paths should go further and check the is_debug_enabled or
+    is_info_enabled properties before making any calls, so that no call is made
+    and no arguments are packed when that level of logging is disabled.
     """
 
-    __global_count = 0
+    __all_loggers = weakref.WeakSet()
 
     def __init__(self, my_logger):
         self.__my_logger = my_logger
-        root_logger = logging.getLogger()
-        self.__is_info_enabled = root_logger.isEnabledFor(logging.INFO)
-        self.__is_debug_enabled = root_logger.isEnabledFor(logging.DEBUG)
-        self.__local_count = ParserLogger.__global_count
+        self.__is_info_enabled, self.__is_debug_enabled = False, False
+        self.__reset_cache()
+        ParserLogger.__all_loggers.add(self)
 
     def __reset_cache(self):
-        self.__local_count = ParserLogger.__global_count
         root_logger = logging.getLogger()
         self.__is_info_enabled = root_logger.isEnabledFor(logging.INFO)
         self.__is_debug_enabled = root_logger.isEnabledFor(logging.DEBUG)
 
+    # pylint: disable=protected-access
     @staticmethod
     def sync_on_next_call():
         """
-        Sync the local instance of the logger on the next call.
+        Sync every instance of the logger with the current logging levels.  This
+        must be called after the logging levels are changed.
         """
-        ParserLogger.__global_count += 1
+        for next_logger in list(ParserLogger.__all_loggers):
+            next_logger.__reset_cache()
+
+    # pylint: enable=protected-access
 
     def info(self, log_format, *args):
         """
         Log information at an "INFO" level to the logger.
         """
-        if ParserLogger.__global_count != self.__local_count:
-            self.__reset_cache()
         if self.__is_info_enabled:
             msg = self.__munge(False, log_format, args)
             self.__my_logger.info(msg, stacklevel=2)
 
+    @property
+    def is_info_enabled(self):
+        """
+        Determine whether info logging is currently enabled.
+        """
+        return self.__is_info_enabled
+
     @property
     def is_debug_enabled(self):
         """
@@ -59,8 +72,6 @@ class ParserLogger:
         """
         Log information at a "DEBUG" level to the logger.
         """
-        if ParserLogger.__global_count != self.__local_count:
-            self.__reset_cache()
         if self.__is_debug_enabled:
             msg = self.__munge(False, log_format, args)
             self.__my_logger.debug(msg, stacklevel=2)
@@ -71,9 +82,7 @@ class ParserLogger:
         automatic filtering of any string with make_value_visible to
         using make_whitespace_visible.
 
-        Note: This is seldomly used, and does not have a reset check as
-        the reset will be hit by one of the other two functions long
-        before it gets here.
+        Note: This is seldomly used.
         """
         if self.__is_debug_enabled:
             msg = self.__munge(True, log_format, args)
@@ -14,6 +14,7 @@ from columnar import columnar
 
 from pymarkdown.extensions.pragma_token import PragmaExtension
 from pymarkdown.parser_helper import ParserHelper
+from pymarkdown.plugin_manifest import PluginManifest
 
 LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +38,84 @@ class ScanContext:
 # pylint: enable=too-few-public-methods
 
 
+# pylint: disable=too-few-public-methods
+class PluginScanFailure:
+    """
+    Class to contain the information about a single failure reported by a plugin.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        scan_file,
+        line_number,
+        column_number,
+        rule_id,
+        rule_name,
+        rule_description,
+        extra_error_information=None,
+    ):
+        (
+            self.scan_file,
+            self.line_number,
+            self.column_number,
+            self.rule_id,
+            self.rule_name,
+            self.rule_description,
+            self.extra_error_information,
+        ) = (
+            scan_file,
+            line_number,
+            column_number,
+            rule_id,
+            rule_name,
+            rule_description,
+            extra_error_information,
+        )
+
+    # pylint: enable=too-many-arguments
+
+    def __str__(self):
+        extra_info = (
+            f" [{self.extra_error_information}]" if self.extra_error_information else ""
+        )
+        return "{0}:{1}:{2}: {3}: {4}{5} ({6})".format(
+            self.scan_file,
+            self.line_number,
+            self.column_number,
+            self.rule_id,
+            self.rule_description,
+            extra_info,
+            self.rule_name,
+        )
+
+
+# pylint: enable=too-few-public-methods
+
+
+# pylint: disable=too-few-public-methods
+class PluginPragmaFailure:
+    """
+    Class to contain the information about a single pragma that could not be
+    compiled.
+    """
+
+    def __init__(self, scan_file, line_number, pragma_error):
+        self.scan_file, self.line_number, self.pragma_error = (
+            scan_file,
+            line_number,
+            pragma_error,
+        )
+
+    def __str__(self):
+        return "{0}:{1}:1: INLINE: {2}".format(
+            self.scan_file, self.line_number, self.pragma_error
+        )
+
+
+# pylint: enable=too-few-public-methods
+
+
 class BadPluginError(Exception):
     """
     Class to allow for a critical error within a plugin to be encapsulated
@@ -112,9 +191,11 @@ class Plugin(ABC):
             self.__plugin_specific_facade,
             self.__is_next_token_implemented_in_plugin,
             self.__is_next_line_implemented_in_plugin,
+            self.__is_next_lines_implemented_in_plugin,
             self.__is_starting_new_file_implemented_in_plugin,
             self.__is_completed_file_implemented_in_plugin,
-        ) = (None, True, True, True, True)
+            self.__next_token_names,
+        ) = (None, True, True, False, True, True, None)
 
     @abstractmethod
     def get_details(self):
@@ -141,12 +222,23 @@ class Plugin(ABC):
         self.__is_next_line_implemented_in_plugin = (
             "next_line" in self.__class__.__dict__.keys()
         )
+        self.__is_next_lines_implemented_in_plugin = (
+            "next_lines" in self.__class__.__dict__.keys()
+        )
         self.__is_starting_new_file_implemented_in_plugin = (
             "starting_new_file" in self.__class__.__dict__.keys()
         )
         self.__is_completed_file_implemented_in_plugin = (
             "completed_file" in self.__class__.__dict__.keys()
         )
+        self.__next_token_names = None
+        get_next_token_names_function = self.__class__.__dict__.get(
+            "get_next_token_names"
+        )
+        if get_next_token_names_function:
+            next_token_names = get_next_token_names_function(self)
+            if next_token_names is not None:
+                self.__next_token_names = frozenset(next_token_names)
 
     @property
     def is_starting_new_file_implemented_in_plugin(self):
@@ -162,6 +254,13 @@ class Plugin(ABC):
         """
         return self.__is_next_line_implemented_in_plugin
 
+    @property
+    def is_next_lines_implemented_in_plugin(self):
+        """
+        Return whether the next_lines function is implemented in the plugin.
+        """
+        return self.__is_next_lines_implemented_in_plugin
+
     @property
     def is_next_token_implemented_in_plugin(self):
         """
@@ -176,6 +275,13 @@ class Plugin(ABC):
         """
         return self.__is_completed_file_implemented_in_plugin
 
+    def is_next_token_wanted_for(self, token_name):
+        """
+        Return whether the next_token function of the plugin wants to be called
+        for tokens with the specified name.
+        """
+        return self.__next_token_names is None or token_name in self.__next_token_names
+
     def report_next_line_error(
         self, context, column_number, line_number_delta=0, extra_error_information=None
     ):
@@ -230,6 +336,14 @@ class Plugin(ABC):
         Event to allow the plugin to load configuration information.
         """
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens, such as `atx` or `end-atx`, that the next_token
+        function is to be called for.  If the plugin does not implement this
+        function, or None is returned, the next_token function is called for
+        every token.
+        """
+
     def starting_new_file(self):
         """
         Event that the a new file to be scanned is starting.
@@ -245,6 +359,13 @@ class Plugin(ABC):
         Event that a new line is being processed.
         """
 
+    def next_lines(self, context, lines):
+        """
+        Event that all of the lines are being processed at once.  When this event
+        is implemented, it is called instead of the next_line event, with the line
+        number of the context set to the first line.
+        """
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -387,6 +508,13 @@ class FoundPlugin:
         """
         return self.__plugin_instance
 
+    @plugin_instance.setter
+    def plugin_instance(self, plugin_instance):
+        """
+        Sets the actual instance of the plugin, once it has been loaded.
+        """
+        self.__plugin_instance = plugin_instance
+
     @property
     def plugin_file_name(self):
         """
@@ -401,6 +529,13 @@ class FoundPlugin:
         """
         return self.__plugin_version
 
+    @property
+    def plugin_interface_version(self):
+        """
+        Gets the version of the interface that the plugin implements.
+        """
+        return self.__plugin_interface_version
+
     @property
     def plugin_url(self):
         """
@@ -440,21 +575,27 @@ class PluginManager:
     __filter_regex = re.compile("^[a-zA-Z0-9-]+$")
     __version_regex = re.compile("^(0|[1-9]\\d*)\\.(0|[1-9]\\d*)\\.(0|[1-9]\\d*)$")
 
-    def __init__(self):
+    def __init__(self, scan_failure_reporter=None, pragma_failure_reporter=None):
+        self.__scan_failure_reporter, self.__pragma_failure_reporter = (
+            scan_failure_reporter or PluginManager.__print_failure,
+            pragma_failure_reporter or PluginManager.__print_failure,
+        )
         (
             self.__registered_plugins,
             self.__enabled_plugins,
             self.__enabled_plugins_for_starting_new_file,
             self.__enabled_plugins_for_next_token,
             self.__enabled_plugins_for_next_line,
+            self.__enabled_plugins_for_next_lines,
             self.__enabled_plugins_for_completed_file,
+            self.__enabled_plugins_by_token_name,
             self.__loaded_classes,
             self.number_of_scan_failures,
             self.number_of_pragma_failures,
             self.__show_stack_trace,
             self.__document_pragmas,
             self.__all_ids,
-        ) = (None, None, None, None, None, None, None, None, None, False, None, None)
+        ) = (None,) * 11 + (False, None, None)
 
     # pylint: disable=too-many-arguments
     def initialize(
@@ -477,7 +618,11 @@ class PluginManager:
         ) = (0, 0, [], show_stack_trace)
 
         plugin_files = self.__find_eligible_plugins_in_directory(directory_to_search)
-        self.__load_plugins(directory_to_search, plugin_files)
+        self.__load_plugins(
+            directory_to_search,
+            plugin_files,
+            PluginManifest.load_manifest(directory_to_search, plugin_files),
+        )
 
         all_additional_paths = []
         if additional_paths:
@@ -712,17 +857,15 @@ class PluginManager:
             if rule_id in id_set:
                 return
 
-        extra_info = f" [{extra_error_information}]" if extra_error_information else ""
-
-        print(
-            "{0}:{1}:{2}: {3}: {4}{5} ({6})".format(
+        self.__scan_failure_reporter(
+            PluginScanFailure(
                 scan_file,
                 line_number,
                 column_number,
                 rule_id.upper(),
-                rule_description,
-                extra_info,
                 rule_name,
+                rule_description,
+                extra_error_information,
             )
         )
         self.number_of_scan_failures += 1
@@ -734,9 +877,15 @@ class PluginManager:
         Log the pragma failure in the appropriate format.
         """
 
-        print("{0}:{1}:1: INLINE: {2}".format(scan_file, line_number, pragma_error))
+        self.__pragma_failure_reporter(
+            PluginPragmaFailure(scan_file, line_number, pragma_error)
+        )
         self.number_of_pragma_failures += 1
 
+    @staticmethod
+    def __print_failure(failure):
+        print(str(failure))
+
     # pylint: disable=too-many-locals
     def compile_pragmas(self, scan_file, pragma_lines):
         """
@@ -773,8 +922,9 @@ class PluginManager:
 
         return "".join(x.capitalize() or "_" for x in word.split("_"))
 
+    @classmethod
     def __attempt_to_load_plugin(
-        self, next_plugin_module, plugin_class_name, next_plugin_file
+        cls, next_plugin_module, plugin_class_name, next_plugin_file
     ):
         """
         Attempt to cleanly load the specified plugin.
@@ -798,22 +948,52 @@ class PluginManager:
                 class_name=plugin_class_name,
                 is_constructor=True,
             ) from this_exception
-        self.__loaded_classes.append((plugin_class_instance, next_plugin_file))
+        return plugin_class_instance
 
-    def __load_plugins(self, directory_to_search, plugin_files):
+    def __load_plugins(self, directory_to_search, plugin_files, plugin_manifest=None):
         """
         Given an array of discovered modules, load them into the global namespace.
+        If a manifest is provided, loading each module is deferred until the
+        plugin within that module is known to be enabled.
         """
 
         if os.path.abspath(directory_to_search) not in sys.path:
             sys.path.insert(0, os.path.abspath(directory_to_search))
 
         for next_plugin_file in plugin_files:
-            next_plugin_module = next_plugin_file[0:-3]
-            plugin_class_name = self.__snake_to_camel(next_plugin_module)
-            self.__attempt_to_load_plugin(
-                next_plugin_module, plugin_class_name, next_plugin_file
+            if plugin_manifest:
+                self.__loaded_classes.append(
+                    (None, next_plugin_file, plugin_manifest[next_plugin_file])
+                )
+            else:
+                self.__loaded_classes.append(
+                    (self.__load_plugin_file(next_plugin_file), next_plugin_file, None)
+                )
+
+    def __load_plugin_file(self, next_plugin_file):
+        next_plugin_module = next_plugin_file[0:-3]
+        plugin_class_name = self.__snake_to_camel(next_plugin_module)
+        return self.__attempt_to_load_plugin(
+            next_plugin_module, plugin_class_name, next_plugin_file
+        )
+
+    def create_plugin_manifest(self, directory_to_search):
+        """
+        Load each plugin in the directory, returning a manifest that describes
+        each of those plugins.
+        """
+        self.__loaded_classes = []
+        plugin_manifest = {}
+        plugin_files = self.__find_eligible_plugins_in_directory(directory_to_search)
+        self.__load_plugins(directory_to_search, plugin_files)
+        for plugin_instance, instance_file_name, _ in self.__loaded_classes:
+            plugin_object = self.__get_plugin_details(
+                plugin_instance, instance_file_name
             )
+            plugin_manifest[instance_file_name] = PluginManifest.create_entry(
+                plugin_object
+            )
+        return plugin_manifest
 
     def __determine_if_plugin_enabled(
         self,
@@ -990,6 +1170,7 @@ class PluginManager:
         self,
         plugin_instance,
         instance_file_name,
+        manifest_entry,
         command_line_enabled_rules,
         command_line_disabled_rules,
         properties,
@@ -998,7 +1179,14 @@ class PluginManager:
         Register an individual plugin for use.
         """
 
-        plugin_object = self.__get_plugin_details(plugin_instance, instance_file_name)
+        if plugin_instance:
+            plugin_object = self.__get_plugin_details(
+                plugin_instance, instance_file_name
+            )
+        else:
+            plugin_object = self.__create_plugin_from_manifest(
+                instance_file_name, manifest_entry
+            )
 
         next_key = plugin_object.plugin_id
         if not PluginManager.__id_regex.match(next_key):
@@ -1040,10 +1228,42 @@ class PluginManager:
             command_line_disabled_rules,
             properties,
         ):
+            if not plugin_object.plugin_instance:
+                self.__load_plugin_from_manifest(plugin_object, manifest_entry)
             self.__enabled_plugins.append(plugin_object)
 
     # pylint: enable=too-many-arguments
 
+    @classmethod
+    def __create_plugin_from_manifest(cls, instance_file_name, manifest_entry):
+        return FoundPlugin(
+            manifest_entry["id"],
+            ",".join(manifest_entry["names"]),
+            manifest_entry["description"],
+            None,
+            manifest_entry["enabled_by_default"],
+            manifest_entry["version"],
+            manifest_entry["interface_version"],
+            instance_file_name,
+            manifest_entry["url"],
+            manifest_entry["configuration"],
+        )
+
+    def __load_plugin_from_manifest(self, plugin_object, manifest_entry):
+        """
+        Load the instance of a plugin that was registered from the manifest,
+        making sure that the plugin still matches its entry in the manifest.
+        """
+
+        instance_file_name = plugin_object.plugin_file_name
+        plugin_instance = self.__load_plugin_file(instance_file_name)
+        loaded_object = self.__get_plugin_details(plugin_instance, instance_file_name)
+        if PluginManifest.create_entry(loaded_object) != manifest_entry:
+            raise BadPluginError(
+                formatted_message=f"Plugin '{instance_file_name}' does not match its entry in the plugin manifest."
+            )
+        plugin_object.plugin_instance = plugin_instance
+
     def __register_plugins(
         self,
         enable_rules_from_command_line,
@@ -1073,15 +1293,52 @@ class PluginManager:
             ):
                 command_line_disabled_rules.add(next_rule_identifier)
 
-        for plugin_instance, instance_file_name in self.__loaded_classes:
+        for (
+            plugin_instance,
+            instance_file_name,
+            manifest_entry,
+        ) in self.__loaded_classes:
             self.__register_individual_plugin(
                 plugin_instance,
                 instance_file_name,
+                manifest_entry,
                 command_line_enabled_rules,
                 command_line_disabled_rules,
                 properties,
             )
 
+    @property
+    def enabled_plugins(self):
+        """
+        Get a list of all plugins that are enabled.
+        """
+
+        return list(self.__enabled_plugins)
+
+    def is_next_token_required_for(self, source_lines):
+        """
+        Determine whether the lines need to be tokenized when they are scanned.  Apart
+        from any plugins that want the tokens, the tokens also carry any pragmas
+        found in the lines.
+        """
+        return bool(
+            self.__enabled_plugins_for_next_token
+        ) or PragmaExtension.could_contain_pragmas(source_lines)
+
+    @property
+    def is_next_line_required(self):
+        """
+        Determine whether the lines need to be passed to the plugins one at a time.
+        """
+        return bool(self.__enabled_plugins_for_next_line)
+
+    @property
+    def is_next_lines_required(self):
+        """
+        Determine whether the lines need to be passed to the plugins all at once.
+        """
+        return bool(self.__enabled_plugins_for_next_lines)
+
     @property
     def all_plugin_ids(self):
         """
@@ -1123,8 +1380,10 @@ class PluginManager:
             self.__enabled_plugins_for_starting_new_file,
             self.__enabled_plugins_for_next_token,
             self.__enabled_plugins_for_next_line,
+            self.__enabled_plugins_for_next_lines,
             self.__enabled_plugins_for_completed_file,
-        ) = ([], [], [], [])
+            self.__enabled_plugins_by_token_name,
+        ) = ([], [], [], [], [], {})
 
         for next_plugin in self.__enabled_plugins:
             try:
@@ -1145,7 +1404,9 @@ class PluginManager:
 
             if next_plugin.plugin_instance.is_next_token_implemented_in_plugin:
                 self.__enabled_plugins_for_next_token.append(next_plugin)
-            if next_plugin.plugin_instance.is_next_line_implemented_in_plugin:
+            if next_plugin.plugin_instance.is_next_lines_implemented_in_plugin:
+                self.__enabled_plugins_for_next_lines.append(next_plugin)
+            elif next_plugin.plugin_instance.is_next_line_implemented_in_plugin:
                 self.__enabled_plugins_for_next_line.append(next_plugin)
             if next_plugin.plugin_instance.is_completed_file_implemented_in_plugin:
                 self.__enabled_plugins_for_completed_file.append(next_plugin)
@@ -1184,6 +1445,21 @@ class PluginManager:
                     cause=this_exception,
                 ) from this_exception
 
+    def next_lines(self, context, lines):
+        """
+        Inform any listeners of all of the lines at once.
+        """
+        for next_plugin in self.__enabled_plugins_for_next_lines:
+            context.line_number = 1
+            try:
+                next_plugin.plugin_instance.next_lines(context, lines)
+            except Exception as this_exception:
+                raise BadPluginError(
+                    next_plugin.plugin_id,
+                    inspect.stack()[0].function,
+                    cause=this_exception,
+                ) from this_exception
+
     def next_line(self, context, line_number, line):
         """
         Inform any listeners that a new line has been loaded.
@@ -1203,11 +1479,107 @@ class PluginManager:
                     cause=this_exception,
                 ) from this_exception
 
+    def scan_document(self, scan_file, actual_tokens, source_lines, pragma_lines=None):
+        """
+        Scan a single document, passing its tokens and its lines to the enabled
+        plugins.  The tokens are only iterated over if they are needed, either by
+        a plugin or to find any pragmas in the lines.  Any pragmas that were
+        already found are supplied through pragma_lines.
+        """
+        is_info_enabled = LOGGER.isEnabledFor(logging.INFO)
+        LOGGER.info("Scanning file '%s'.", scan_file)
+        context = self.starting_new_file(scan_file)
+        if pragma_lines:
+            self.compile_pragmas(scan_file, pragma_lines)
+
+        if self.is_next_token_required_for(source_lines):
+            LOGGER.info("Scanning file '%s' tokens.", scan_file)
+            for next_token in actual_tokens:
+                if next_token.is_pragma:
+                    self.compile_pragmas(scan_file, next_token.pragma_lines)
+                    continue
+                if is_info_enabled:
+                    LOGGER.info("Processing token: %s", next_token)
+                self.next_token(context, next_token)
+
+        if self.is_next_lines_required and (
+            len(self.__enabled_plugins_for_next_lines)
+            + len(self.__enabled_plugins_for_next_line)
+            > 1
+        ):
+            self.__scan_lines_in_line_order(
+                context, scan_file, source_lines, is_info_enabled
+            )
+        else:
+            self.__scan_lines(context, scan_file, source_lines, is_info_enabled)
+
+        LOGGER.info("Completed scanning file '%s'.", scan_file)
+        self.completed_file(context, len(source_lines) + 1)
+
+    def __scan_lines(self, context, scan_file, source_lines, is_info_enabled):
+        if self.is_next_lines_required:
+            LOGGER.info("Scanning file '%s' lines.", scan_file)
+            self.next_lines(context, source_lines)
+        if self.is_next_line_required:
+            LOGGER.info("Scanning file '%s' line-by-line.", scan_file)
+            line_number = 1
+            for next_line in source_lines:
+                if is_info_enabled:
+                    LOGGER.info("Processing line %d: %s", line_number, next_line)
+                self.next_line(context, line_number, next_line)
+                line_number += 1
+
+    def __scan_lines_in_line_order(
+        self, context, scan_file, source_lines, is_info_enabled
+    ):
+        """
+        Scan the lines, holding back any failures until every plugin has seen the
+        lines.  As the next_lines plugins see all of the lines before any of the
+        next_line plugins see the first line, the failures are then reported by
+        line number and then in the order that the plugins were enabled, as they
+        are when every plugin looks at one line at a time.
+        """
+        line_failures, saved_failure_reporter = [], self.__scan_failure_reporter
+        self.__scan_failure_reporter = line_failures.append
+        try:
+            self.__scan_lines(context, scan_file, source_lines, is_info_enabled)
+        finally:
+            self.__scan_failure_reporter = saved_failure_reporter
+            plugin_order = {
+                next_plugin.plugin_id.upper(): plugin_index
+                for plugin_index, next_plugin in enumerate(self.__enabled_plugins)
+            }
+            line_failures.sort(
+                key=lambda x: (x.line_number, plugin_order.get(x.rule_id, -1))
+            )
+            for next_failure in line_failures:
+                self.__scan_failure_reporter(next_failure)
+
+    def __find_plugins_for_token_name(self, token_name):
+        """
+        Find the plugins that want to be told about tokens with the specified name,
+        keeping them in the same order as they were enabled.
+        """
+        plugins_for_token_name = [
+            x
+            for x in self.__enabled_plugins_for_next_token
+            if x.plugin_instance.is_next_token_wanted_for(token_name)
+        ]
+        self.__enabled_plugins_by_token_name[token_name] = plugins_for_token_name
+        return plugins_for_token_name
+
     def next_token(self, context, token):
         """
         Inform any listeners of a new token that has been processed.
         """
-        for next_plugin in self.__enabled_plugins_for_next_token:
+        plugins_for_token_name = self.__enabled_plugins_by_token_name.get(
+            token.token_name
+        )
+        if plugins_for_token_name is None:
+            plugins_for_token_name = self.__find_plugins_for_token_name(
+                token.token_name
+            )
+        for next_plugin in plugins_for_token_name:
             try:
                 next_plugin.plugin_instance.next_token(context, token)
             except Exception as this_exception:
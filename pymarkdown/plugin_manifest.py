@@ -0,0 +1,102 @@
+"""
+Module to provide for a manifest of the plugins found in a directory.
+"""
+import json
+import logging
+import os
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PluginManifest:
+    """
+    Class to provide for a manifest of the plugins found in a directory.
+
+    The manifest records the details of each plugin, keyed by the name of the
+    file that contains it.  With those details available, the plugin manager
+    can decide which plugins are enabled, and list every plugin, without having
+    to import and construct each plugin first.
+    """
+
+    manifest_file_name = "plugin_manifest.json"
+
+    @staticmethod
+    def default_plugin_directory():
+        """
+        Get the directory that contains the built-in plugins.
+        """
+        return os.path.join(os.path.dirname(os.path.realpath(__file__)), "plugins")
+
+    @staticmethod
+    def create_entry(found_plugin):
+        """
+        Create the manifest entry that describes the found plugin.
+        """
+        return {
+            "id": found_plugin.plugin_id,
+            "names": found_plugin.plugin_names,
+            "description": found_plugin.plugin_description,
+            "enabled_by_default": found_plugin.plugin_enabled_by_default,
+            "version": found_plugin.plugin_version,
+            "interface_version": found_plugin.plugin_interface_version,
+            "url": found_plugin.plugin_url,
+            "configuration": found_plugin.plugin_configuration,
+        }
+
+    @staticmethod
+    def load_manifest(directory_to_search, plugin_files):
+        """
+        Load the manifest for the directory, returning None if there is no
+        manifest or if it does not describe exactly the plugin files that are
+        present in the directory.
+        """
+        manifest_path = os.path.join(
+            directory_to_search, PluginManifest.manifest_file_name
+        )
+        try:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                plugin_manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            LOGGER.debug("No usable plugin manifest found at '%s'.", manifest_path)
+            return None
+
+        if not isinstance(plugin_manifest, dict) or set(plugin_manifest.keys()) != set(
+            plugin_files
+        ):
+            LOGGER.debug(
+                "Plugin manifest at '%s' does not match the plugin files.",
+                manifest_path,
+            )
+            return None
+        return plugin_manifest
+
+    @staticmethod
+    def create_manifest(directory_to_search):
+        """
+        Create the manifest for the plugins in the directory by loading each of
+        those plugins.
+        """
+
+        # pylint: disable=import-outside-toplevel, cyclic-import
+        from pymarkdown.plugin_manager import PluginManager
+
+        # pylint: enable=import-outside-toplevel, cyclic-import
+
+        return PluginManager().create_plugin_manifest(directory_to_search)
+
+    @staticmethod
+    def write_manifest(directory_to_search=None):
+        """
+        Create the manifest for the plugins in the directory and write it into
+        that directory, defaulting to the directory of the built-in plugins.
+        """
+        if not directory_to_search:
+            directory_to_search = PluginManifest.default_plugin_directory()
+        plugin_manifest = PluginManifest.create_manifest(directory_to_search)
+        manifest_path = os.path.join(
+            directory_to_search, PluginManifest.manifest_file_name
+        )
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(plugin_manifest, manifest_file, indent=2, sort_keys=True)
+            manifest_file.write("\n")
+        return manifest_path
@@ -43,6 +43,12 @@ class RuleMd001(Plugin):
         """
         self.__last_heading_count = None
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "setext", "front-matter"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -45,6 +45,12 @@ class RuleMd002(Plugin):
         """
         self.__have_seen_first_heading = False
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "setext"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -82,6 +82,12 @@ class RuleMd004(Plugin):
         assert token.list_start_sequence == "-"
         return RuleMd004.__dash_style
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["ulist", "end-ulist"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
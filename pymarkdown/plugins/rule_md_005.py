@@ -34,6 +34,12 @@ class RuleMd005(Plugin):
         """
         self.__list_stack = []
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["ulist", "olist", "li", "end-ulist", "end-olist"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -39,15 +39,24 @@ class RuleMd010(Plugin):
             default_value=True,
         )
 
-    def next_line(self, context, line):
+    def next_lines(self, context, lines):
         """
-        Event that a new line is being processed.
+        Event that all of the lines are being processed at once.
         """
-        if "\t" in line:
-            next_index = line.find("\t", 0)
-            while next_index != -1:
-                extra_data = f"Column: {next_index + 1}"
-                self.report_next_line_error(
-                    context, next_index + 1, extra_error_information=extra_data
-                )
-                next_index = line.find("\t", next_index + 1)
+        all_text = "\n".join(lines)
+        next_index = all_text.find("\t")
+        line_index, line_start_index = 0, 0
+        while next_index != -1:
+            newline_count = all_text.count("\n", line_start_index, next_index)
+            if newline_count:
+                line_index += newline_count
+                line_start_index = all_text.rindex("\n", 0, next_index) + 1
+            column_number = next_index - line_start_index + 1
+            extra_data = f"Column: {column_number}"
+            self.report_next_line_error(
+                context,
+                column_number,
+                line_number_delta=line_index,
+                extra_error_information=extra_data,
+            )
+            next_index = all_text.find("\t", next_index + 1)
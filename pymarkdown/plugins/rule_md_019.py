@@ -36,6 +36,12 @@ class RuleMd019(Plugin):
         """
         self.__atx_heading_token = None
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "text", "end-para"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
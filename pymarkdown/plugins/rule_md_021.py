@@ -37,6 +37,12 @@ class RuleMd021(Plugin):
         self.__atx_heading_token = None
         self.__is_left_in_error = False
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "text", "end-para", "end-atx"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
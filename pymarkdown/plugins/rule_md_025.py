@@ -64,6 +64,12 @@ class RuleMd025(Plugin):
         """
         self.__have_top_level = False
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "setext", "front-matter"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
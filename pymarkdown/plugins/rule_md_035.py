@@ -71,6 +71,12 @@ class RuleMd035(Plugin):
         if self.__rule_style == RuleMd035.__consistent_style:
             self.__actual_style = None
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["tbreak"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
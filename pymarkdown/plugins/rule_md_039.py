@@ -23,6 +23,12 @@ class RuleMd039(Plugin):
             plugin_interface_version=1,
         )  # https://github.com/DavidAnson/markdownlint/blob/master/doc/Rules.md#md039---spaces-inside-link-text
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["link", "image"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -23,6 +23,12 @@ class RuleMd042(Plugin):
             plugin_interface_version=1,
         )  # https://github.com/DavidAnson/markdownlint/blob/master/doc/Rules.md#md042---no-empty-links
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["link", "image"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
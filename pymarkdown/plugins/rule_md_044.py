@@ -118,8 +118,10 @@ class RuleMd044(Plugin):
         start_x_offset=0,
         start_y_offset=0,
     ):
-
-        string_to_check = ParserHelper.remove_all_from_text(string_to_check)
+        """
+        Search the string, with any marker characters already removed, for any
+        of the proper names.
+        """
         string_to_check_lower = string_to_check.lower()
         for next_name in self.__proper_name_list:
             next_name_lower = next_name.lower()
@@ -175,7 +177,7 @@ class RuleMd044(Plugin):
                 full_link_text, 0, len(full_link_text)
             )
         self.__search_for_matches(
-            string_to_check,
+            ParserHelper.remove_all_from_text(string_to_check),
             context,
             token,
             same_line_offset,
@@ -192,13 +194,16 @@ class RuleMd044(Plugin):
         if self.__proper_name_list:
             if token.is_text:
                 if not self.__is_in_code_block or self.__check_in_code_blocks:
-                    self.__search_for_matches(token.token_text, context, token)
+                    self.__search_for_matches(token.original_text, context, token)
             elif token.is_inline_code_span:
                 same_line_offset = len(token.extracted_start_backticks) + len(
                     token.leading_whitespace
                 )
                 self.__search_for_matches(
-                    token.span_text, context, token, same_line_offset
+                    ParserHelper.remove_all_from_text(token.span_text),
+                    context,
+                    token,
+                    same_line_offset,
                 )
             elif token.is_inline_link_end:
                 if token.start_markdown_token.label_type == "inline":
@@ -226,7 +231,10 @@ class RuleMd044(Plugin):
             elif token.is_inline_image:
                 same_line_offset = -2
                 self.__search_for_matches(
-                    token.text_from_blocks, context, token, same_line_offset
+                    ParserHelper.remove_all_from_text(token.text_from_blocks),
+                    context,
+                    token,
+                    same_line_offset,
                 )
 
                 if token.label_type == "inline":
@@ -251,7 +259,12 @@ class RuleMd044(Plugin):
                     token.link_name_debug if token.link_name_debug else token.link_name
                 )
                 same_line_offset = -1
-                self.__search_for_matches(link_name, context, token, same_line_offset)
+                self.__search_for_matches(
+                    ParserHelper.remove_all_from_text(link_name),
+                    context,
+                    token,
+                    same_line_offset,
+                )
 
                 full_link_text = (
                     "["
@@ -23,6 +23,12 @@ class RuleMd045(Plugin):
             plugin_interface_version=1,
         )  # https://github.com/DavidAnson/markdownlint/blob/master/doc/Rules.md#md045---images-should-have-alternate-text-alt-text
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["image"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -61,6 +61,12 @@ class RuleMd048(Plugin):
         if self.__style_type != RuleMd048.__consistent_style:
             self.__actual_style_type = self.__style_type
 
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["fcode-block"]
+
     def next_token(self, context, token):
         """
         Event that a new token is being processed.
@@ -0,0 +1,168 @@
+"""
+Module to provide for a cache of scan results that persists between runs.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ScanCache:
+    """
+    Class to provide for a cache of scan results that persists between runs.
+
+    Each entry is stored in its own file, named after the path of the scanned file.
+    Along with the results, each entry records a hash of the content that was
+    scanned and a fingerprint of the configuration used to scan it.  If either
+    of those do not match when the entry is loaded, the entry is stale and is
+    treated as missing, to be replaced once the file is scanned again.
+    """
+
+    __entry_suffix = ".json"
+    default_maximum_entries = 10000
+
+    def __init__(self, cache_directory, configuration_fingerprint, maximum_entries):
+        (
+            self.__cache_directory,
+            self.__configuration_fingerprint,
+            self.__maximum_entries,
+        ) = (cache_directory, configuration_fingerprint, maximum_entries)
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+    @property
+    def cache_directory(self):
+        """
+        Directory where the entries for the cache are stored.
+        """
+        return self.__cache_directory
+
+    @property
+    def configuration_fingerprint(self):
+        """
+        Fingerprint of the configuration that the cached results are valid for.
+        """
+        return self.__configuration_fingerprint
+
+    @staticmethod
+    def calculate_fingerprint(fingerprint_values):
+        """
+        Calculate a fingerprint for a JSON-serializable collection of values that
+        affect the results of a scan.
+        """
+        serialized_values = json.dumps(fingerprint_values, sort_keys=True)
+        return hashlib.sha256(serialized_values.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def calculate_content_hash(source_lines):
+        """
+        Calculate a hash of the content of a file from its decoded lines.
+        """
+        return hashlib.sha256("\n".join(source_lines).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def calculate_file_hash(file_path):
+        """
+        Calculate a hash of the raw content of a file, such as a plugin's source.
+        """
+        with open(file_path, "rb") as hashed_file:
+            return hashlib.sha256(hashed_file.read()).hexdigest()
+
+    def __entry_path(self, scan_file):
+        entry_name = hashlib.sha256(scan_file.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.__cache_directory, f"{entry_name}{ScanCache.__entry_suffix}"
+        )
+
+    def load_results(self, scan_file, content_hash):
+        """
+        Load the cached results for the file, returning None if there are no
+        results or if the results are stale.
+        """
+
+        entry_path = self.__entry_path(scan_file)
+        try:
+            with open(entry_path, encoding="utf-8") as entry_file:
+                cache_entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            cache_entry.get("file") != scan_file
+            or cache_entry.get("content_hash") != content_hash
+            or cache_entry.get("fingerprint") != self.__configuration_fingerprint
+        ):
+            LOGGER.debug("Cache entry for '%s' is stale.", scan_file)
+            return None
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return (
+            cache_entry["output"],
+            cache_entry["scan_failures"],
+            cache_entry["pragma_failures"],
+        )
+
+    def save_results(
+        self, scan_file, content_hash, output, scan_failures, pragma_failures
+    ):
+        """
+        Save the results of scanning the file, replacing any existing entry.
+        """
+
+        cache_entry = {
+            "file": scan_file,
+            "content_hash": content_hash,
+            "fingerprint": self.__configuration_fingerprint,
+            "output": output,
+            "scan_failures": scan_failures,
+            "pragma_failures": pragma_failures,
+        }
+        temporary_path = None
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.__cache_directory, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as entry_file:
+                json.dump(cache_entry, entry_file)
+            os.replace(temporary_path, self.__entry_path(scan_file))
+            temporary_path = None
+        except OSError as this_exception:
+            LOGGER.warning(
+                "Unable to save cache entry for '%s': %s", scan_file, this_exception
+            )
+        finally:
+            if temporary_path:
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+
+    def evict_entries(self):
+        """
+        Keep the cache within its size bounds by removing the entries that were
+        least recently used.
+        """
+
+        entry_paths = []
+        with os.scandir(self.__cache_directory) as directory_entries:
+            for next_entry in directory_entries:
+                if next_entry.name.endswith(ScanCache.__entry_suffix):
+                    entry_paths.append((next_entry.stat().st_mtime, next_entry.path))
+
+        number_to_evict = len(entry_paths) - self.__maximum_entries
+        if number_to_evict <= 0:
+            return 0
+
+        entry_paths.sort()
+        for _, next_entry_path in entry_paths[:number_to_evict]:
+            try:
+                os.remove(next_entry_path)
+            except OSError:
+                pass
+        LOGGER.debug("Evicted %d entries from the scan cache.", number_to_evict)
+        return number_to_evict
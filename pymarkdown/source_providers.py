@@ -10,21 +10,21 @@ class InMemorySourceProvider:
     """
 
     def __init__(self, source_text):
-        self.next_token = source_text.split("\n", 1)
+        self.source_text, self.next_index = source_text, 0
 
     def get_next_line(self):
         """
         Get the next line from the source provider.
         """
         token_to_use = None
-        if self.next_token:
-            if len(self.next_token) == 2:
-                token_to_use = self.next_token[0]
-                self.next_token = self.next_token[1].split("\n", 1)
+        if self.next_index is not None:
+            end_index = self.source_text.find("\n", self.next_index)
+            if end_index != -1:
+                token_to_use = self.source_text[self.next_index : end_index]
+                self.next_index = end_index + 1
             else:
-                assert self.next_token
-                token_to_use = self.next_token[0]
-                self.next_token = None
+                token_to_use = self.source_text[self.next_index :]
+                self.next_index = None
         return token_to_use
 
 
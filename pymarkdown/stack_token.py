@@ -21,10 +21,16 @@ class StackToken:
     _stack_link_definition = "linkdef"
 
     def __init__(self, type_name, matching_markdown_token=None, extra_data=None):
-        self.__type_name, self.__extra_data, self.__matching_markdown_token = (
+        (
+            self.__type_name,
+            self.__extra_data,
+            self.__matching_markdown_token,
+            self.matching_markdown_token_index,
+        ) = (
             type_name,
             extra_data,
             matching_markdown_token,
+            None,
         )
 
     def __str__(self):
@@ -65,12 +71,6 @@ class StackToken:
         """
         return self.__matching_markdown_token
 
-    def reset_matching_markdown_token(self, new_matching_markdown_token):
-        """
-        Reset the matching markdown token.  To be used only when rewinding.
-        """
-        self.__matching_markdown_token = new_matching_markdown_token
-
     def generate_close_markdown_token_from_stack_token(
         self, extracted_whitespace=None, extra_end_data=None, was_forced=False
     ):
@@ -294,6 +294,7 @@ class ListStackToken(StackToken):
             self.__ws_after_marker,
             self.__start_index,
             self.__last_new_list_token,
+            self.last_list_token_search,
         ) = (
             indent_level,
             list_character,
@@ -301,6 +302,7 @@ class ListStackToken(StackToken):
             ws_after_marker,
             start_index,
             None,
+            None,
         )
 
         StackToken.__init__(
@@ -460,22 +462,22 @@ class LinkDefinitionStackToken(StackToken):
             self.__extracted_whitespace,
             self.__continuation_lines,
             self.__unmodified_lines,
+            self.__continuation_journal,
             self.__start_position_marker,
             self.original_stack_depth,
             self.original_document_depth,
             self.last_block_quote_stack_token,
-            self.last_block_quote_markdown_token_index,
-            self.copy_of_last_block_quote_markdown_token,
+            self.last_block_quote_leading_spaces_state,
         ) = (
             extracted_whitespace,
             [],
             [],
+            [],
             position_marker,
             None,
             None,
             None,
             None,
-            None,
         )
         StackToken.__init__(self, StackToken._stack_link_definition)
 
@@ -507,11 +509,32 @@ class LinkDefinitionStackToken(StackToken):
         """
         return self.__start_position_marker
 
-    def add_continuation_line(self, new_line):
+    @property
+    def is_known_failure(self):
+        """
+        Returns whether the continuation lines, ending with the last one, are
+        already known not to be a complete link definition, even if followed
+        by a blank line.
+        """
+        return bool(self.__continuation_journal) and self.__continuation_journal[-1]
+
+    def add_continuation_line(self, new_line, is_known_failure=False):
         """
-        Add the line to the collection of lines to keep as "continuations".
+        Add the line to the collection of lines to keep as "continuations",
+        journaling whether the lines up to and including this one are already
+        known not to be a complete link definition.
         """
         self.__continuation_lines.append(new_line)
+        self.__continuation_journal.append(is_known_failure)
+
+    def remove_last_continuation_line(self):
+        """
+        Remove the last line from the "continuations", returning the unmodified
+        text for that line.
+        """
+        del self.__continuation_lines[-1]
+        del self.__continuation_journal[-1]
+        return self.__unmodified_lines.pop()
 
     def add_unmodified_line(self, new_line):
         """
@@ -1,6 +1,7 @@
 """
 Module to provide a tokenization of a markdown-encoded string.
 """
+import copy
 import logging
 import os
 
@@ -40,11 +41,17 @@ class TokenizedMarkdown:
             self.stack,
             self.source_provider,
             self.__parse_properties,
-        ) = (None, None, None, None)
+            self.__streamed_token_count,
+            self.__streamed_pragma_lines,
+        ) = (None, None, None, None, 0, None)
 
-        if not resource_path:
-            resource_path = os.path.join(os.path.split(__file__)[0], "resources")
-        InlineHelper.initialize(resource_path)
+        if resource_path:
+            InlineHelper.initialize(resource_path)
+        else:
+            InlineHelper.initialize(
+                os.path.join(os.path.split(__file__)[0], "resources"),
+                defer_loading=True,
+            )
 
     def apply_configuration(self, application_properties, extension_manager):
         """
@@ -60,6 +67,76 @@ class TokenizedMarkdown:
         self.source_provider = source_provider
         return self.__transform()
 
+    def stream_from_provider(self, source_provider):
+        """
+        Transform the data from the source provider into a Markdown token stream,
+        yielding each token as soon as the top-level block that contains it is
+        closed, instead of returning every token once the document is parsed.
+
+        The tokens are the same as the ones returned by transform_from_provider,
+        except that any pragmas are yielded in separate PragmaToken instances,
+        each one ahead of the tokens for the lines that follow those pragmas.
+
+        As a link reference definition may follow the links that refer to it,
+        any block with a link whose label is not yet defined is held back, along
+        with every block after it, until the end of the document.  At that point,
+        if any of those labels were defined later, the block's inline processing
+        is done again.
+        """
+        self.source_provider = source_provider
+        try:
+            self.tokenized_document, self.stack = None, []
+
+            InlineProcessor.initialize()
+            LinkHelper.initialize()
+
+            held_chunks = []
+            for next_chunk in self.__parse_blocks_pass(is_streaming=True):
+                if next_chunk[0].is_pragma:
+                    final_chunk, original_chunk = next_chunk, None
+                else:
+                    (
+                        final_chunk,
+                        original_chunk,
+                    ) = TokenizedMarkdown.__parse_inline_for_chunk(next_chunk)
+                if held_chunks or original_chunk:
+                    held_chunks.append((final_chunk, original_chunk))
+                else:
+                    yield from final_chunk
+
+            for final_chunk, original_chunk in held_chunks:
+                if original_chunk and any(
+                    LinkHelper.is_link_label_defined(x) for x in original_chunk[1]
+                ):
+                    final_chunk = InlineProcessor.parse_inline(original_chunk[0])
+                yield from final_chunk
+        except Exception as this_exception:
+            raise BadTokenizationError(
+                "An unhandled error occurred processing the document."
+            ) from this_exception
+
+    @staticmethod
+    def __parse_inline_for_chunk(block_tokens):
+        """
+        Coalesce and parse the inline elements for the block tokens, returning
+        the final tokens.  If any link refers to a label that is not yet defined,
+        an unprocessed copy of the coalesced tokens and the set of those labels
+        are also returned, so that the chunk can be parsed again later.
+        """
+        coalesced_tokens = CoalesceProcessor.coalesce_text_blocks(block_tokens)
+        if not any(x.is_text and "]" in x.token_text for x in coalesced_tokens):
+            return InlineProcessor.parse_inline(coalesced_tokens), None
+
+        original_tokens, missed_link_labels = copy.deepcopy(coalesced_tokens), set()
+        LinkHelper.record_missed_link_labels(missed_link_labels)
+        try:
+            final_tokens = InlineProcessor.parse_inline(coalesced_tokens)
+        finally:
+            LinkHelper.record_missed_link_labels(None)
+        if not missed_link_labels:
+            return final_tokens, None
+        return final_tokens, (original_tokens, missed_link_labels)
+
     def transform(self, your_text_string, show_debug=False):
         """
         Transform a text string in a Markdown format into a Markdown token stream.
@@ -83,7 +160,7 @@ class TokenizedMarkdown:
             LinkHelper.initialize()
 
             POGGER.debug("\n\n>>>>>>>parse_blocks_pass>>>>>>")
-            first_pass_results = self.__parse_blocks_pass()
+            (first_pass_results,) = self.__parse_blocks_pass(is_streaming=False)
 
             POGGER.debug("\n\n>>>>>>>coalesce_text_blocks>>>>>>")
             coalesced_results = CoalesceProcessor.coalesce_text_blocks(
@@ -101,11 +178,16 @@ class TokenizedMarkdown:
             ) from this_exception
 
     # pylint: disable=too-many-statements,too-many-locals,too-many-branches
-    def __parse_blocks_pass(self):
+    def __parse_blocks_pass(self, is_streaming):
         """
         The first pass at the tokens is to deal with blocks.
+
+        Unless streaming, the entire document is yielded once it is parsed.  When
+        streaming, the tokens are yielded in chunks, each time that no block is
+        left open at the end of a line.
         """
 
+        is_debug_enabled = POGGER.is_debug_enabled
         self.stack = [DocumentStackToken()]
 
         self.tokenized_document = []
@@ -114,9 +196,11 @@ class TokenizedMarkdown:
         did_started_close = False
         requeue = []
         ignore_link_definition_start = False
-        POGGER.debug("---$---", token_to_use)
-        POGGER.debug("---")
+        if is_debug_enabled:
+            POGGER.debug("---$---", token_to_use)
+            POGGER.debug("---")
         self.__parse_properties.pragma_lines = {}
+        self.__streamed_token_count, self.__streamed_pragma_lines = 0, set()
         line_number = 1
         try:
             (
@@ -129,11 +213,12 @@ class TokenizedMarkdown:
             did_start_close = token_to_use is None
             keep_on_going = True
             while keep_on_going:
-                POGGER.debug("next-line>>$", token_to_use)
-                POGGER.debug("stack>>$", self.stack)
-                POGGER.debug("current_block>>$", self.stack[-1])
-                POGGER.debug("line_number>>$", line_number)
-                POGGER.debug("---")
+                if is_debug_enabled:
+                    POGGER.debug("next-line>>$", token_to_use)
+                    POGGER.debug("stack>>$", self.stack)
+                    POGGER.debug("current_block>>$", self.stack[-1])
+                    POGGER.debug("line_number>>$", line_number)
+                    POGGER.debug("---")
 
                 position_marker = PositionMarker(line_number, 0, token_to_use)
                 parser_state = ParserState(
@@ -143,7 +228,8 @@ class TokenizedMarkdown:
                     self.__handle_blank_line,
                 )
                 if did_start_close:
-                    POGGER.debug("\n\ncleanup")
+                    if is_debug_enabled:
+                        POGGER.debug("\n\ncleanup")
 
                     was_link_definition_started_before_close = self.stack[
                         -1
@@ -176,54 +262,24 @@ class TokenizedMarkdown:
                         did_start_close = False
                         tokens_from_line = None
                 else:
-                    POGGER.debug(">>>>$", self.tokenized_document)
-
-                    if not token_to_use or not token_to_use.strip():
-                        POGGER.debug("call __parse_blocks_pass>>handle_blank_line")
-                        (
-                            tokens_from_line,
-                            requeue_line_info,
-                        ) = self.__handle_blank_line(
-                            parser_state,
-                            token_to_use,
-                            from_main_transform=True,
-                            position_marker=position_marker,
-                        )
-                    else:
-                        POGGER.debug("\n\nnormal lines")
-                        (
-                            tokens_from_line,
-                            _,
-                            requeue_line_info,
-                        ) = ContainerBlockProcessor.parse_line_for_container_blocks(
-                            parser_state,
-                            position_marker,
-                            ignore_link_definition_start,
-                            self.__parse_properties,
-                            None,
-                        )
-
-                    POGGER.debug("<<<<$", self.tokenized_document)
+                    tokens_from_line, requeue_line_info = self.__parse_next_line(
+                        parser_state,
+                        token_to_use,
+                        position_marker,
+                        ignore_link_definition_start,
+                        is_debug_enabled,
+                    )
 
                 if keep_on_going:
                     line_number, ignore_link_definition_start = TokenizedMarkdown.__xx(
                         line_number, requeue_line_info, requeue
                     )
 
-                    POGGER.debug(
-                        "---\nbefore>>$",
-                        self.tokenized_document,
-                    )
-                    POGGER.debug("before>>$", tokens_from_line)
-                    if tokens_from_line:
-                        self.tokenized_document.extend(tokens_from_line)
-                    POGGER.debug(
-                        "after>>$",
-                        self.tokenized_document,
+                    self.__add_tokens_from_line(
+                        tokens_from_line, requeue, is_debug_enabled
                     )
-                    if requeue:
-                        POGGER.debug("requeue>>$", requeue)
-                    POGGER.debug("---")
+                    if is_streaming and not requeue and len(self.stack) == 1:
+                        yield from self.__stream_completed_tokens(is_final=False)
 
                     (
                         token_to_use,
@@ -236,14 +292,114 @@ class TokenizedMarkdown:
             error_message = f"A project assertion failed on line {str(line_number)} of the current document."
             raise BadTokenizationError(error_message) from this_exception
 
-        if self.__parse_properties.pragma_lines:
-            self.tokenized_document.append(
-                PragmaToken(self.__parse_properties.pragma_lines)
-            )
-        return self.tokenized_document
+        if is_streaming:
+            yield from self.__stream_completed_tokens(is_final=True)
+        else:
+            if self.__parse_properties.pragma_lines:
+                self.tokenized_document.append(
+                    PragmaToken(self.__parse_properties.pragma_lines)
+                )
+            yield self.tokenized_document
 
     # pylint: enable=too-many-statements,too-many-locals,too-many-branches
 
+    def __parse_next_line(
+        self,
+        parser_state,
+        token_to_use,
+        position_marker,
+        ignore_link_definition_start,
+        is_debug_enabled,
+    ):
+        """
+        Parse the next line of the document, returning any tokens that it closed.
+        """
+        if is_debug_enabled:
+            POGGER.debug(">>>>$", self.tokenized_document)
+
+        if not token_to_use or not token_to_use.strip():
+            if is_debug_enabled:
+                POGGER.debug("call __parse_blocks_pass>>handle_blank_line")
+            tokens_from_line, requeue_line_info = self.__handle_blank_line(
+                parser_state,
+                token_to_use,
+                from_main_transform=True,
+                position_marker=position_marker,
+            )
+        else:
+            if is_debug_enabled:
+                POGGER.debug("\n\nnormal lines")
+            (
+                tokens_from_line,
+                _,
+                requeue_line_info,
+            ) = ContainerBlockProcessor.parse_line_for_container_blocks(
+                parser_state,
+                position_marker,
+                ignore_link_definition_start,
+                self.__parse_properties,
+                None,
+            )
+
+        if is_debug_enabled:
+            POGGER.debug("<<<<$", self.tokenized_document)
+        return tokens_from_line, requeue_line_info
+
+    def __add_tokens_from_line(self, tokens_from_line, requeue, is_debug_enabled):
+        """
+        Add the tokens produced by the last line to the document.
+        """
+        if is_debug_enabled:
+            POGGER.debug(
+                "---\nbefore>>$",
+                self.tokenized_document,
+            )
+            POGGER.debug("before>>$", tokens_from_line)
+        if tokens_from_line:
+            self.tokenized_document.extend(tokens_from_line)
+        if is_debug_enabled:
+            POGGER.debug(
+                "after>>$",
+                self.tokenized_document,
+            )
+            if requeue:
+                POGGER.debug("requeue>>$", requeue)
+            POGGER.debug("---")
+
+    def __stream_completed_tokens(self, is_final):
+        """
+        Yield any pragmas found since the last chunk, followed by the tokens that
+        cannot be changed by any of the lines still to be parsed.
+
+        Trailing blank lines are held back until the next chunk, as the parsing
+        of the next line may still move them.  The last chunk yielded is also
+        kept at the start of the document, as the parsing of the next line may
+        look back at those tokens.
+        """
+        new_pragma_lines = {
+            line_number: pragma_line
+            for line_number, pragma_line in self.__parse_properties.pragma_lines.items()
+            if line_number not in self.__streamed_pragma_lines
+        }
+        if new_pragma_lines:
+            self.__streamed_pragma_lines.update(new_pragma_lines.keys())
+            yield [PragmaToken(new_pragma_lines)]
+
+        end_index = len(self.tokenized_document)
+        if not is_final:
+            while (
+                end_index > self.__streamed_token_count
+                and self.tokenized_document[end_index - 1].is_blank_line
+            ):
+                end_index -= 1
+        if end_index > self.__streamed_token_count:
+            next_chunk = self.tokenized_document[
+                self.__streamed_token_count : end_index
+            ]
+            del self.tokenized_document[: self.__streamed_token_count]
+            self.__streamed_token_count = len(next_chunk)
+            yield next_chunk
+
     @staticmethod
     def __xx(line_number, requeue_line_info, requeue):
 
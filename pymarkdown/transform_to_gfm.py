@@ -41,6 +41,7 @@ from pymarkdown.leaf_markdown_token import (
 from pymarkdown.markdown_token import MarkdownToken
 from pymarkdown.parser_helper import ParserHelper
 from pymarkdown.parser_logger import ParserLogger
+from pymarkdown.transform_to_gfm_html_writer import TransformToGfmHtmlWriter
 from pymarkdown.transform_to_gfm_list_looseness import TransformToGfmListLooseness
 
 POGGER = ParserLogger(logging.getLogger(__name__))
@@ -61,14 +62,13 @@ class TransformState:
             self.is_in_fenced_code_block,
             self.is_in_html_block,
             self.is_in_loose_list,
-            self.transform_stack,
             self.add_trailing_text,
             self.add_leading_text,
             self.actual_tokens,
             self.actual_token_index,
             self.next_token,
             self.last_token,
-        ) = (False, False, False, True, [], None, None, actual_tokens, 0, None, None)
+        ) = (False, False, False, True, None, None, actual_tokens, 0, None, None)
 
 
 # pylint: enable=too-many-instance-attributes, too-few-public-methods
@@ -79,20 +79,6 @@ class TransformToGfm:
     Class to provide for a transformation from markdown tokens to html for GFM.
     """
 
-    add_trailing_text_tokens = [
-        "<hr />",
-        "<p>",
-        "<h1>",
-        "<h2>",
-        "<h3>",
-        "<h4>",
-        "<h5>",
-        "<h6>",
-        "<pre>",
-        "<ul>",
-        "<ol>",
-        '<ol start="',
-    ]
     uri_autolink_html_character_escape_map = {
         "<": "&lt;",
         ">": "&gt;",
@@ -207,14 +193,18 @@ class TransformToGfm:
         if end_token_handler:
             self.end_token_handlers[handler_instance.token_name] = end_token_handler
 
-    def transform(self, actual_tokens):
+    def transform(self, actual_tokens, output_stream=None):
         """
-        Transform the tokens into html.
+        Transform the tokens into html.  If an output stream is supplied, the html
+        is written to that stream as it is produced instead of being returned.
         """
         POGGER.debug("\n\n---\n")
-        transform_state, output_html, actual_tokens_size = (
+        transform_state, html_writer, actual_tokens_size = (
             TransformState(actual_tokens),
-            "",
+            TransformToGfmHtmlWriter(
+                output_stream,
+                self.__are_list_tokens_balanced(actual_tokens),
+            ),
             len(actual_tokens),
         )
         for next_token in transform_state.actual_tokens:
@@ -229,14 +219,12 @@ class TransformToGfm:
                 ]
             if next_token.token_name in self.start_token_handlers:
                 start_handler_fn = self.start_token_handlers[next_token.token_name]
-                output_html = start_handler_fn(output_html, next_token, transform_state)
+                start_handler_fn(html_writer, next_token, transform_state)
 
             elif next_token.is_end_token:
                 if next_token.type_name in self.end_token_handlers:
                     end_handler_fn = self.end_token_handlers[next_token.type_name]
-                    output_html = end_handler_fn(
-                        output_html, next_token, transform_state
-                    )
+                    end_handler_fn(html_writer, next_token, transform_state)
                 else:
                     assert (
                         False
@@ -252,73 +240,41 @@ class TransformToGfm:
                 transform_state.add_trailing_text,
             )
             POGGER.debug("add_leading_text -->$<--", transform_state.add_leading_text)
-            POGGER.debug("output_html    -->$<--", output_html)
 
             if transform_state.add_trailing_text:
-                output_html = self.__apply_trailing_text(output_html, transform_state)
+                html_writer.end_segment(transform_state.add_trailing_text)
 
             if transform_state.add_leading_text:
-                output_html = self.__apply_leading_text(output_html, transform_state)
+                html_writer.start_segment(transform_state.add_leading_text)
 
             POGGER.debug("------")
             POGGER.debug("next_token     -->$<--", next_token)
-            POGGER.debug("output_html    -->$<--", output_html)
-            POGGER.debug("transform_stack-->$<--", transform_state.transform_stack)
 
+            html_writer.flush()
             transform_state.last_token = next_token
             transform_state.actual_token_index += 1
-        if output_html and output_html[-1] == ParserHelper.newline_character:
-            output_html = output_html[:-1]
-        POGGER.debug("output_html    -->$<--", output_html)
-        return output_html
-
-    @classmethod
-    def __apply_trailing_text(cls, output_html, transform_state):
-        """
-        Apply any trailing text to the output.
-        """
-        POGGER.debug("__apply_trailing_text>:$:<", output_html)
-        stack_text = transform_state.transform_stack.pop()
-        trailing_part = [stack_text]
-        for next_token_to_test in TransformToGfm.add_trailing_text_tokens:
-            if output_html.startswith(next_token_to_test):
-                trailing_part.append(ParserHelper.newline_character)
-                break
-
-        POGGER.debug("trailing_part>:$:<", trailing_part)
-        if trailing_part[-1].endswith("<li>") and output_html.startswith(
-            "<blockquote>"
-        ):
-            trailing_part.append(ParserHelper.newline_character)
-        trailing_part.append(output_html)
-        POGGER.debug("trailing_part>:$:<", trailing_part)
-        if output_html.endswith("</ul>") or output_html.endswith("</ol>"):
-            trailing_part.append(ParserHelper.newline_character)
-        trailing_part.append(transform_state.add_trailing_text)
-        combined_text = "".join(trailing_part)
-        POGGER.debug("__apply_trailing_text>:$:<", combined_text)
-        return combined_text
+        return html_writer.close()
 
     @classmethod
-    def __apply_leading_text(cls, output_html, transform_state):
+    def __are_list_tokens_balanced(cls, actual_tokens):
         """
-        Apply any leading text to the output.
+        Returns whether each list start token has a matching end token, so that
+        no segment of the html can be left open at the end of the document.
         """
-
-        output_html = (
-            f"{output_html}{ParserHelper.newline_character}{transform_state.add_leading_text}"
-            if output_html and output_html[-1] != ParserHelper.newline_character
-            else f"{output_html}{transform_state.add_leading_text}"
-        )
-        transform_state.transform_stack.append(output_html)
-        return ""
+        list_depth = 0
+        for next_token in actual_tokens:
+            if next_token.is_list_start:
+                list_depth += 1
+            elif next_token.is_list_end:
+                list_depth -= 1
+        return not list_depth
 
     @classmethod
-    def __handle_text_token(cls, output_html, next_token, transform_state):
+    def __handle_text_token(cls, html_writer, next_token, transform_state):
         """
         Handle the text token.
         """
-        adjusted_text_token = ParserHelper.resolve_all_from_text(next_token.token_text)
+        adjusted_text_token = next_token.resolved_text
 
         token_parts = []
         if transform_state.is_in_code_block:
@@ -339,69 +295,68 @@ class TransformToGfm:
         else:
             token_parts.append(adjusted_text_token)
 
-        token_parts.insert(0, output_html)
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_start_paragraph_token(cls, output_html, next_token, transform_state):
+    def __handle_start_paragraph_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start paragraph token.
         """
         _ = next_token
-        token_parts = [output_html]
-        if output_html and output_html[-1] != ParserHelper.newline_character:
+        token_parts = []
+        if not html_writer.is_segment_empty and not html_writer.ends_with(
+            ParserHelper.newline_character
+        ):
             token_parts.append(ParserHelper.newline_character)
         if transform_state.is_in_loose_list:
             token_parts.append("<p>")
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_end_paragraph_token(cls, output_html, next_token, transform_state):
+    def __handle_end_paragraph_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end paragraph token.
         """
         _ = next_token
 
-        return (
-            f"{output_html}</p>{ParserHelper.newline_character}"
-            if transform_state.is_in_loose_list
-            else output_html
-        )
+        if transform_state.is_in_loose_list:
+            html_writer.write(f"</p>{ParserHelper.newline_character}")
 
     @classmethod
-    def __handle_blank_line_token(cls, output_html, next_token, transform_state):
+    def __handle_blank_line_token(cls, html_writer, next_token, transform_state):
         """
         Handle the black line token.
         """
         _ = next_token
 
         if transform_state.is_in_html_block:
-            output_html = f"{output_html}{ParserHelper.newline_character}"
-        return output_html
+            html_writer.write(ParserHelper.newline_character)
 
     @classmethod
-    def __handle_start_block_quote_token(cls, output_html, next_token, transform_state):
+    def __handle_start_block_quote_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start block quote token.
         """
         _ = next_token
 
-        token_parts = [output_html]
-        if output_html and not output_html[-1] == ParserHelper.newline_character:
+        token_parts = []
+        if not html_writer.is_segment_empty and not html_writer.ends_with(
+            ParserHelper.newline_character
+        ):
             token_parts.append(ParserHelper.newline_character)
         transform_state.is_in_loose_list = True
         token_parts.extend(["<blockquote>", ParserHelper.newline_character])
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_end_block_quote_token(cls, output_html, next_token, transform_state):
+    def __handle_end_block_quote_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end block quote token.
         """
         _ = next_token
 
-        token_parts = [output_html]
-        if output_html[-1] != ParserHelper.newline_character:
+        token_parts = []
+        if not html_writer.ends_with(ParserHelper.newline_character):
             token_parts.append(ParserHelper.newline_character)
         transform_state.is_in_loose_list = (
             TransformToGfmListLooseness.reset_list_looseness(
@@ -410,11 +365,11 @@ class TransformToGfm:
             )
         )
         token_parts.extend(["</blockquote>", ParserHelper.newline_character])
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
     def __handle_start_indented_code_block_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the start indented code block token.
@@ -422,26 +377,21 @@ class TransformToGfm:
         _ = next_token
 
         token_parts = []
-        if (
-            not output_html
-            and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
-        ):
+        if html_writer.is_segment_empty:
+            if html_writer.is_segment_after("<li>"):
+                token_parts.append(ParserHelper.newline_character)
+        elif not html_writer.ends_with(ParserHelper.newline_character):
             token_parts.append(ParserHelper.newline_character)
-        elif output_html and output_html[-1] != ParserHelper.newline_character:
-            token_parts.extend([output_html, ParserHelper.newline_character])
-        else:
-            token_parts.append(output_html)
         transform_state.is_in_code_block, transform_state.is_in_fenced_code_block = (
             True,
             False,
         )
         token_parts.append("<pre><code>")
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
     def __handle_end_indented_code_block_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the end indented code block token.
@@ -449,25 +399,27 @@ class TransformToGfm:
         _ = next_token
 
         transform_state.is_in_code_block = False
-        return "".join(
-            [
-                output_html,
-                ParserHelper.newline_character,
-                "</code></pre>",
-                ParserHelper.newline_character,
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    ParserHelper.newline_character,
+                    "</code></pre>",
+                    ParserHelper.newline_character,
+                ]
+            )
         )
 
     @classmethod
     def __handle_start_fenced_code_block_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the start fenced code block token.
         """
-        token_parts = [output_html]
-        if (output_html.endswith("</ol>") or output_html.endswith("</ul>")) or (
-            output_html and output_html[-1] != ParserHelper.newline_character
+        token_parts = []
+        if (html_writer.ends_with("</ol>") or html_writer.ends_with("</ul>")) or (
+            not html_writer.is_segment_empty
+            and not html_writer.ends_with(ParserHelper.newline_character)
         ):
             token_parts.append(ParserHelper.newline_character)
         transform_state.is_in_code_block, transform_state.is_in_fenced_code_block = (
@@ -478,11 +430,11 @@ class TransformToGfm:
         if next_token.extracted_text:
             token_parts.extend([' class="language-', next_token.extracted_text, '"'])
         token_parts.append(">")
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
     def __handle_end_fenced_code_block_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the end fenced code block token.
@@ -505,20 +457,18 @@ class TransformToGfm:
         inner_tag = "".join(inner_tag_parts)
 
         POGGER.debug(f"inner_tag>>:{inner_tag}:<<")
-        POGGER.debug(f"output_html>>:{output_html}:<<")
         POGGER.debug(
             f"last_token>>:{str(transform_state.actual_tokens[transform_state.actual_token_index - 1])}:<<"
         )
 
-        token_parts = [output_html]
-        if (
-            not output_html.endswith(inner_tag)
-            and output_html[-1] != ParserHelper.newline_character
+        token_parts = []
+        if not html_writer.ends_with(inner_tag) and not html_writer.ends_with(
+            ParserHelper.newline_character
         ):
             token_parts.append(ParserHelper.newline_character)
             POGGER.debug("#1")
         elif (
-            output_html[-1] == ParserHelper.newline_character
+            html_writer.ends_with(ParserHelper.newline_character)
             and transform_state.last_token.is_text
         ):
             POGGER.debug("#2:$", transform_state.last_token)
@@ -532,32 +482,34 @@ class TransformToGfm:
             False,
         )
         token_parts.extend(["</code></pre>", ParserHelper.newline_character])
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_thematic_break_token(cls, output_html, next_token, transform_state):
+    def __handle_thematic_break_token(cls, html_writer, next_token, transform_state):
         """
         Handle the thematic break token.
         """
         _ = (next_token, transform_state)
 
-        token_parts = [output_html]
-        if output_html and output_html[-1] != ParserHelper.newline_character:
+        token_parts = []
+        if not html_writer.is_segment_empty and not html_writer.ends_with(
+            ParserHelper.newline_character
+        ):
             token_parts.append(ParserHelper.newline_character)
         token_parts.extend(["<hr />", ParserHelper.newline_character])
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_hard_break_token(cls, output_html, next_token, transform_state):
+    def __handle_hard_break_token(cls, html_writer, next_token, transform_state):
         """
         Handle the hard line break token.
         """
         _ = (next_token, transform_state)
 
-        return "".join([output_html, "<br />", ParserHelper.newline_character])
+        html_writer.write(f"<br />{ParserHelper.newline_character}")
 
     @classmethod
-    def __handle_start_atx_heading_token(cls, output_html, next_token, transform_state):
+    def __handle_start_atx_heading_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start atx heading token.
         """
@@ -565,16 +517,16 @@ class TransformToGfm:
             transform_state.actual_token_index - 1
         ]
 
-        token_parts = [output_html]
-        if output_html.endswith("</ol>") or output_html.endswith("</ul>"):
+        token_parts = []
+        if html_writer.ends_with("</ol>") or html_writer.ends_with("</ul>"):
             token_parts.append(ParserHelper.newline_character)
         elif previous_token.is_paragraph_end and not transform_state.is_in_loose_list:
             token_parts.append(ParserHelper.newline_character)
         token_parts.extend(["<h", str(next_token.hash_count), ">"])
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_end_atx_heading_token(cls, output_html, next_token, transform_state):
+    def __handle_end_atx_heading_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end atx heading token.
         """
@@ -584,36 +536,37 @@ class TransformToGfm:
         while not transform_state.actual_tokens[fenced_token].is_atx_heading:
             fenced_token -= 1
 
-        return "".join(
-            [
-                output_html,
-                "</h",
-                str(transform_state.actual_tokens[fenced_token].hash_count),
-                ">",
-                ParserHelper.newline_character,
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    "</h",
+                    str(transform_state.actual_tokens[fenced_token].hash_count),
+                    ">",
+                    ParserHelper.newline_character,
+                ]
+            )
         )
 
     @classmethod
     def __handle_start_setext_heading_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the start setext heading token.
         """
         _ = transform_state
 
-        token_parts = [output_html]
-        if output_html.endswith("</ol>") or output_html.endswith("</ul>"):
+        token_parts = []
+        if html_writer.ends_with("</ol>") or html_writer.ends_with("</ul>"):
             token_parts.append(ParserHelper.newline_character)
         token_parts.extend(
             ["<h", "1" if next_token.heading_character == "=" else "2", ">"]
         )
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
     def __handle_end_setext_heading_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the end setext heading token.
@@ -624,7 +577,6 @@ class TransformToGfm:
         while not transform_state.actual_tokens[fenced_token].is_setext_heading:
             fenced_token -= 1
         token_parts = [
-            output_html,
             "</h",
             "1"
             if transform_state.actual_tokens[fenced_token].heading_character == "="
@@ -632,10 +584,10 @@ class TransformToGfm:
             ">",
             ParserHelper.newline_character,
         ]
-        return "".join(token_parts)
+        html_writer.write("".join(token_parts))
 
     @classmethod
-    def __handle_new_list_item_token(cls, output_html, next_token, transform_state):
+    def __handle_new_list_item_token(cls, html_writer, next_token, transform_state):
         """
         Handle the new list item token.
         """
@@ -645,91 +597,83 @@ class TransformToGfm:
             "</li>",
             "<li>",
         )
-        token_parts = [output_html]
-        if output_html and output_html[-1] == ">":
-            token_parts.append(ParserHelper.newline_character)
-        return "".join(token_parts)
+        if html_writer.ends_with(">"):
+            html_writer.write(ParserHelper.newline_character)
 
     @classmethod
-    def __handle_inline_code_span_token(cls, output_html, next_token, transform_state):
+    def __handle_inline_code_span_token(cls, html_writer, next_token, transform_state):
         """
         Handle the code span token.
         """
         _ = transform_state
 
-        return "".join(
-            [
-                output_html,
-                "<code>",
-                ParserHelper.resolve_all_from_text(next_token.span_text),
-                "</code>",
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    "<code>",
+                    ParserHelper.resolve_all_from_text(next_token.span_text),
+                    "</code>",
+                ]
+            )
         )
 
     @classmethod
-    def __handle_raw_html_token(cls, output_html, next_token, transform_state):
+    def __handle_raw_html_token(cls, html_writer, next_token, transform_state):
         """
         Handle the raw html token.
         """
         _ = transform_state
 
-        return "".join(
-            [
-                output_html,
-                "<",
-                ParserHelper.resolve_all_from_text(next_token.raw_tag),
-                ">",
-            ]
+        html_writer.write(
+            "".join(["<", ParserHelper.resolve_all_from_text(next_token.raw_tag), ">"])
         )
 
     @classmethod
     def __handle_link_reference_definition_token(
-        cls, output_html, next_token, transform_state
+        cls, html_writer, next_token, transform_state
     ):
         """
         Handle the link reference definition token.
         """
-        _ = (transform_state, next_token)
-
-        return output_html
+        _ = (html_writer, transform_state, next_token)
 
     @classmethod
-    def __handle_pragma_token(cls, output_html, next_token, transform_state):
+    def __handle_pragma_token(cls, html_writer, next_token, transform_state):
         """
         Handle the link reference definition token.
         """
-        _ = (transform_state, next_token)
-
-        return output_html
+        _ = (html_writer, transform_state, next_token)
 
     @classmethod
-    def __handle_email_autolink_token(cls, output_html, next_token, transform_state):
+    def __handle_email_autolink_token(cls, html_writer, next_token, transform_state):
         """
         Handle the email autolink token.
         """
         _ = transform_state
 
-        return "".join(
-            [
-                output_html,
-                '<a href="mailto:',
-                next_token.autolink_text,
-                '">',
-                next_token.autolink_text,
-                "</a>",
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    '<a href="mailto:',
+                    next_token.autolink_text,
+                    '">',
+                    next_token.autolink_text,
+                    "</a>",
+                ]
+            )
         )
 
     @classmethod
     def __handle_start_list_token(
         cls,
-        output_html,
+        html_writer,
         next_token,
         transform_state,
     ):
         """
         Handle the start unordered list token.
         """
+        _ = html_writer
         transform_state.is_in_loose_list = (
             TransformToGfmListLooseness.calculate_list_looseness(
                 transform_state.actual_tokens,
@@ -749,18 +693,18 @@ class TransformToGfm:
             transform_state.add_leading_text = "".join(
                 ["<ul>", ParserHelper.newline_character, "<li>"]
             )
-        return output_html
 
     @classmethod
     def __handle_end_list_token(
         cls,
-        output_html,
+        html_writer,
         next_token,
         transform_state,
     ):
         """
         Handle the end list token for either an ordered or unordered list.
         """
+        _ = html_writer
         transform_state.is_in_loose_list = (
             TransformToGfmListLooseness.reset_list_looseness(
                 transform_state.actual_tokens,
@@ -774,10 +718,9 @@ class TransformToGfm:
                 "</ul>" if next_token.is_unordered_list_end else "</ol>",
             ]
         )
-        return output_html
 
     @classmethod
-    def __handle_uri_autolink(cls, output_html, next_token, transform_state):
+    def __handle_uri_autolink(cls, html_writer, next_token, transform_state):
         """
         Handle the uri autolink token.
         """
@@ -801,125 +744,123 @@ class TransformToGfm:
             else:
                 tag_text_parts.append(next_character)
 
-        return "".join(
-            [
-                output_html,
-                '<a href="',
-                "".join(tag_text_parts),
-                '">',
-                InlineHelper.append_text(
-                    "", next_token.autolink_text, add_text_signature=False
-                ),
-                "</a>",
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    '<a href="',
+                    "".join(tag_text_parts),
+                    '">',
+                    InlineHelper.append_text(
+                        "", next_token.autolink_text, add_text_signature=False
+                    ),
+                    "</a>",
+                ]
+            )
         )
 
     @classmethod
-    def __handle_start_html_block_token(cls, output_html, next_token, transform_state):
+    def __handle_start_html_block_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start html block token.
         """
         _ = next_token
 
         transform_state.is_in_html_block = True
-        token_parts = []
-        if (
-            not output_html
-            and transform_state.transform_stack
-            and transform_state.transform_stack[-1].endswith("<li>")
-        ):
-            token_parts.append(ParserHelper.newline_character)
+        if html_writer.is_segment_empty and html_writer.is_segment_after("<li>"):
+            html_writer.write(ParserHelper.newline_character)
         else:
             previous_token = transform_state.actual_tokens[
                 transform_state.actual_token_index - 1
             ]
             POGGER.debug(">previous_token>$>", previous_token)
-            token_parts.append(output_html)
             if previous_token.is_list_end:
-                token_parts.append(ParserHelper.newline_character)
+                html_writer.write(ParserHelper.newline_character)
             elif previous_token.is_paragraph_end:
                 if not transform_state.is_in_loose_list:
-                    token_parts.append(ParserHelper.newline_character)
-        return "".join(token_parts)
+                    html_writer.write(ParserHelper.newline_character)
 
     @classmethod
-    def __handle_end_html_block_token(cls, output_html, next_token, transform_state):
+    def __handle_end_html_block_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end html block token.
         """
         _ = next_token
 
+        _ = html_writer
+
         transform_state.is_in_html_block = False
-        return output_html
 
     @classmethod
-    def __handle_start_emphasis_token(cls, output_html, next_token, transform_state):
+    def __handle_start_emphasis_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start emphasis token.
         """
         _ = transform_state
 
-        return "".join(
-            [output_html, "<em>" if next_token.emphasis_length == 1 else "<strong>"]
-        )
+        html_writer.write("<em>" if next_token.emphasis_length == 1 else "<strong>")
 
     @classmethod
-    def __handle_end_emphasis_token(cls, output_html, next_token, transform_state):
+    def __handle_end_emphasis_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end emphasis token.
         """
         _ = transform_state
 
-        return "".join(
-            [
-                output_html,
-                "</em>"
-                if next_token.start_markdown_token.emphasis_length == 1
-                else "</strong>",
-            ]
+        html_writer.write(
+            "</em>"
+            if next_token.start_markdown_token.emphasis_length == 1
+            else "</strong>"
         )
 
     @classmethod
-    def __handle_start_link_token(cls, output_html, next_token, transform_state):
+    def __handle_start_link_token(cls, html_writer, next_token, transform_state):
         """
         Handle the start link token.
         """
         _ = transform_state
-        return "".join(
-            [
-                output_html,
-                '<a href="',
-                next_token.link_uri,
-                f'" title="{next_token.link_title}' if next_token.link_title else "",
-                '">',
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    '<a href="',
+                    next_token.link_uri,
+                    f'" title="{next_token.link_title}'
+                    if next_token.link_title
+                    else "",
+                    '">',
+                ]
+            )
         )
 
     @classmethod
-    def __handle_end_link_token(cls, output_html, next_token, transform_state):
+    def __handle_end_link_token(cls, html_writer, next_token, transform_state):
         """
         Handle the end link token.
         """
         _ = (next_token, transform_state)
 
-        return f"{output_html}</a>"
+        html_writer.write("</a>")
 
     @classmethod
-    def __handle_image_token(cls, output_html, next_token, transform_state):
+    def __handle_image_token(cls, html_writer, next_token, transform_state):
         """
         Handle the image token.
         """
         _ = transform_state
 
-        return "".join(
-            [
-                output_html,
-                '<img src="',
-                next_token.link_uri,
-                '" alt="',
-                next_token.image_alt_text,
-                '" ',
-                (f'title="{next_token.link_title}" ' if next_token.link_title else ""),
-                "/>",
-            ]
+        html_writer.write(
+            "".join(
+                [
+                    '<img src="',
+                    next_token.link_uri,
+                    '" alt="',
+                    next_token.image_alt_text,
+                    '" ',
+                    (
+                        f'title="{next_token.link_title}" '
+                        if next_token.link_title
+                        else ""
+                    ),
+                    "/>",
+                ]
+            )
         )
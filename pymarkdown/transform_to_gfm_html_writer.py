@@ -0,0 +1,181 @@
+"""
+Module to collect the html produced by the GFM transformer.
+"""
+
+
+class TransformToGfmHtmlWriter:
+    """
+    Class to collect the html produced by the GFM transformer, either into a list
+    of parts that is joined once at the end, or into a supplied text stream.
+
+    The html for a list item is written as a segment.  The newline that may be
+    needed between the text before a segment and the segment itself is not known
+    until the segment is ended, so an empty part is kept as a placeholder for it.
+    Parts are only written to the stream when no segments are open, and the last
+    part is always kept back so that the end of the html can be checked and the
+    final newline removed.  As the html before any segment left open at the end
+    is dropped, parts are only written early if no segment can be left open.
+    """
+
+    __flush_part_count = 256
+
+    __newline_before_segment_starts = [
+        "<hr />",
+        "<p>",
+        "<h1>",
+        "<h2>",
+        "<h3>",
+        "<h4>",
+        "<h5>",
+        "<h6>",
+        "<pre>",
+        "<ul>",
+        "<ol>",
+        '<ol start="',
+    ]
+
+    def __init__(self, output_stream=None, is_flush_allowed=True):
+        (
+            self.__output_stream,
+            self.__is_flush_allowed,
+            self.__html_parts,
+            self.__html_length,
+            self.__segment_start_index,
+            self.__segment_start_length,
+            self.__segment_stack,
+        ) = (output_stream, is_flush_allowed, [], 0, 0, 0, [])
+
+    @property
+    def is_segment_empty(self):
+        """
+        Returns whether any html has been written in the current segment.
+        """
+        return self.__html_length == self.__segment_start_length
+
+    def write(self, html_text):
+        """
+        Write the html text at the end of the current segment.
+        """
+        if html_text:
+            self.__html_parts.append(html_text)
+            self.__html_length += len(html_text)
+
+    def ends_with(self, html_suffix):
+        """
+        Returns whether the html in the current segment ends with the suffix.
+        """
+        if len(html_suffix) > self.__html_length - self.__segment_start_length:
+            return False
+        return self.__parts_end_with(
+            len(self.__html_parts), self.__segment_start_index, html_suffix
+        )
+
+    def starts_with(self, html_prefix):
+        """
+        Returns whether the html in the current segment starts with the prefix.
+        """
+        collected_parts, collected_length, part_index = (
+            [],
+            0,
+            self.__segment_start_index,
+        )
+        while collected_length < len(html_prefix) and part_index < len(
+            self.__html_parts
+        ):
+            collected_parts.append(self.__html_parts[part_index])
+            collected_length += len(self.__html_parts[part_index])
+            part_index += 1
+        return "".join(collected_parts).startswith(html_prefix)
+
+    def is_segment_after(self, html_suffix):
+        """
+        Returns whether a segment is open and the html before it ends with the suffix.
+        """
+        return bool(self.__segment_stack) and self.__parts_end_with(
+            self.__segment_start_index - 1, 0, html_suffix
+        )
+
+    def start_segment(self, leading_text):
+        """
+        Write the leading text, on a new line if needed, and start a new segment
+        after it.
+        """
+        if not self.is_segment_empty and not self.ends_with("\n"):
+            self.write("\n")
+        self.write(leading_text)
+        self.__segment_stack.append(
+            (self.__segment_start_index, self.__segment_start_length)
+        )
+        self.__html_parts.append("")
+        self.__segment_start_index, self.__segment_start_length = (
+            len(self.__html_parts),
+            self.__html_length,
+        )
+
+    def end_segment(self, trailing_text):
+        """
+        End the current segment with the trailing text, filling in any newline
+        needed before the segment.
+        """
+        needs_newline_before = any(
+            self.starts_with(next_start)
+            for next_start in TransformToGfmHtmlWriter.__newline_before_segment_starts
+        ) or (self.is_segment_after("<li>") and self.starts_with("<blockquote>"))
+        if self.ends_with("</ul>") or self.ends_with("</ol>"):
+            self.write("\n")
+        self.write(trailing_text)
+        if needs_newline_before:
+            self.__html_parts[self.__segment_start_index - 1] = "\n"
+            self.__html_length += 1
+        (
+            self.__segment_start_index,
+            self.__segment_start_length,
+        ) = self.__segment_stack.pop()
+
+    def flush(self):
+        """
+        If writing to a stream, flushing is allowed, and no segments are open,
+        write all but the last of the collected parts to the stream.
+        """
+        if (
+            self.__output_stream
+            and self.__is_flush_allowed
+            and not self.__segment_stack
+            and len(self.__html_parts) > TransformToGfmHtmlWriter.__flush_part_count
+        ):
+            self.__output_stream.write("".join(self.__html_parts[:-1]))
+            del self.__html_parts[:-1]
+
+    def close(self):
+        """
+        Finish the html, removing any final newline.  If writing to a stream, the
+        rest of the html is written to it, otherwise the html is returned.
+
+        If any segments were not ended, only the html in the innermost one is
+        kept, as happened when the text before each segment was held on a stack.
+        """
+        if self.__segment_stack:
+            del self.__html_parts[: self.__segment_start_index]
+            (
+                self.__html_length,
+                self.__segment_start_index,
+                self.__segment_start_length,
+            ) = (self.__html_length - self.__segment_start_length, 0, 0)
+            self.__segment_stack.clear()
+        if self.ends_with("\n"):
+            self.__html_parts[-1] = self.__html_parts[-1][:-1]
+            self.__html_length -= 1
+        if not self.__output_stream:
+            return "".join(self.__html_parts)
+        self.__output_stream.write("".join(self.__html_parts))
+        self.__html_parts.clear()
+        return None
+
+    def __parts_end_with(self, end_index, minimum_index, html_suffix):
+        collected_parts, collected_length, part_index = [], 0, end_index - 1
+        while collected_length < len(html_suffix) and part_index >= minimum_index:
+            collected_parts.append(self.__html_parts[part_index])
+            collected_length += len(self.__html_parts[part_index])
+            part_index -= 1
+        collected_parts.reverse()
+        return "".join(collected_parts).endswith(html_suffix)
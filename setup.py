@@ -84,6 +84,10 @@ setup(
         (
             "Lib/site-packages/pymarkdown/resources",
             ["pymarkdown/resources/entities.json"],
-        )
+        ),
+        (
+            "Lib/site-packages/pymarkdown/plugins",
+            ["pymarkdown/plugins/plugin_manifest.json"],
+        ),
     ],
 )
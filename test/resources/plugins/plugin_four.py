@@ -0,0 +1,41 @@
+"""
+Module to implement a sample plugin that reports the lines it is given all at once.
+"""
+from pymarkdown.plugin_manager import Plugin, PluginDetails
+
+
+class PluginFour(Plugin):
+    """
+    Class to implement a sample plugin that reports the lines it is given all at once.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetails(
+            plugin_name="debug-only-4,",
+            plugin_id="MD995",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+            plugin_interface_version=1,
+        )
+
+    def next_line(self, context, line):
+        """
+        Event that a new line is being processed.
+        """
+        print(self.get_details().plugin_id + ">>next_line:" + line)
+
+    def next_lines(self, context, lines):
+        """
+        Event that all of the lines are being processed at once.
+        """
+        print(
+            self.get_details().plugin_id
+            + ">>next_lines:"
+            + str(context.line_number)
+            + ":"
+            + str(len(lines))
+        )
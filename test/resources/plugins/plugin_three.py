@@ -0,0 +1,35 @@
+"""
+Module to implement a sample plugin that reports the tokens that it has asked for.
+"""
+from pymarkdown.plugin_manager import Plugin, PluginDetails
+
+
+class PluginThree(Plugin):
+    """
+    Class to implement a sample plugin that reports the tokens that it has asked for.
+    """
+
+    def get_details(self):
+        """
+        Get the details for the plugin.
+        """
+        return PluginDetails(
+            plugin_name="debug-only-3,",
+            plugin_id="MD996",
+            plugin_enabled_by_default=True,
+            plugin_description="Debug plugin",
+            plugin_version="0.0.0",
+            plugin_interface_version=1,
+        )
+
+    def get_next_token_names(self):
+        """
+        Get the names of the tokens that the next_token function is to be called for.
+        """
+        return ["atx", "end-atx"]
+
+    def next_token(self, context, token):
+        """
+        Event that a new token is being processed.
+        """
+        print(self.get_details().plugin_id + ">>next_token:" + token.token_name)
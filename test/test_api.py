@@ -0,0 +1,303 @@
+"""
+Module to provide tests related to the PyMarkdownApi class.
+"""
+import os
+from test.transform_to_markdown import TransformToMarkdown
+
+import pytest
+
+from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
+from pymarkdown.parsed_document import ParsedDocument
+
+from .utils import write_temporary_configuration
+
+
+def test_api_scan_string_with_failure():
+    """
+    Test to make sure that scanning a string reports each failure as an object
+    with the details of the failure.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+    string_to_scan = "# Heading\n\nSome text."
+
+    # Act
+    scan_result = linter.scan_string(string_to_scan)
+
+    # Assert
+    assert not scan_result.pragma_failures
+    assert len(scan_result.scan_failures) == 1
+    scan_failure = scan_result.scan_failures[0]
+    assert scan_failure.scan_file == PyMarkdownApi.default_scan_name
+    assert scan_failure.line_number == 3
+    assert scan_failure.column_number == 10
+    assert scan_failure.rule_id == "MD047"
+    assert scan_failure.rule_name == "single-trailing-newline"
+    assert (
+        str(scan_failure)
+        == "in-memory.md:3:10: MD047: Each file should end with a single newline character. (single-trailing-newline)"
+    )
+
+
+def test_api_scan_string_multiple_times():
+    """
+    Test to make sure that the same linter can be used for multiple scans, with
+    each scan only reporting its own failures.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+
+    # Act
+    first_result = linter.scan_string("Some text.", scan_name="first.md")
+    second_result = linter.scan_string("# Heading\n")
+
+    # Assert
+    assert [x.rule_id for x in first_result.scan_failures] == ["MD041", "MD047"]
+    assert [x.scan_file for x in first_result.scan_failures] == [
+        "first.md",
+        "first.md",
+    ]
+    assert not second_result.scan_failures
+
+
+def test_api_scan_string_with_disabled_rule():
+    """
+    Test to make sure that rules disabled when constructing the linter are
+    not reported.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi(disable_rules=["md047"])
+
+    # Act
+    scan_result = linter.scan_string("# Heading\n\nSome text.")
+
+    # Assert
+    assert not scan_result.scan_failures
+    assert "md047" not in linter.enabled_rules
+
+
+def test_api_scan_string_with_only_line_rules():
+    """
+    Test to make sure that when only rules that look at the lines are enabled,
+    any failures are still reported and any pragmas are still honored.
+    """
+
+    # Arrange
+    line_rules = ["md010", "md047"]
+    linter = PyMarkdownApi(
+        disable_rules=[x for x in PyMarkdownApi().enabled_rules if x not in line_rules]
+    )
+    string_to_scan = "Some\ttext.\n<!-- pyml disable-next-line md010-->\nMore\ttext.\n"
+
+    # Act
+    scan_result = linter.scan_string(string_to_scan)
+
+    # Assert
+    assert linter.enabled_rules == line_rules
+    assert not scan_result.pragma_failures
+    assert [(x.rule_id, x.line_number) for x in scan_result.scan_failures] == [
+        ("MD010", 1)
+    ]
+
+
+def test_api_scan_string_with_configuration_file():
+    """
+    Test to make sure that a configuration file is applied when constructing
+    the linter.
+    """
+
+    # Arrange
+    configuration_file = write_temporary_configuration(
+        {"plugins": {"md047": {"enabled": False}}}
+    )
+
+    try:
+        linter = PyMarkdownApi(configuration_file=configuration_file)
+
+        # Act
+        scan_result = linter.scan_string("# Heading\n\nSome text.")
+
+        # Assert
+        assert not scan_result.scan_failures
+    finally:
+        os.remove(configuration_file)
+
+
+def test_api_scan_string_with_bad_pragma():
+    """
+    Test to make sure that a pragma that cannot be compiled is reported as a
+    pragma failure.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+
+    # Act
+    scan_result = linter.scan_string(
+        "<!-- pyml disable-next-line not-a-rule-->\n# Heading\n"
+    )
+
+    # Assert
+    assert not scan_result.scan_failures
+    assert len(scan_result.pragma_failures) == 1
+    assert (
+        str(scan_result.pragma_failures[0])
+        == "in-memory.md:1:1: INLINE: Inline configuration command 'disable-next-line' unable to find a plugin with the id 'not-a-rule'."
+    )
+
+
+def test_api_scan_path_directory():
+    """
+    Test to make sure that scanning a directory reports the failures for each
+    Markdown file in that directory, in order.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+
+    # Act
+    scan_result = linter.scan_path("test/resources/rules/md047")
+
+    # Assert
+    assert [str(x) for x in scan_result.scan_failures] == [
+        "test/resources/rules/md047/end_with_no_blank_line.md:3:41: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)",
+        "test/resources/rules/md047/end_with_no_blank_line_and_spaces.md:4:2: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)",
+    ]
+
+
+def test_api_scan_path_does_not_exist():
+    """
+    Test to make sure that scanning a path that does not exist raises an error
+    instead of exiting.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+
+    # Act
+    with pytest.raises(PyMarkdownApiException) as raised_exception:
+        linter.scan_path("test/resources/rules/md047/not-a-file.md")
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "Provided path 'test/resources/rules/md047/not-a-file.md' does not exist."
+    )
+
+
+def test_api_with_bad_plugin_path():
+    """
+    Test to make sure that an error while loading the plugins is raised as an
+    exception when constructing the linter.
+    """
+
+    # Act
+    with pytest.raises(PyMarkdownApiException) as raised_exception:
+        PyMarkdownApi(additional_plugins=["not-a-plugin-path"])
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "BadPluginError encountered while loading plugins:\nPlugin path 'not-a-plugin-path' does not exist."
+    )
+
+
+def test_api_parse_string_with_many_consumers():
+    """
+    Test to make sure that a document parsed once can be scanned, rendered as
+    HTML, and used to regenerate its Markdown.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+    source_markdown = "# Heading\n\nSome *text* with a [link][1].\n\n[1]: /url"
+
+    # Act
+    parsed_document = linter.parse_string(source_markdown)
+    scan_result = linter.scan_document(parsed_document)
+    actual_html = parsed_document.to_html()
+    actual_markdown, _ = TransformToMarkdown().transform(parsed_document.tokens)
+
+    # Assert
+    assert [str(x) for x in scan_result.scan_failures] == [
+        "in-memory.md:5:9: MD047: Each file should end with a single newline character. (single-trailing-newline)"
+    ]
+    assert [str(x) for x in scan_result.scan_failures] == [
+        str(x) for x in linter.scan_string(source_markdown).scan_failures
+    ]
+    assert (
+        actual_html
+        == '<h1>Heading</h1>\n<p>Some <em>text</em> with a <a href="/url">link</a>.</p>'
+    )
+    assert actual_markdown == source_markdown
+    assert parsed_document.source_text == source_markdown
+
+
+def test_api_parse_string_serialized():
+    """
+    Test to make sure that a parsed document can be serialized and then scanned
+    after it is deserialized, with any pragmas kept.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+    source_markdown = (
+        "<!-- pyml disable-next-line no-multiple-space-atx-->\n#  Heading\n\ntext"
+    )
+    serialized_document = linter.parse_string(
+        source_markdown, scan_name="serialized.md"
+    ).to_bytes()
+
+    # Act
+    parsed_document = ParsedDocument.from_bytes(serialized_document)
+    scan_result = linter.scan_document(parsed_document)
+
+    # Assert
+    assert parsed_document.scan_name == "serialized.md"
+    assert list(parsed_document.pragma_lines) == [1]
+    assert [x.rule_id for x in scan_result.scan_failures] == ["MD047"]
+    assert parsed_document.to_html() == "<h1>Heading</h1>\n<p>text</p>"
+
+
+def test_api_parse_file():
+    """
+    Test to make sure that a parsed file is scanned with the same results as
+    scanning the file directly.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+    file_to_parse = "test/resources/rules/md047/end_with_no_blank_line.md"
+
+    # Act
+    parsed_document = linter.parse_file(file_to_parse)
+    scan_result = linter.scan_document(parsed_document)
+
+    # Assert
+    assert [str(x) for x in scan_result.scan_failures] == [
+        str(x) for x in linter.scan_path(file_to_parse).scan_failures
+    ]
+
+
+def test_api_parse_file_does_not_exist():
+    """
+    Test to make sure that parsing a file that does not exist raises an error.
+    """
+
+    # Arrange
+    linter = PyMarkdownApi()
+
+    # Act
+    with pytest.raises(PyMarkdownApiException) as raised_exception:
+        linter.parse_file("test/resources/rules/md047/not-a-file.md")
+
+    # Assert
+    assert (
+        str(raised_exception.value)
+        == "Provided file path 'test/resources/rules/md047/not-a-file.md' is not a valid file."
+    )
@@ -14,15 +14,25 @@ def test_markdown_with_dash_h():
     supplied_arguments = ["scan", "-h"]
 
     expected_return_code = 0
-    expected_output = """usage: main.py scan [-h] [-l] [-r] path [path ...]
+    expected_output = """usage: main.py scan [-h] [-l] [-r] [-j JOBS] [--cache-dir CACHE_DIRECTORY]
+                    [--cache-max-entries CACHE_MAX_ENTRIES]
+                    path [path ...]
 
 positional arguments:
-  path              one or more paths to scan for eligible Markdown files
+  path                  one or more paths to scan for eligible Markdown files
 
 optional arguments:
-  -h, --help        show this help message and exit
-  -l, --list-files  list the markdown files found and exit
-  -r, --recurse     recursively scan directories
+  -h, --help            show this help message and exit
+  -l, --list-files      list the markdown files found and exit
+  -r, --recurse         recursively scan directories
+  -j JOBS, --jobs JOBS  number of processes to use when scanning files
+                        (default is 1)
+  --cache-dir CACHE_DIRECTORY
+                        directory used to cache scan results for unchanged
+                        files
+  --cache-max-entries CACHE_MAX_ENTRIES
+                        maximum number of files kept in the cache (default is
+                        10000)
 """
     expected_error = ""
 
@@ -46,7 +56,9 @@ def test_markdown_with_dash_l_only():
 
     expected_return_code = 2
     expected_output = ""
-    expected_error = """usage: main.py scan [-h] [-l] [-r] path [path ...]
+    expected_error = """usage: main.py scan [-h] [-l] [-r] [-j JOBS] [--cache-dir CACHE_DIRECTORY]
+                    [--cache-max-entries CACHE_MAX_ENTRIES]
+                    path [path ...]
 main.py scan: error: the following arguments are required: path
 """
 
@@ -0,0 +1,99 @@
+"""
+Module to provide stress tests for the parsing of long block quotes.
+"""
+import pytest
+
+from pymarkdown.bad_tokenization_error import BadTokenizationError
+from pymarkdown.container_markdown_token import BlockQuoteMarkdownToken
+from pymarkdown.parser_helper import PositionMarker
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def __generate_block_quote(line_count):
+    return "\n".join(
+        f"> line {line_index}" if (line_index + 1) % 5 else ">"
+        for line_index in range(line_count)
+    )
+
+
+def test_block_quote_stress_leading_spaces_restored():
+    """
+    Test to make sure that restoring the leading spaces of a block quote token
+    undoes only the leading spaces added after the snapshot was taken.
+    """
+
+    # Arrange
+    block_quote_token = BlockQuoteMarkdownToken("", PositionMarker(1, 0, "> a"))
+    block_quote_token.add_leading_spaces("> ")
+    leading_spaces_state = block_quote_token.leading_spaces_state
+    block_quote_token.add_leading_spaces(">")
+    block_quote_token.add_leading_spaces(" ", True)
+    block_quote_token.leading_text_index += 1
+
+    # Act
+    block_quote_token.restore_leading_spaces_state(leading_spaces_state)
+
+    # Assert
+    assert block_quote_token.leading_spaces == "> "
+    assert block_quote_token.leading_text_index == 0
+    assert str(block_quote_token) == "[block-quote(1,1)::> ]"
+
+
+def test_block_quote_stress_many_lines():
+    """
+    Test to make sure that a long block quote is parsed into the expected tokens
+    and html, with the leading spaces of every line kept in the block quote
+    token.  The time taken for long block quotes is measured by the
+    `block-quote` scenario of `perf/measure_scaling.py`.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    line_count = 8000
+    source_markdown = __generate_block_quote(line_count)
+    expected_gfm = (
+        "<blockquote>\n"
+        + "\n".join(
+            "<p>"
+            + "\n".join(
+                f"line {line_index}"
+                for line_index in range(paragraph_start, paragraph_start + 4)
+            )
+            + "</p>"
+            for paragraph_start in range(0, line_count, 5)
+        )
+        + "\n</blockquote>"
+    )
+    expected_leading_spaces = "\n".join(
+        "> " if (line_index + 1) % 5 else ">" for line_index in range(line_count)
+    )
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == line_count // 5 * 4 + 2
+    assert actual_tokens[0].is_block_quote_start
+    assert actual_tokens[0].leading_spaces == expected_leading_spaces
+    assert actual_tokens[-1].is_block_quote_end
+    assert actual_gfm == expected_gfm
+
+
+def test_block_quote_stress_token_missing_from_document():
+    """
+    Test to make sure that a block quote whose token is no longer in the
+    document is reported as a tokenization error, instead of producing tokens
+    that end a block quote that was never started.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    source_markdown = "- \n    ===\n> [a]: /b\ntext"
+
+    # Act & Assert
+    with pytest.raises(BadTokenizationError):
+        tokenizer.transform(source_markdown)
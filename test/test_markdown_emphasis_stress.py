@@ -0,0 +1,239 @@
+"""
+Module to provide stress tests for the resolving of emphasis with many
+delimiters in a single paragraph.
+
+The time taken for many unmatched and many matched delimiters is measured by
+the unmatched-emphasis and matched-emphasis scenarios of perf/measure_scaling.py.
+"""
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def test_emphasis_stress_unmatched_closers_then_match():
+    """
+    Test to make sure that a pair of delimiters after many closers without an
+    opener is still matched.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "foo* " * 200 + "*bar* and __baz__"
+    expected_gfm = "<p>" + "foo* " * 200 + "<em>bar</em> and <strong>baz</strong></p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_unmatched_closers_of_different_kinds():
+    """
+    Test to make sure that failing to find an opener for one kind of closer
+    does not stop a later closer of another kind from finding its opener.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "_a " + "b* " * 50 + "c_ **d" + "e** " * 50
+    expected_gfm = (
+        "<p><em>a "
+        + "b* " * 50
+        + "c</em> <strong>d"
+        + "e</strong> "
+        + "e** " * 48
+        + "e**</p>"
+    )
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_unmatched_closers_of_different_lengths():
+    """
+    Test to make sure that failing to find an opener for a closer that can also
+    open does not stop a later closer with a different length modulo 3 from
+    finding its opener.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "*a**b*c"
+    expected_gfm = "<p><em>a**b</em>c</p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_unmatched_closers_that_can_also_open():
+    """
+    Test to make sure that failing to find an opener for a closer that can also
+    open does not stop a later closer that cannot open from finding its opener.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "*a**b c*"
+    expected_gfm = "<p><em>a**b c</em></p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_partly_used_closer_and_opener():
+    """
+    Test to make sure that a closer and an opener that are both partly used by
+    an earlier match are still matched, as the rule of 3 and the openers_bottom
+    for the closer use the lengths of the original delimiter runs.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "****b*****b****a "
+    expected_gfm = "<p><strong><strong>b*****b</strong></strong>a</p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_partly_used_closers():
+    """
+    Test to make sure that a closer partly used by an earlier match can still
+    match an opener before that match.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "******b****a****a"
+    expected_gfm = "<p><strong><strong><strong>b</strong></strong>a</strong>**a</p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_partly_used_opener_rule_of_three():
+    """
+    Test to make sure that the rule of 3 uses the original lengths of the
+    delimiter runs, and not what is left of them after an earlier match.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "a****b a***_b"
+    expected_gfm = "<p>a*<em><strong>b a</strong></em>_b</p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_many_unmatched_delimiters():
+    """
+    Test to make sure that a paragraph with thousands of delimiters that are
+    never matched is kept as text.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "foo_bar* " * 4000
+    expected_gfm = "<p>" + ("foo_bar* " * 4000).rstrip() + "</p>"
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == 4000 * 4 + 2
+    assert actual_tokens[0].is_paragraph and actual_tokens[-1].is_paragraph_end
+    assert all(x.is_text for x in actual_tokens[1:-1])
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_many_matched_delimiters():
+    """
+    Test to make sure that a paragraph with thousands of pairs of delimiters
+    that are each matched has the emphasis tokens in the right places.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "*a* " * 4000
+    expected_gfm = "<p>" + "<em>a</em> " * 3999 + "<em>a</em></p>"
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == 4000 * 4 + 1
+    assert sum(1 for x in actual_tokens if x.is_inline_emphasis) == 4000
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_many_nested_delimiters():
+    """
+    Test to make sure that many nested pairs of delimiters are matched, with
+    each closer skipping over the pairs already matched inside it.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "*a " * 1000 + "b*" + " c*" * 999
+    expected_gfm = "<p>" + "<em>a " * 1000 + "b</em>" + " c</em>" * 999 + "</p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_emphasis_stress_matched_delimiters_in_and_around_links():
+    """
+    Test to make sure that emphasis resolved within each link, and around it,
+    is kept in the right places for many links in the same paragraph.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "*a [b *c* __d__](/u) e* " * 500
+    expected_gfm = (
+        "<p>"
+        + '<em>a <a href="/u">b <em>c</em> <strong>d</strong></a> e</em> ' * 499
+        + '<em>a <a href="/u">b <em>c</em> <strong>d</strong></a> e</em></p>'
+    )
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
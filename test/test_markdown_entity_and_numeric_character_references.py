@@ -2,10 +2,14 @@
 https://github.github.com/gfm/#entity-and-numeric-character-references
 """
 import os
+import shutil
+import tempfile
 
 import pytest
+from application_properties import ApplicationProperties
 
 from pymarkdown.bad_tokenization_error import BadTokenizationError
+from pymarkdown.extension_manager import ExtensionManager
 from pymarkdown.tokenized_markdown import TokenizedMarkdown
 
 from .utils import act_and_assert
@@ -662,3 +666,37 @@ def test_bad_entities_json_file():
             + full_alternate_resource_path
             + "' is not a valid JSON file (Expecting value: line 1 column 1 (char 0))."
         )
+
+
+def test_entities_json_file_loaded_once():
+    """
+    Test to make sure that the entity map for a resource path is only loaded
+    once, and is then shared by any other tokenizer using that same path.
+    """
+
+    # Arrange
+    alternate_resource_path = tempfile.mkdtemp()
+    shutil.copy(
+        os.path.join(
+            os.path.split(__file__)[0], "..", "pymarkdown", "resources", "entities.json"
+        ),
+        alternate_resource_path,
+    )
+
+    try:
+        TokenizedMarkdown(resource_path=alternate_resource_path)
+        os.remove(os.path.join(alternate_resource_path, "entities.json"))
+
+        # Act
+        tokenizer = TokenizedMarkdown(resource_path=alternate_resource_path)
+        extension_manager = ExtensionManager()
+        extension_manager.initialize(None, ApplicationProperties())
+        extension_manager.apply_configuration()
+        tokenizer.apply_configuration(ApplicationProperties(), extension_manager)
+        actual_tokens = tokenizer.transform("&copy;")
+
+        # Assert
+        assert str(actual_tokens[1]) == "[text(1,1):\a&copy;\a©\a:]"
+    finally:
+        shutil.rmtree(alternate_resource_path)
+        TokenizedMarkdown()
@@ -0,0 +1,244 @@
+"""
+Module to provide stress tests for the parsing of link reference definitions
+that continue over many lines before failing.
+"""
+from pymarkdown.parser_helper import PositionMarker
+from pymarkdown.stack_token import LinkDefinitionStackToken
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def __generate_unterminated_title(line_count):
+    return (
+        "[foo]: /url\n'title starts\n"
+        + "\n".join(f"title line {line_index}" for line_index in range(line_count))
+        + "\n\n[foo]"
+    )
+
+
+def __transform_to_gfm(source_markdown):
+    return TransformToGfm().transform(create_tokenizer().transform(source_markdown))
+
+
+def test_link_reference_definition_stress_unterminated_title():
+    """
+    Test to make sure that a link reference definition with a title that is
+    never closed is kept without the title, with the lines of the title being
+    parsed again as a paragraph.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = __generate_unterminated_title(2)
+    expected_gfm = (
+        "<p>'title starts\ntitle line 0\ntitle line 1</p>\n"
+        + '<p><a href="/url">foo</a></p>'
+    )
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_many_title_lines():
+    """
+    Test to make sure that a link reference definition with a title that is
+    never closed, and that continues over many lines, is kept without the
+    title, with the lines of the title being parsed again as a paragraph.  The
+    time taken for this scenario is measured by the `unterminated-link-title`
+    scenario of `perf/measure_scaling.py`.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    line_count = 2000
+    source_markdown = __generate_unterminated_title(line_count)
+    expected_gfm = (
+        "<p>'title starts\n"
+        + "\n".join(f"title line {line_index}" for line_index in range(line_count))
+        + "</p>\n"
+        + '<p><a href="/url">foo</a></p>'
+    )
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == 10
+    assert actual_tokens[0].is_link_reference_definition
+    assert actual_tokens[1].line_number == 2
+    assert actual_tokens[5].line_number == line_count + 4
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_journal():
+    """
+    Test to make sure that the journal of the continuation lines follows the
+    lines as they are added and removed.
+    """
+
+    # Arrange
+    lrd_stack_token = LinkDefinitionStackToken("", PositionMarker(1, 0, "[foo]:"))
+    for next_line, is_known_failure in (
+        ("[foo]:", False),
+        ("/url", False),
+        ("'title", True),
+        ("line", True),
+    ):
+        lrd_stack_token.add_continuation_line(next_line, is_known_failure)
+        lrd_stack_token.add_unmodified_line(next_line)
+
+    # Act
+    known_failures = []
+    while lrd_stack_token.continuation_lines:
+        known_failures.append(lrd_stack_token.is_known_failure)
+        lrd_stack_token.remove_last_continuation_line()
+
+    # Assert
+    assert known_failures == [True, True, False, False]
+    assert not lrd_stack_token.is_known_failure
+
+
+def test_link_reference_definition_stress_backed_out_title():
+    """
+    Test to make sure that backing out of a title that is never closed skips
+    the journaled lines and still finds the definition before the title.
+    """
+
+    # Arrange
+    source_markdown = "[foo]: /url\n'title\nline 1\nline 2\n\n[foo]"
+    expected_gfm = '<p>\'title\nline 1\nline 2</p>\n<p><a href="/url">foo</a></p>'
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_title_after_destination_line():
+    """
+    Test to make sure that backing out of a title that is never closed finds
+    the definition when the destination is on its own line.
+    """
+
+    # Arrange
+    source_markdown = "[foo]:\n/url\n'title\nline\n\n[foo]"
+    expected_gfm = '<p>\'title\nline</p>\n<p><a href="/url">foo</a></p>'
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_title_after_label_lines():
+    """
+    Test to make sure that backing out of a title that is never closed finds
+    the definition when the label continues over two lines.
+    """
+
+    # Arrange
+    source_markdown = "[foo\nbar]:\n/url\n'title\n\n[foo bar]"
+    expected_gfm = '<p>\'title</p>\n<p><a href="/url">foo bar</a></p>'
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_title_on_destination_line():
+    """
+    Test to make sure that backing out of a title that starts on the line of
+    the destination does not find a definition at all.
+    """
+
+    # Arrange
+    source_markdown = "[foo]: /url 'title\nline\n\n[foo]"
+    expected_gfm = "<p>[foo]: /url 'title\nline</p>\n<p>[foo]</p>"
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_label():
+    """
+    Test to make sure that backing out of a label that is never closed does
+    not find a definition at all.
+    """
+
+    # Arrange
+    source_markdown = "[foo\nbar\nbaz\n\n[foo]"
+    expected_gfm = "<p>[foo\nbar\nbaz</p>\n<p>[foo]</p>"
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_title_without_blank_line():
+    """
+    Test to make sure that backing out of a title that is ended by a line that
+    cannot continue it finds the definition before the title.
+    """
+
+    # Arrange
+    source_markdown = '[foo]:\n/url\n"title\nline 1\nline 2\n[foo]'
+    expected_gfm = '<p>&quot;title\nline 1\nline 2\n<a href="/url">foo</a></p>'
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_backed_out_title_in_block_quote():
+    """
+    Test to make sure that backing out of a title that is never closed finds
+    the definition when it is within a block quote.
+    """
+
+    # Arrange
+    source_markdown = "> [foo]: /url\n> 'title\n> line\n\n[foo]"
+    expected_gfm = (
+        "<blockquote>\n<p>'title\nline</p>\n</blockquote>\n"
+        + '<p><a href="/url">foo</a></p>'
+    )
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_reference_definition_stress_closed_title():
+    """
+    Test to make sure that a title that is closed on a later line is kept with
+    the definition.
+    """
+
+    # Arrange
+    source_markdown = "[foo]: /url\n'title\nline'\n[foo]"
+    expected_gfm = '<p><a href="/url" title="title\nline">foo</a></p>'
+
+    # Act
+    actual_gfm = __transform_to_gfm(source_markdown)
+
+    # Assert
+    assert actual_gfm == expected_gfm
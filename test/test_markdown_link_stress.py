@@ -0,0 +1,88 @@
+"""
+Module to provide stress tests for the resolving of links and images with many
+other delimiters in a single paragraph.
+"""
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def test_link_stress_unmatched_closers_between_links():
+    """
+    Test to make sure that many links separated by closers without an opener
+    are resolved, and that emphasis after those links is still matched.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "foo* [link](/url) " * 100 + "*bar*"
+    expected_gfm = "<p>" + 'foo* <a href="/url">link</a> ' * 100 + "<em>bar</em></p>"
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_stress_nested_links_and_images():
+    """
+    Test to make sure that a link within a link deactivates the outer link
+    start, while a link within an image does not stop the image.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = "[a [b](/c) d](/e) ![f *g* [h](/i)](/j) *k* " * 20
+    expected_gfm = (
+        "<p>"
+        + '[a <a href="/c">b</a> d](/e) <img src="/j" alt="f g h" /> <em>k</em> ' * 19
+        + '[a <a href="/c">b</a> d](/e) <img src="/j" alt="f g h" /> <em>k</em></p>'
+    )
+
+    # Act
+    actual_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_link_stress_many_links_and_unmatched_delimiters():
+    """
+    Test to make sure that a paragraph with many links, images, and unmatched
+    delimiters is resolved into the expected tokens and html.  The time taken
+    for this scenario is measured by the `link` scenario of
+    `perf/measure_scaling.py`.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    repeat_count = 2000
+    source_markdown = "foo* [link](/url) and ![image](/img) " * repeat_count
+    expected_gfm = (
+        "<p>"
+        + " ".join(
+            ['foo* <a href="/url">link</a> and <img src="/img" alt="image" />']
+            * repeat_count
+        )
+        + "</p>"
+    )
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == repeat_count * 8 + 2
+    assert (
+        sum(1 for next_token in actual_tokens if next_token.is_inline_link)
+        == repeat_count
+    )
+    assert (
+        sum(1 for next_token in actual_tokens if next_token.is_inline_image)
+        == repeat_count
+    )
+    assert actual_gfm == expected_gfm
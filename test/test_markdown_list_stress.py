@@ -0,0 +1,156 @@
+"""
+Module to provide stress tests for the parsing of long lists within other
+containers.
+"""
+import logging
+
+from pymarkdown.parser_helper import ParserState
+from pymarkdown.parser_logger import ParserLogger
+from pymarkdown.stack_token import UnorderedListStackToken
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def __generate_list_in_block_quote(item_count):
+    return "> - a\n" + ">   > b\n>\n" * item_count + "> - c\n>   - d\n>\n>   e"
+
+
+def __search_for_token(token_document, markdown_token):
+    return next(
+        document_index
+        for document_index, next_token in enumerate(token_document)
+        if next_token is markdown_token
+    )
+
+
+def __search_for_last_list_token(token_document):
+    document_index = len(token_document) - 1
+    while document_index >= 0 and not token_document[document_index].is_any_list_token:
+        document_index -= 1
+    return document_index
+
+
+def test_list_stress_many_lines_in_block_quote():
+    """
+    Test to make sure that a list in a block quote, with a nested block quote
+    in its first item, is parsed into the expected tokens and html.  The time
+    taken for this scenario is measured by the `list-in-block-quote` scenario
+    of `perf/measure_scaling.py`.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    item_count = 2000
+    source_markdown = __generate_list_in_block_quote(item_count)
+    expected_gfm = (
+        "<blockquote>\n<ul>\n<li>a\n<blockquote>\n"
+        + "<p>b</p>\n" * item_count
+        + "</blockquote>\n</li>\n<li>c\n<ul>\n<li>\n<p>d</p>\n<p>e</p>\n</li>\n"
+        + "</ul>\n</li>\n</ul>\n</blockquote>"
+    )
+
+    # Act
+    actual_tokens = tokenizer.transform(source_markdown)
+    actual_gfm = transformer.transform(actual_tokens)
+
+    # Assert
+    assert len(actual_tokens) == item_count * 4 + 22
+    assert sum(1 for next_token in actual_tokens if next_token.is_list_start) == 2
+    assert actual_gfm == expected_gfm
+
+
+def test_list_stress_same_with_debug():
+    """
+    Test to make sure that a list in a block quote is parsed the same with
+    debug logging enabled, where the positions kept for the list tokens are
+    checked against a search of the whole document and stack.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    source_markdown = __generate_list_in_block_quote(5) + "\n> - f\n>   - g\n> h"
+    expected_gfm = transformer.transform(tokenizer.transform(source_markdown))
+
+    # Act
+    try:
+        logging.getLogger().setLevel(logging.DEBUG)
+        ParserLogger.sync_on_next_call()
+        actual_gfm = transformer.transform(
+            tokenizer.transform(source_markdown, show_debug=True)
+        )
+    finally:
+        logging.getLogger().setLevel(logging.WARNING)
+        ParserLogger.sync_on_next_call()
+
+    # Assert
+    assert actual_gfm == expected_gfm
+
+
+def test_list_stress_matching_token_index_kept():
+    """
+    Test to make sure that the index of the markdown token for a stack token is
+    found whether it is kept, not yet kept, or no longer at the kept index
+    because tokens were added or removed before it.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    token_document = tokenizer.transform("para\n\n- a\n- b\n\n  c")
+    list_token = next(
+        next_token for next_token in token_document if next_token.is_list_start
+    )
+    stack_token = UnorderedListStackToken(2, "-", 0, 1, 0, list_token)
+    parser_state = ParserState([], token_document, None, None)
+
+    # Act
+    actual_indices = [parser_state.find_matching_markdown_token_index(stack_token)]
+    actual_indices.append(parser_state.find_matching_markdown_token_index(stack_token))
+    token_document.insert(0, token_document[0])
+    actual_indices.append(parser_state.find_matching_markdown_token_index(stack_token))
+    del token_document[:2]
+    actual_indices.append(parser_state.find_matching_markdown_token_index(stack_token))
+    del token_document[__search_for_token(token_document, list_token) + 1 :]
+    stack_token.matching_markdown_token_index = len(token_document) + 5
+    actual_indices.append(parser_state.find_matching_markdown_token_index(stack_token))
+
+    # Assert
+    assert actual_indices == [4, 4, 5, 3, 3]
+    assert stack_token.matching_markdown_token_index == __search_for_token(
+        token_document, list_token
+    )
+
+
+def test_list_stress_last_list_token_search():
+    """
+    Test to make sure that the last list token found using the search kept in
+    the list stack token matches a search of the whole document, as the
+    document grows and after tokens are removed from its end.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    parsed_tokens = tokenizer.transform("- a\n- b\n\n  c\n\npara\n- d\n  - e\n\nf")
+    token_document = []
+    stack_token = UnorderedListStackToken(2, "-", 0, 1, 0, parsed_tokens[0])
+    parser_state = ParserState([], token_document, None, None)
+    expected_indices, actual_indices = [], []
+
+    # Act
+    for next_token in parsed_tokens:
+        token_document.append(next_token)
+        expected_indices.append(__search_for_last_list_token(token_document))
+        actual_indices.append(
+            parser_state.find_last_list_token_in_document(stack_token)
+        )
+    for removed_count in (3, 5):
+        del token_document[-removed_count:]
+        expected_indices.append(__search_for_last_list_token(token_document))
+        actual_indices.append(
+            parser_state.find_last_list_token_in_document(stack_token)
+        )
+
+    # Assert
+    assert actual_indices == expected_indices
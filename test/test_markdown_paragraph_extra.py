@@ -8533,3 +8533,115 @@ def</li>
 
     # Act & Assert
     act_and_assert(source_markdown, expected_gfm, expected_tokens)
+
+
+@pytest.mark.gfm
+def test_paragraph_extra_k0():
+    """
+    Test case extra k0:  Paragraph continuation lines that start with text,
+    with an indent, and with a character that cannot start a leaf block,
+    followed by a setext underline
+    """
+
+    # Arrange
+    source_markdown = """abc
+    def
++ghi
+==
+"""
+    expected_tokens = [
+        "[setext(4,1):=:2::(1,1)]",
+        "[text(1,1):abc\ndef\n+ghi::\n    \x02\n]",
+        "[end-setext::]",
+        "[BLANK(5,1):]",
+    ]
+    expected_gfm = """<h1>abc
+def
++ghi</h1>"""
+
+    # Act & Assert
+    act_and_assert(source_markdown, expected_gfm, expected_tokens)
+
+
+@pytest.mark.gfm
+def test_paragraph_extra_k0a():
+    """
+    Test case extra k0a:  Paragraph continuation lines in a block quote, with
+    a lazy continuation line, a possible link reference definition that cannot
+    interrupt the paragraph, and a thematic break that can
+    """
+
+    # Arrange
+    source_markdown = """> abc
+def
+> [ghi]: /url
+> ***
+> jkl"""
+    expected_tokens = [
+        "[block-quote(1,1)::> \n\n> \n> \n> ]",
+        "[para(1,3):\n\n]",
+        "[text(1,3):abc\ndef\n::\n\n]",
+        "[text(3,1):[:]",
+        "[text(3,2):ghi:]",
+        "[text(3,5):]:]",
+        "[text(3,6):: /url:]",
+        "[end-para:::False]",
+        "[tbreak(4,3):*::***]",
+        "[para(5,3):]",
+        "[text(5,3):jkl:]",
+        "[end-para:::True]",
+        "[end-block-quote:::True]",
+    ]
+    expected_gfm = """<blockquote>
+<p>abc
+def
+[ghi]: /url</p>
+<hr />
+<p>jkl</p>
+</blockquote>"""
+
+    # Act & Assert
+    act_and_assert(source_markdown, expected_gfm, expected_tokens)
+
+
+@pytest.mark.gfm
+def test_paragraph_extra_k0b():
+    """
+    Test case extra k0b:  Paragraph continuation lines in a list item, with an
+    Atx heading that interrupts the paragraph, and a code span and raw html
+    that do not
+    """
+
+    # Arrange
+    source_markdown = """- abc
+def
+  # ghi
+  `jkl`
+  <b>mno</b>"""
+    expected_tokens = [
+        "[ulist(1,1):-::2::\n  \n  \n  ]",
+        "[para(1,3):\n]",
+        "[text(1,3):abc\ndef::\n]",
+        "[end-para:::False]",
+        "[atx(3,3):1:0:]",
+        "[text(3,5):ghi: ]",
+        "[end-atx::]",
+        "[para(4,3):\n]",
+        "[icode-span(4,3):jkl:`::]",
+        "[text(4,8):\n::\n]",
+        "[raw-html(5,1):b]",
+        "[text(5,4):mno:]",
+        "[raw-html(5,7):/b]",
+        "[end-para:::True]",
+        "[end-ulist:::True]",
+    ]
+    expected_gfm = """<ul>
+<li>abc
+def
+<h1>ghi</h1>
+<code>jkl</code>
+<b>mno</b></li>
+</ul>"""
+
+    # Act & Assert
+    act_and_assert(source_markdown, expected_gfm, expected_tokens)
@@ -0,0 +1,158 @@
+"""
+Module to provide tests related to streaming the tokens for a document.
+"""
+import os
+
+import pytest
+
+from pymarkdown.bad_tokenization_error import BadTokenizationError
+from pymarkdown.source_providers import InMemorySourceProvider
+
+from .utils import create_tokenizer
+
+
+def __stream_tokens(tokenizer, source_markdown):
+    streamed_tokens, pragma_lines = [], {}
+    for next_token in tokenizer.stream_from_provider(
+        InMemorySourceProvider(source_markdown)
+    ):
+        if next_token.is_pragma:
+            pragma_lines.update(next_token.pragma_lines)
+        else:
+            streamed_tokens.append(str(next_token))
+    return streamed_tokens, pragma_lines
+
+
+def __transform_tokens(tokenizer, source_markdown):
+    actual_tokens, pragma_lines = (
+        tokenizer.transform_from_provider(InMemorySourceProvider(source_markdown)),
+        {},
+    )
+    if actual_tokens and actual_tokens[-1].is_pragma:
+        pragma_lines = actual_tokens[-1].pragma_lines
+        actual_tokens = actual_tokens[:-1]
+    return [str(x) for x in actual_tokens], pragma_lines
+
+
+def test_streaming_matches_transform():
+    """
+    Test to make sure that streaming the tokens for each of the documents in the
+    test resources produces the same tokens as transforming those documents.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    documents_to_parse = []
+    for root_directory, _, file_names in os.walk(os.path.join("test", "resources")):
+        for next_file_name in sorted(file_names):
+            if next_file_name.endswith(".md"):
+                with open(
+                    os.path.join(root_directory, next_file_name), encoding="utf-8"
+                ) as document_file:
+                    documents_to_parse.append(document_file.read())
+    assert documents_to_parse
+
+    for source_markdown in documents_to_parse:
+        try:
+            expected_results = __transform_tokens(tokenizer, source_markdown)
+        except BadTokenizationError:
+            # Act
+            with pytest.raises(BadTokenizationError):
+                __stream_tokens(tokenizer, source_markdown)
+            continue
+
+        # Act
+        actual_results = __stream_tokens(tokenizer, source_markdown)
+
+        # Assert
+        assert actual_results == expected_results
+
+
+def test_streaming_yields_before_end_of_document():
+    """
+    Test to make sure that the tokens for a block are yielded once that block
+    is closed, before the rest of the document is read.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    source_provider = InMemorySourceProvider(
+        "# Heading\n\nfirst paragraph\n\nsecond paragraph\n"
+    )
+
+    # Act
+    token_stream = tokenizer.stream_from_provider(source_provider)
+    first_token = next(token_stream)
+
+    # Assert
+    assert str(first_token) == "[atx(1,1):1:0:]"
+    assert source_provider.next_index is not None
+    assert [str(x) for x in token_stream][-1] == "[BLANK(6,1):]"
+
+
+def test_streaming_with_forward_link_reference():
+    """
+    Test to make sure that a link that refers to a link reference definition
+    later in the document is resolved, with the blocks kept in order.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    source_markdown = """[foo] and [bar]
+
+between
+
+[foo]: /url "title"
+"""
+    expected_tokens = [
+        "[para(1,1):]",
+        "[link(1,1):shortcut:/url:title::::foo:::::]",
+        "[text(1,2):foo:]",
+        "[end-link::]",
+        "[text(1,6): and :]",
+        "[text(1,11):[:]",
+        "[text(1,12):bar:]",
+        "[text(1,15):]:]",
+        "[end-para:::True]",
+        "[BLANK(2,1):]",
+        "[para(3,1):]",
+        "[text(3,1):between:]",
+        "[end-para:::True]",
+        "[BLANK(4,1):]",
+        '[link-ref-def(5,1):True::foo:: :/url:: :title:"title":]',
+        "[BLANK(6,1):]",
+    ]
+
+    # Act
+    actual_tokens, _ = __stream_tokens(tokenizer, source_markdown)
+
+    # Assert
+    assert actual_tokens == expected_tokens
+    assert __transform_tokens(tokenizer, source_markdown)[0] == expected_tokens
+
+
+def test_streaming_with_pragmas():
+    """
+    Test to make sure that each pragma is yielded ahead of the tokens for the
+    lines that follow it.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    source_markdown = """first paragraph
+
+<!-- pyml disable-next-line md019-->
+#  Heading
+"""
+
+    # Act
+    actual_tokens = [
+        str(x)
+        for x in tokenizer.stream_from_provider(InMemorySourceProvider(source_markdown))
+    ]
+
+    # Assert
+    assert actual_tokens[0] == "[para(1,1):]"
+    assert actual_tokens.index("[pragma:3:<!-- pyml disable-next-line md019-->]") < (
+        actual_tokens.index("[atx(4,1):1:0:]")
+    )
@@ -1,6 +1,9 @@
 """
-Module to test the StackToken class.
+Module to test the StackToken and MarkdownToken classes.
 """
+from pymarkdown.inline_markdown_token import TextMarkdownToken
+from pymarkdown.leaf_markdown_token import ParagraphMarkdownToken
+from pymarkdown.markdown_token import MarkdownToken, MarkdownTokenClass
 from pymarkdown.stack_token import StackToken
 
 
@@ -65,3 +68,83 @@ def test_stack_token_not_equal_not_same_type():
 
     # Assert
     assert not are_equal
+
+
+def test_markdown_token_kind_of_end_token():
+    """
+    Test to make sure that the end token for a paragraph is only reported as the
+    end of a paragraph, and not as the paragraph itself.
+    """
+
+    # Arrange
+    token = ParagraphMarkdownToken("", None)
+
+    # Act
+    end_token = token.generate_close_markdown_token_from_markdown_token("", None, False)
+
+    # Assert
+    assert token.is_paragraph and token.is_block and not token.is_end_token
+    assert not token.is_paragraph_end and not token.is_leaf_end_token
+    assert end_token.is_paragraph_end and end_token.is_leaf_end_token
+    assert end_token.is_end_token and not end_token.is_paragraph
+    assert not end_token.is_block
+
+
+def test_markdown_token_kind_of_unknown_token():
+    """
+    Test to make sure that a token with a name that is not known to the parser,
+    such as one from an extension, is not reported as any known kind of token.
+    """
+
+    # Arrange
+    token = MarkdownToken("custom", MarkdownTokenClass.LEAF_BLOCK)
+    end_token = MarkdownToken("end-custom", MarkdownTokenClass.LEAF_BLOCK)
+
+    # Act
+    known_kinds = [
+        x
+        for x in dir(MarkdownToken)
+        if x.startswith("is_") and getattr(token, x) is True
+    ]
+
+    # Assert
+    assert known_kinds == ["is_leaf"]
+    assert end_token.is_end_token and not end_token.is_leaf_end_token
+
+
+def test_markdown_token_has_no_instance_dictionary():
+    """
+    Test to make sure that the tokens keep their fields in slots, instead of in
+    a dictionary for each instance.
+    """
+
+    # Arrange
+    token = ParagraphMarkdownToken("", None)
+
+    # Act
+    has_dictionary = hasattr(token, "__dict__")
+
+    # Assert
+    assert not has_dictionary
+
+
+def test_text_token_combine_is_visible_before_finish():
+    """
+    Test to make sure that the text of a text token that has other text tokens
+    combined into it is up to date, even if finish_combine has not been called.
+    """
+
+    # Arrange
+    token = TextMarkdownToken("first", "")
+    token.combine(TextMarkdownToken("second", " "), -1)
+    first_text, first_extra_data = token.token_text, token.extra_data
+
+    # Act
+    token.combine(TextMarkdownToken("third", "  "), -1)
+
+    # Assert
+    assert first_text == "first\nsecond"
+    assert first_extra_data == "first\nsecond:\n "
+    assert token.token_text == "first\nsecond\nthird"
+    assert token.extracted_whitespace == "\n \n  "
+    assert token.extra_data == "first\nsecond\nthird:\n \n  "
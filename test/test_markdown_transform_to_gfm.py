@@ -1,6 +1,8 @@
 """
 https://github.github.com/gfm/#lists
 """
+import io
+
 import pytest
 
 from pymarkdown.markdown_token import (
@@ -10,6 +12,8 @@ from pymarkdown.markdown_token import (
 )
 from pymarkdown.transform_to_gfm import TransformToGfm
 
+from .utils import create_tokenizer
+
 
 @pytest.mark.gfm
 def test_gfm_bad_token():
@@ -58,3 +62,63 @@ def test_gfm_bad_end_token():
 
     # Assert
     assert str(captured_exception) == "Markdown token end type bad not supported."
+
+
+@pytest.mark.gfm
+def test_gfm_output_stream():
+    """
+    Test to ensure that html written to an output stream is the same as the
+    html returned, including for lists that are open when the earlier html is
+    written to the stream.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    tokens_to_test = tokenizer.transform(
+        "\n\n".join(
+            ["# heading", "- item\n  - nested\n\n    para", "> - quoted", "text *em*"]
+            * 100
+        )
+    )
+    expected_html = transformer.transform(tokens_to_test)
+    output_stream = io.StringIO()
+
+    # Act
+    returned_html = transformer.transform(tokens_to_test, output_stream)
+
+    # Assert
+    assert returned_html is None
+    assert output_stream.getvalue() == expected_html
+
+
+@pytest.mark.gfm
+def test_gfm_segments_left_open():
+    """
+    Test to ensure that tokens that leave a segment of the html open at the end
+    of the document can still be transformed, and that the html written to an
+    output stream is the same as the html returned.  The paragraphs before the
+    open segment produce enough html that it would be written to the stream
+    early if that was allowed.
+
+    This is a parity test between the two outputs only.  The html produced for
+    this input is not well-formed, due to how the parser handles it, so the html
+    itself is not checked here.
+    """
+
+    # Arrange
+    tokenizer = create_tokenizer()
+    transformer = TransformToGfm()
+    tokens_to_test = tokenizer.transform(
+        "para\n\n" * 300
+        + '*     \n[foo]:\n[foo]: <x> "a\n\n# h\n  text  - \n---\ntext- \n\t[foo]:'
+    )
+    output_stream = io.StringIO()
+
+    # Act
+    actual_html = transformer.transform(tokens_to_test)
+    returned_html = transformer.transform(tokens_to_test, output_stream)
+
+    # Assert
+    assert returned_html is None
+    assert output_stream.getvalue() == actual_html
@@ -0,0 +1,44 @@
+"""
+Module to provide stress tests for the transformation of long documents to html.
+"""
+import io
+
+from pymarkdown.transform_to_gfm import TransformToGfm
+
+from .utils import create_tokenizer
+
+
+def __generate_paragraphs(paragraph_count):
+    return "\n\n".join(
+        f"paragraph *{paragraph_index}* with `code` and a [link](/url)"
+        for paragraph_index in range(paragraph_count)
+    )
+
+
+def test_transform_to_gfm_stress_many_paragraphs():
+    """
+    Test to make sure that a long document is transformed to the expected html,
+    both when the html is returned and when it is written to an output stream.
+    The time taken for this scenario is measured by the `paragraphs-render`
+    scenario of `perf/measure_scaling.py`.
+    """
+
+    # Arrange
+    tokenizer, transformer = create_tokenizer(), TransformToGfm()
+    paragraph_count = 2000
+    actual_tokens = tokenizer.transform(__generate_paragraphs(paragraph_count))
+    expected_gfm = "\n".join(
+        f"<p>paragraph <em>{paragraph_index}</em> with <code>code</code> and a "
+        + '<a href="/url">link</a></p>'
+        for paragraph_index in range(paragraph_count)
+    )
+    output_stream = io.StringIO()
+
+    # Act
+    actual_gfm = transformer.transform(actual_tokens)
+    returned_gfm = transformer.transform(actual_tokens, output_stream)
+
+    # Assert
+    assert actual_gfm == expected_gfm
+    assert returned_gfm is None
+    assert output_stream.getvalue() == expected_gfm
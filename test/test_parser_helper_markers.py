@@ -0,0 +1,183 @@
+"""
+Module to provide tests for the resolving and removing of the in-band marker
+characters used by the parser.
+"""
+from application_properties import ApplicationProperties
+
+from pymarkdown.extension_manager import ExtensionManager
+from pymarkdown.parser_helper import ParserHelper
+from pymarkdown.tokenized_markdown import TokenizedMarkdown
+
+
+def test_markers_backslash_escape():
+    """
+    Test to make sure that a backslash escape resolves to the escaped character
+    and is removed to get back to the original text.
+    """
+
+    # Arrange
+    source_text = "a\\\b*b"
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+    removed_text = ParserHelper.remove_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "a*b"
+    assert removed_text == "a\\*b"
+
+
+def test_markers_replacement():
+    """
+    Test to make sure that a replacement marker resolves to the replacement
+    text and is removed to get back to the original text.
+    """
+
+    # Arrange
+    source_text = "a " + ParserHelper.create_replacement_markers("&amp;", "&") + " b"
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+    removed_text = ParserHelper.remove_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "a & b"
+    assert removed_text == "a &amp; b"
+
+
+def test_markers_nested_replacement():
+    """
+    Test to make sure that a replacement marker with one level of nesting uses
+    the inner replacement text when resolved and the outer original text when
+    removed.
+    """
+
+    # Arrange
+    source_text = "\a&lt;\a\ay\az\a\a!"
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+    removed_text = ParserHelper.remove_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "z!"
+    assert removed_text == "&lt;!"
+
+
+def test_markers_noop_and_blech():
+    """
+    Test to make sure that the noop and blech characters are dropped when
+    resolved and kept when removed.
+    """
+
+    # Arrange
+    source_text = "a" + ParserHelper.replace_noop_character + "b\x04c"
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+    removed_text = ParserHelper.remove_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "abc"
+    assert removed_text == source_text
+
+
+def test_markers_escaped_markers():
+    """
+    Test to make sure that escaped marker characters, including an escaped
+    escape character, are kept as themselves.
+    """
+
+    # Arrange
+    source_text = (
+        ParserHelper.escape_special_characters("a\b\x05\x03b")
+        + ParserHelper.replace_noop_character
+    )
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+    removed_text = ParserHelper.remove_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "a\b\x05\x03b"
+    assert removed_text == "a\b\x05\x03b" + ParserHelper.replace_noop_character
+
+
+def test_markers_many_escapes():
+    """
+    Test to make sure that text with many backslash escapes is resolved in a
+    single scan, with every escape resolved.
+    """
+
+    # Arrange
+    source_text = "some \\\b* text " * 20000
+
+    # Act
+    resolved_text = ParserHelper.resolve_all_from_text(source_text)
+
+    # Assert
+    assert resolved_text == "some * text " * 20000
+
+
+def test_markers_split_into_spans():
+    """
+    Test to make sure that the text is split into spans that give the same
+    original and replacement text as removing and resolving the text.
+    """
+
+    # Arrange
+    source_text = (
+        "a "
+        + ParserHelper.create_replacement_markers("&amp;", "&")
+        + " \\\b*"
+        + ParserHelper.replace_noop_character
+        + " b"
+    )
+    expected_spans = [
+        (ParserHelper.text_span, "a ", "a "),
+        (ParserHelper.replacement_span, "&amp;", "&"),
+        (ParserHelper.text_span, " ", " "),
+        (ParserHelper.backslash_span, "\\", ""),
+        (ParserHelper.text_span, "*", "*"),
+        (ParserHelper.noop_span, ParserHelper.replace_noop_character, ""),
+        (ParserHelper.text_span, " b", " b"),
+    ]
+
+    # Act
+    actual_spans = ParserHelper.split_into_spans(source_text)
+
+    # Assert
+    assert actual_spans == expected_spans
+    assert "".join(x[1] for x in actual_spans) == ParserHelper.remove_all_from_text(
+        source_text
+    )
+    assert "".join(x[2] for x in actual_spans) == ParserHelper.resolve_all_from_text(
+        source_text
+    )
+
+
+def test_markers_text_token_spans():
+    """
+    Test to make sure that a text token provides its resolved and original
+    text from its spans.
+    """
+
+    # Arrange
+    extension_manager = ExtensionManager()
+    extension_manager.initialize(None, ApplicationProperties())
+    extension_manager.apply_configuration()
+    tokenizer = TokenizedMarkdown()
+    tokenizer.apply_configuration(ApplicationProperties(), extension_manager)
+
+    # Act
+    text_token = tokenizer.transform("a &amp; \\* b\n")[1]
+
+    # Assert
+    assert text_token.is_text
+    assert text_token.resolved_text == "a &amp; * b"
+    assert text_token.original_text == "a &amp; \\* b"
+    assert text_token.text_spans[1] == (
+        ParserHelper.replacement_span,
+        "&amp;",
+        "&amp;",
+    )
@@ -2,6 +2,8 @@
 Module to provide tests related to the plugin manager for the scanner.
 """
 import os
+import shutil
+import tempfile
 from test.markdown_scanner import MarkdownScanner
 
 from .utils import write_temporary_configuration
@@ -106,6 +108,131 @@ MD998>>completed_file
     )
 
 
+def test_markdown_with_dash_dash_add_plugin_and_token_names():
+    """
+    Test to make sure that a plugin that asks for only some of the tokens only
+    has its next_token function called for those tokens.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "--add-plugin",
+        "test/resources/plugins/plugin_three.py",
+        "scan",
+        "test/resources/rules/md047/end_with_blank_line.md",
+    ]
+
+    expected_return_code = 0
+    expected_output = """MD996>>next_token:atx
+MD996>>next_token:end-atx
+"""
+    expected_error = ""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_dash_add_plugin_and_next_lines():
+    """
+    Test to make sure that a plugin that implements the next_lines function is
+    given all of the lines at once, instead of one at a time.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "--add-plugin",
+        "test/resources/plugins/plugin_four.py",
+        "scan",
+        "test/resources/rules/md047/end_with_blank_line.md",
+    ]
+
+    expected_return_code = 0
+    expected_output = """MD995>>next_lines:1:4
+"""
+    expected_error = ""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+__LINE_FAILURE_PLUGIN_SOURCE = """
+from pymarkdown.plugin_manager import Plugin, PluginDetails
+
+
+class PluginLineFailures(Plugin):
+    def get_details(self):
+        return PluginDetails(
+            plugin_name="line-failures",
+            plugin_id="MD993",
+            plugin_enabled_by_default=True,
+            plugin_description="Line failures plugin",
+            plugin_version="0.0.0",
+            plugin_interface_version=1,
+        )
+
+    def next_line(self, context, line):
+        if "x" in line:
+            self.report_next_line_error(context, 1)
+"""
+
+
+def test_markdown_with_dash_dash_add_plugin_and_next_lines_failure_order():
+    """
+    Test to make sure that the failures from a plugin that implements the
+    next_lines function are reported in line order along with the failures from
+    plugins that implement the next_line function.
+    """
+
+    # Arrange
+    temporary_directory = tempfile.mkdtemp()
+    plugin_path = os.path.join(temporary_directory, "plugin_line_failures.py")
+    with open(plugin_path, "w", encoding="utf-8") as plugin_file:
+        plugin_file.write(__LINE_FAILURE_PLUGIN_SOURCE)
+    scan_path = os.path.join(temporary_directory, "lines.md").replace("\\", "/")
+    with open(scan_path, "w", encoding="utf-8") as scan_file:
+        scan_file.write("x\tline\nx line\nx\tline\n")
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        scan_path,
+    ]
+
+    expected_return_code = 1
+    expected_output = (
+        f"{scan_path}:1:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)\n"
+        + f"{scan_path}:1:1: MD993: Line failures plugin (line-failures)\n"
+        + f"{scan_path}:2:1: MD993: Line failures plugin (line-failures)\n"
+        + f"{scan_path}:3:2: MD010: Hard tabs [Column: 2] (no-hard-tabs)\n"
+        + f"{scan_path}:3:1: MD993: Line failures plugin (line-failures)\n"
+    )
+    expected_error = ""
+
+    try:
+        # Act
+        execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+    finally:
+        shutil.rmtree(temporary_directory)
+
+
 def test_markdown_with_dash_dash_add_plugin_and_single_plugin_directory():
     """
     Test to make sure we get enable a rule if '--add-plugin' is supplied.
@@ -123,6 +250,9 @@ def test_markdown_with_dash_dash_add_plugin_and_single_plugin_directory():
     expected_return_code = 0
     expected_output = """MD998>>init_from_config
 MD998>>starting_new_file>>
+MD996>>next_token:atx
+MD996>>next_token:end-atx
+MD995>>next_lines:1:4
 MD998>>next_line:# This is a test
 MD998>>next_line:
 MD998>>next_line:The line after this line should be blank.
@@ -0,0 +1,167 @@
+"""
+Module to provide tests related to the plugin manifest.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+import pytest
+from application_properties import ApplicationProperties
+
+from pymarkdown.plugin_manager import BadPluginError, PluginManager
+from pymarkdown.plugin_manifest import PluginManifest
+
+__BROKEN_PLUGIN_SOURCE = """raise ValueError("this plugin should not be imported")
+"""
+
+
+def __create_plugin_directory(is_manifest_written=True, manifest_changes=None):
+    plugin_directory = tempfile.mkdtemp()
+    shutil.copy(
+        os.path.join(PluginManifest.default_plugin_directory(), "rule_md_047.py"),
+        os.path.join(plugin_directory, "rule_md_047.py"),
+    )
+    plugin_manifest = PluginManifest.create_manifest(plugin_directory)
+
+    with open(
+        os.path.join(plugin_directory, "rule_md_broken.py"), "w", encoding="utf-8"
+    ) as plugin_file:
+        plugin_file.write(__BROKEN_PLUGIN_SOURCE)
+    broken_entry = dict(plugin_manifest["rule_md_047.py"])
+    broken_entry.update(
+        {"id": "md998", "names": ["broken"], "enabled_by_default": False}
+    )
+    plugin_manifest["rule_md_broken.py"] = broken_entry
+    if manifest_changes:
+        plugin_manifest["rule_md_047.py"].update(manifest_changes)
+
+    if is_manifest_written:
+        with open(
+            os.path.join(plugin_directory, PluginManifest.manifest_file_name),
+            "w",
+            encoding="utf-8",
+        ) as manifest_file:
+            json.dump(plugin_manifest, manifest_file)
+    return plugin_directory
+
+
+def __initialize_plugin_manager(plugin_directory, enable_rules=None):
+    plugin_manager = PluginManager()
+    plugin_manager.initialize(
+        plugin_directory, None, enable_rules, None, ApplicationProperties(), False
+    )
+    return plugin_manager
+
+
+def test_plugin_manifest_matches_plugins():
+    """
+    Test to make sure that the manifest shipped with the built-in plugins
+    matches those plugins.  If this fails, regenerate the manifest with:
+
+    python -c "from pymarkdown.plugin_manifest import PluginManifest; PluginManifest.write_manifest()"
+    """
+
+    # Arrange
+    plugin_directory = PluginManifest.default_plugin_directory()
+    with open(
+        os.path.join(plugin_directory, PluginManifest.manifest_file_name),
+        encoding="utf-8",
+    ) as manifest_file:
+        expected_manifest = json.load(manifest_file)
+
+    # Act
+    actual_manifest = PluginManifest.create_manifest(plugin_directory)
+
+    # Assert
+    assert actual_manifest == expected_manifest
+
+
+def test_plugin_manifest_defers_loading_disabled_plugins():
+    """
+    Test to make sure that a plugin that is not enabled is never imported when
+    the directory has a manifest, even though it is still registered.
+    """
+
+    # Arrange
+    plugin_directory = __create_plugin_directory()
+
+    try:
+        # Act
+        plugin_manager = __initialize_plugin_manager(plugin_directory)
+
+        # Assert
+        assert sorted(plugin_manager.all_plugin_ids) == ["md047", "md998"]
+        assert [x.plugin_id for x in plugin_manager.enabled_plugins] == ["md047"]
+        assert plugin_manager.enabled_plugins[0].plugin_instance
+    finally:
+        shutil.rmtree(plugin_directory)
+
+
+def test_plugin_manifest_loads_enabled_plugins():
+    """
+    Test to make sure that a plugin that is enabled is imported, even when it
+    is not enabled by default in the manifest.
+    """
+
+    # Arrange
+    plugin_directory = __create_plugin_directory()
+
+    try:
+        # Act
+        with pytest.raises(BadPluginError) as raised_exception:
+            __initialize_plugin_manager(plugin_directory, enable_rules="md998")
+
+        # Assert
+        assert (
+            str(raised_exception.value)
+            == "Plugin file named 'rule_md_broken.py' cannot be loaded."
+        )
+    finally:
+        shutil.rmtree(plugin_directory)
+
+
+def test_plugin_manifest_out_of_date_entry():
+    """
+    Test to make sure that a plugin whose details do not match its entry in the
+    manifest is reported once it is loaded.
+    """
+
+    # Arrange
+    plugin_directory = __create_plugin_directory(manifest_changes={"version": "9.9.9"})
+
+    try:
+        # Act
+        with pytest.raises(BadPluginError) as raised_exception:
+            __initialize_plugin_manager(plugin_directory)
+
+        # Assert
+        assert (
+            str(raised_exception.value)
+            == "Plugin 'rule_md_047.py' does not match its entry in the plugin manifest."
+        )
+    finally:
+        shutil.rmtree(plugin_directory)
+
+
+def test_plugin_manifest_missing():
+    """
+    Test to make sure that without a manifest, every plugin in the directory is
+    loaded, as before.
+    """
+
+    # Arrange
+    plugin_directory = __create_plugin_directory(is_manifest_written=False)
+
+    try:
+        # Act
+        with pytest.raises(BadPluginError) as raised_exception:
+            __initialize_plugin_manager(plugin_directory)
+
+        # Assert
+        assert (
+            str(raised_exception.value)
+            == "Plugin file named 'rule_md_broken.py' cannot be loaded."
+        )
+    finally:
+        shutil.rmtree(plugin_directory)
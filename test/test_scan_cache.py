@@ -0,0 +1,411 @@
+"""
+Module to provide tests related to the "--cache-dir" option.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from test.markdown_scanner import MarkdownScanner
+
+from pymarkdown.scan_cache import ScanCache
+
+__MD047_DIRECTORY = "test/resources/rules/md047"
+
+
+def __create_scan_directory():
+    scan_directory = tempfile.mkdtemp()
+    for next_file_name in os.listdir(__MD047_DIRECTORY):
+        shutil.copy(os.path.join(__MD047_DIRECTORY, next_file_name), scan_directory)
+    return scan_directory.replace("\\", "/")
+
+
+def __read_cache_entries(cache_directory):
+    cache_entries = {}
+    for next_entry_name in os.listdir(cache_directory):
+        with open(
+            os.path.join(cache_directory, next_entry_name), encoding="utf-8"
+        ) as entry_file:
+            next_entry = json.load(entry_file)
+        cache_entries[next_entry["file"]] = (next_entry_name, next_entry)
+    return cache_entries
+
+
+def __tamper_with_cache_entry(cache_directory, entry_name, new_output):
+    entry_path = os.path.join(cache_directory, entry_name)
+    with open(entry_path, encoding="utf-8") as entry_file:
+        cache_entry = json.load(entry_file)
+    cache_entry["output"] = new_output
+    with open(entry_path, "w", encoding="utf-8") as entry_file:
+        json.dump(cache_entry, entry_file)
+
+
+def test_markdown_with_cache_dir_populates_cache():
+    """
+    Test to make sure that scanning with a cache directory stores one entry for
+    each file that was scanned, with the output reported for that file.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    supplied_arguments = ["scan", "--cache-dir", cache_directory, scan_directory]
+
+    expected_return_code = 1
+    expected_output = (
+        f"{scan_directory}/end_with_no_blank_line.md:3:41: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+        + f"{scan_directory}/end_with_no_blank_line_and_spaces.md:4:2: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+    )
+    expected_error = ""
+
+    try:
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+        cache_entries = __read_cache_entries(cache_directory)
+        assert len(cache_entries) == 4
+        _, cache_entry = cache_entries[f"{scan_directory}/end_with_no_blank_line.md"]
+        assert cache_entry["scan_failures"] == 1
+        assert cache_entry["output"] == expected_output.split("\n")[0] + "\n"
+        _, cache_entry = cache_entries[f"{scan_directory}/end_with_blank_line.md"]
+        assert cache_entry["scan_failures"] == 0
+        assert not cache_entry["output"]
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+def test_markdown_with_cache_dir_replays_unchanged_files():
+    """
+    Test to make sure that an unchanged file has its results replayed from the
+    cache instead of being scanned again.  To prove that the file was not scanned,
+    the output stored in the cache is altered before the second scan.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    scan_file = f"{scan_directory}/end_with_no_blank_line.md"
+    supplied_arguments = ["scan", "--cache-dir", cache_directory, scan_file]
+
+    expected_return_code = 1
+    expected_output = "from the cache\n"
+    expected_error = ""
+
+    try:
+        MarkdownScanner().invoke_main(arguments=supplied_arguments)
+        entry_name, _ = __read_cache_entries(cache_directory)[scan_file]
+        __tamper_with_cache_entry(cache_directory, entry_name, expected_output)
+
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+def test_markdown_with_cache_dir_and_changed_file():
+    """
+    Test to make sure that a file whose content has changed since it was cached
+    is scanned again.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    scan_file = f"{scan_directory}/end_with_no_blank_line.md"
+    supplied_arguments = ["scan", "--cache-dir", cache_directory, scan_file]
+
+    expected_return_code = 0
+    expected_output = ""
+    expected_error = ""
+
+    try:
+        MarkdownScanner().invoke_main(arguments=supplied_arguments)
+        entry_name, _ = __read_cache_entries(cache_directory)[scan_file]
+        __tamper_with_cache_entry(cache_directory, entry_name, "from the cache\n")
+        with open(scan_file, "a", encoding="utf-8") as file_to_change:
+            file_to_change.write("\n")
+
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+def test_markdown_with_cache_dir_and_changed_configuration():
+    """
+    Test to make sure that a change in the enabled rules invalidates any results
+    that were cached with the previous configuration.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    scan_file = f"{scan_directory}/end_with_no_blank_line.md"
+    first_arguments = ["scan", "--cache-dir", cache_directory, scan_file]
+    supplied_arguments = [
+        "-d",
+        "md047",
+        "scan",
+        "--cache-dir",
+        cache_directory,
+        scan_file,
+    ]
+
+    expected_return_code = 0
+    expected_output = ""
+    expected_error = ""
+
+    try:
+        MarkdownScanner().invoke_main(arguments=first_arguments)
+
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+__CACHED_PLUGIN_SOURCE = """
+from pymarkdown.plugin_manager import Plugin, PluginDetails
+
+
+class PluginCachedScan(Plugin):
+    def get_details(self):
+        return PluginDetails(
+            plugin_name="cached-scan",
+            plugin_id="MD994",
+            plugin_enabled_by_default=True,
+            plugin_description="Cached scan plugin",
+            plugin_version="0.0.0",
+            plugin_interface_version=1,
+        )
+
+    def completed_file(self, context):
+        self.report_next_line_error(context, 1)
+"""
+
+
+def test_markdown_with_cache_dir_and_changed_added_plugin():
+    """
+    Test to make sure that editing a plugin that was added with --add-plugin,
+    without changing its version, invalidates any results that were cached with
+    the previous version of that plugin.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    plugin_directory = tempfile.mkdtemp()
+    plugin_path = os.path.join(plugin_directory, "plugin_cached_scan.py")
+    with open(plugin_path, "w", encoding="utf-8") as plugin_file:
+        plugin_file.write(__CACHED_PLUGIN_SOURCE)
+    scan_file = f"{scan_directory}/end_with_blank_line.md"
+    supplied_arguments = [
+        "--add-plugin",
+        plugin_path,
+        "scan",
+        "--cache-dir",
+        cache_directory,
+        scan_file,
+    ]
+
+    try:
+        MarkdownScanner().invoke_main(arguments=supplied_arguments)
+        _, first_entry = __read_cache_entries(cache_directory)[scan_file]
+        with open(plugin_path, "a", encoding="utf-8") as plugin_file:
+            plugin_file.write("# edited\n")
+
+        # Act
+        MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        _, second_entry = __read_cache_entries(cache_directory)[scan_file]
+        assert first_entry["scan_failures"] == 1
+        assert second_entry["scan_failures"] == 1
+        assert first_entry["fingerprint"] != second_entry["fingerprint"]
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+        shutil.rmtree(plugin_directory)
+
+
+def test_markdown_with_cache_dir_and_dash_j():
+    """
+    Test to make sure that the cache is used by the worker processes when scanning
+    with more than one job.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    supplied_arguments = [
+        "scan",
+        "-j",
+        "2",
+        "--cache-dir",
+        cache_directory,
+        scan_directory,
+    ]
+
+    expected_return_code = 1
+    expected_output = (
+        f"{scan_directory}/end_with_no_blank_line.md:3:41: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+        + "from the cache\n"
+    )
+    expected_error = ""
+
+    try:
+        MarkdownScanner().invoke_main(arguments=supplied_arguments)
+        entry_name, _ = __read_cache_entries(cache_directory)[
+            f"{scan_directory}/end_with_no_blank_line_and_spaces.md"
+        ]
+        __tamper_with_cache_entry(cache_directory, entry_name, "from the cache\n")
+
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+def test_markdown_with_cache_dir_and_dash_x_scan():
+    """
+    Test to make sure that an exception thrown while scanning a file with the
+    cache enabled is reported in the same manner as without the cache.
+    """
+
+    # Arrange
+    scan_directory = __create_scan_directory()
+    cache_directory = tempfile.mkdtemp()
+    supplied_arguments = [
+        "-x-scan",
+        "scan",
+        "--cache-dir",
+        cache_directory,
+        scan_directory,
+    ]
+
+    expected_return_code = 1
+    expected_output = ""
+    expected_error = f"""BadTokenizationError encountered while scanning '{scan_directory}/empty.md':
+An unhandled error occurred processing the document.
+"""
+
+    try:
+        # Act
+        execute_results = MarkdownScanner().invoke_main(arguments=supplied_arguments)
+
+        # Assert
+        execute_results.assert_results(
+            expected_output, expected_error, expected_return_code
+        )
+        assert not os.listdir(cache_directory)
+    finally:
+        shutil.rmtree(scan_directory)
+        shutil.rmtree(cache_directory)
+
+
+def test_scan_cache_evicts_least_recently_used_entries():
+    """
+    Test to make sure that the cache removes the least recently used entries
+    once it holds more than its maximum number of entries.
+    """
+
+    # Arrange
+    cache_directory = tempfile.mkdtemp()
+    scan_cache = ScanCache(cache_directory, "fingerprint", 2)
+    for next_file in ["a.md", "b.md", "c.md"]:
+        scan_cache.save_results(next_file, "hash", "", 0, 0)
+    for next_entry_name, next_entry in __read_cache_entries(cache_directory).values():
+        entry_time = 1000 + ["a.md", "b.md", "c.md"].index(next_entry["file"])
+        os.utime(
+            os.path.join(cache_directory, next_entry_name), (entry_time, entry_time)
+        )
+
+    try:
+        # Act
+        assert scan_cache.load_results("a.md", "hash")
+        number_evicted = scan_cache.evict_entries()
+
+        # Assert
+        assert number_evicted == 1
+        assert scan_cache.load_results("a.md", "hash")
+        assert not scan_cache.load_results("b.md", "hash")
+        assert scan_cache.load_results("c.md", "hash")
+    finally:
+        shutil.rmtree(cache_directory)
+
+
+def test_scan_cache_stale_fingerprint():
+    """
+    Test to make sure that an entry saved with one configuration fingerprint is
+    not returned for a different configuration fingerprint.
+    """
+
+    # Arrange
+    cache_directory = tempfile.mkdtemp()
+    ScanCache(cache_directory, "first", 10).save_results("a.md", "hash", "", 0, 0)
+
+    try:
+        # Act
+        scan_results = ScanCache(cache_directory, "second", 10).load_results(
+            "a.md", "hash"
+        )
+
+        # Assert
+        assert scan_results is None
+    finally:
+        shutil.rmtree(cache_directory)
+
+
+def test_scan_cache_save_failure_removes_temporary_file():
+    """
+    Test to make sure that a temporary file is not left in the cache directory
+    if the entry cannot be moved into place.  A directory is placed where the
+    entry would go, so that replacing it fails.
+    """
+
+    # Arrange
+    cache_directory = tempfile.mkdtemp()
+    scan_cache = ScanCache(cache_directory, "fingerprint", 10)
+    entry_name = hashlib.sha256("a.md".encode("utf-8")).hexdigest() + ".json"
+    os.mkdir(os.path.join(cache_directory, entry_name))
+
+    try:
+        # Act
+        scan_cache.save_results("a.md", "hash", "", 0, 0)
+
+        # Assert
+        assert os.listdir(cache_directory) == [entry_name]
+    finally:
+        shutil.rmtree(cache_directory)
@@ -0,0 +1,133 @@
+"""
+Module to provide tests related to the "-j" option.
+"""
+from test.markdown_scanner import MarkdownScanner
+
+
+def test_markdown_with_dash_j_multiple_files():
+    """
+    Test to make sure that scanning with more than one job reports the
+    failures in the same sorted order as a serial scan.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "scan",
+        "-j",
+        "2",
+        "test/resources/rules/md047",
+    ]
+
+    expected_return_code = 1
+    expected_output = (
+        "test/resources/rules/md047/end_with_no_blank_line.md:3:41: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+        + "test/resources/rules/md047/end_with_no_blank_line_and_spaces.md:4:2: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+    )
+    expected_error = ""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_j_matches_serial_scan():
+    """
+    Test to make sure that scanning a larger set of files with multiple jobs
+    produces exactly the same output as scanning them with a single job.
+    """
+
+    # Arrange
+    serial_arguments = [
+        "scan",
+        "-r",
+        "test/resources/rules",
+    ]
+    parallel_arguments = [
+        "scan",
+        "--jobs",
+        "3",
+        "-r",
+        "test/resources/rules",
+    ]
+
+    # Act
+    serial_results = MarkdownScanner().invoke_main(arguments=serial_arguments)
+    parallel_results = MarkdownScanner().invoke_main(arguments=parallel_arguments)
+
+    # Assert
+    assert serial_results.std_out.getvalue()
+    parallel_results.assert_results(
+        serial_results.std_out.getvalue(),
+        serial_results.std_err.getvalue(),
+        serial_results.return_code,
+    )
+
+
+def test_markdown_with_dash_j_and_dash_x_scan():
+    """
+    Test to make sure that an exception thrown within a worker process is
+    reported in the same manner as when scanning with a single job.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "-x-scan",
+        "scan",
+        "-j",
+        "2",
+        "test/resources/rules/md047",
+    ]
+
+    expected_return_code = 1
+    expected_output = ""
+    expected_error = """BadTokenizationError encountered while scanning 'test/resources/rules/md047/empty.md':
+An unhandled error occurred processing the document.
+"""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_j_bad_value():
+    """
+    Test to make sure that a number of jobs that is not a positive integer
+    is reported as an error.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    supplied_arguments = [
+        "scan",
+        "-j",
+        "0",
+        "test/resources/rules/md047",
+    ]
+
+    expected_return_code = 2
+    expected_output = ""
+    expected_error = """usage: main.py scan [-h] [-l] [-r] [-j JOBS] [--cache-dir CACHE_DIRECTORY]
+                    [--cache-max-entries CACHE_MAX_ENTRIES]
+                    path [path ...]
+main.py scan: error: argument -j/--jobs: Value '0' is not a valid number of jobs.
+"""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
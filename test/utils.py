@@ -17,6 +17,22 @@ from pymarkdown.tokenized_markdown import TokenizedMarkdown
 from pymarkdown.transform_to_gfm import TransformToGfm
 
 
+def create_tokenizer(config_map=None):
+    """
+    Create a tokenizer with the extensions configured from the config_map.
+    """
+
+    tokenizer = TokenizedMarkdown()
+    test_properties = ApplicationProperties()
+    if config_map:
+        test_properties.load_from_dict(config_map)
+    extension_manager = ExtensionManager()
+    extension_manager.initialize(None, test_properties)
+    extension_manager.apply_configuration()
+    tokenizer.apply_configuration(test_properties, extension_manager)
+    return tokenizer
+
+
 # pylint: disable=too-many-arguments
 def act_and_assert(
     source_markdown,
@@ -34,14 +50,7 @@ def act_and_assert(
     logging.getLogger().setLevel(logging.DEBUG if show_debug else logging.WARNING)
     ParserLogger.sync_on_next_call()
 
-    tokenizer = TokenizedMarkdown()
-    test_properties = ApplicationProperties()
-    if config_map:
-        test_properties.load_from_dict(config_map)
-    extension_manager = ExtensionManager()
-    extension_manager.initialize(None, test_properties)
-    extension_manager.apply_configuration()
-    tokenizer.apply_configuration(test_properties, extension_manager)
+    tokenizer = create_tokenizer(config_map)
     transformer = TransformToGfm()
 
     # Act